@@ -0,0 +1,61 @@
+"""Benchmark serial vs. thread-pool exports on a synthetic icon pack.
+
+Usage: ``PYTHONPATH=src python benchmarks/bench_export.py [--icons 10000] [--jobs 8]``
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from stromschlag.core.exporters import ExportTimings, export_icon_pack
+from stromschlag.core.models import IconDefinition, PackSettings
+
+
+def _make_sources(directory: Path, count: int) -> list[IconDefinition]:
+    directory.mkdir(parents=True)
+    payload = os.urandom(4096)
+    icons = []
+    for index in range(count):
+        source = directory / f"icon-{index:05d}.png"
+        source.write_bytes(payload)
+        icons.append(IconDefinition(name=f"icon-{index:05d}", source_path=source))
+    return icons
+
+
+def _timed_export(root: Path, icons: list[IconDefinition], jobs: int) -> tuple[float, ExportTimings]:
+    settings = PackSettings(name="Bench Pack", author="Bench", output_dir=root)
+    start = time.perf_counter()
+    result = export_icon_pack(settings, icons, jobs=jobs)
+    return time.perf_counter() - start, result.timings
+
+
+def _phases(timings: ExportTimings) -> str:
+    return (
+        f"(prepare {timings.prepare:.2f}s, copy {timings.copy:.2f}s, "
+        f"render {timings.render:.2f}s, descriptors {timings.descriptors:.2f}s)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--icons", type=int, default=10_000)
+    parser.add_argument("--jobs", type=int, default=min(32, (os.cpu_count() or 1) + 4))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="stromschlag-bench-") as temp:
+        root = Path(temp)
+        icons = _make_sources(root / "sources", args.icons)
+        serial, serial_phases = _timed_export(root / "serial", icons, jobs=1)
+        parallel, parallel_phases = _timed_export(root / "parallel", icons, jobs=args.jobs)
+
+    print(f"icons:          {args.icons}")
+    print(f"serial:         {serial:.2f}s  {_phases(serial_phases)}")
+    print(f"jobs={args.jobs:<3}        {parallel:.2f}s  {_phases(parallel_phases)}")
+    print(f"speedup:        {serial / parallel:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark project loading and saving: pure-Python YAML, libyaml, streaming and the binary sidecar.
+
+Usage: ``PYTHONPATH=src python benchmarks/bench_project_io.py [--icons 20000]``
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+from stromschlag.core import project_binary, project_io
+from stromschlag.core.models import IconDefinition, PackSettings
+
+_CATEGORIES = ["actions", "apps", "devices", "places", "status"]
+
+
+def _make_icons(count: int) -> list[IconDefinition]:
+    return [
+        IconDefinition(
+            name=f"icon-{index:05d}",
+            source_path=Path(f"/home/user/artwork/{_CATEGORIES[index % 5]}/icon-{index:05d}.svg"),
+            category=_CATEGORIES[index % 5],
+        )
+        for index in range(count)
+    ]
+
+
+def _timed(path: Path, settings: PackSettings, icons: list[IconDefinition]) -> tuple[float, float]:
+    start = time.perf_counter()
+    project_io.save_project(path, settings, icons)
+    saved = time.perf_counter() - start
+    start = time.perf_counter()
+    project_io.load_project(path)
+    return saved, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--icons", type=int, default=20_000)
+    args = parser.parse_args()
+
+    settings = PackSettings(name="Bench Pack", author="Bench")
+    icons = _make_icons(args.icons)
+    print(f"icons: {args.icons}")
+    with tempfile.TemporaryDirectory(prefix="stromschlag-bench-") as temp:
+        path = Path(temp) / "stromschlag.yaml"
+        backends = [("pure python", yaml.SafeLoader, yaml.SafeDumper)]
+        if yaml.__with_libyaml__:
+            backends.append(("libyaml", yaml.CSafeLoader, yaml.CSafeDumper))
+        else:
+            print("libyaml is not available; only the fallback is measured")
+        for label, loader, dumper in backends:
+            project_io._SafeLoader, project_io._SafeDumper = loader, dumper
+            # Time the YAML paths alone, without the sidecar.
+            project_io.BINARY_THRESHOLD = args.icons + 1
+            saved, loaded = _timed(path, settings, icons)
+            print(f"{label:<12} save {saved:6.2f}s   load {loaded:6.2f}s")
+
+        project_binary.remove_sidecar(path)
+        start = time.perf_counter()
+        with project_io.open_project_stream(path) as stream:
+            first = None
+            for _batch in stream:
+                if first is None:
+                    first = time.perf_counter() - start
+        print(f"{'stream':<12} first batch {(first or 0) * 1000:.0f} ms, all {time.perf_counter() - start:6.2f}s")
+
+        project_io.BINARY_THRESHOLD = project_binary.BINARY_THRESHOLD
+        if args.icons < project_io.BINARY_THRESHOLD:
+            print(f"sidecar      not written below {project_io.BINARY_THRESHOLD} icons")
+            return
+        saved, loaded = _timed(path, settings, icons)
+        size = project_binary.sidecar_path(path).stat().st_size
+        print(f"{'sidecar':<12} save {saved:6.2f}s   load {loaded:6.2f}s   ({size / 1024:.0f} KiB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Benchmark the fuzzy icon search on a synthetic icon list.
+
+Usage: ``PYTHONPATH=src python benchmarks/bench_search.py [--icons 50000]``
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from stromschlag.core.search import FuzzyMatcher
+
+_WORDS = [
+    "applications", "audio", "battery", "document", "edit", "folder", "firefox", "media",
+    "network", "playback", "preferences", "system", "view", "volume", "wireless",
+]
+_CATEGORIES = ["actions", "apps", "devices", "places", "status"]
+_QUERIES = ["n", "ne", "net", "netw", "nwl", "fo", "fold", "prefsys", "zq"]
+
+
+def _make_entries(count: int) -> list[tuple[str, str, str]]:
+    rng = random.Random(0)
+    return [
+        (
+            "-".join(rng.sample(_WORDS, 3)) + str(index),
+            rng.choice(_CATEGORIES),
+            f"{rng.choice(_WORDS)}-{index}",
+        )
+        for index in range(count)
+    ]
+
+
+def _timed(label: str, action) -> None:
+    start = time.perf_counter()
+    result = action()
+    elapsed = (time.perf_counter() - start) * 1000
+    count = "" if result is None else f"{len(result):>7} matches"
+    print(f"{label:<24} {elapsed:8.1f} ms {count}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--icons", type=int, default=50_000)
+    args = parser.parse_args()
+
+    entries = _make_entries(args.icons)
+    print(f"icons: {args.icons}")
+
+    fuzzy = FuzzyMatcher()
+    _timed("fuzzy build", lambda: fuzzy.rebuild(entries))
+    for query in _QUERIES:
+        # Queries are typed in sequence, so later ones narrow earlier results.
+        _timed(f"fuzzy {query!r}", lambda: fuzzy.search(query))
+
+    # Edits while a query is active: rename, remove and append one icon each.
+    _timed("fuzzy update", lambda: fuzzy.update(0, ("network-renamed", "apps", "")))
+    _timed("fuzzy remove", lambda: fuzzy.remove(1))
+    _timed("fuzzy extend", lambda: fuzzy.extend([("network-new", "apps", "")]))
+    _timed("fuzzy 'zq' after edits", lambda: fuzzy.search("zq"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark importing a folder of icon artwork: recursive glob vs. the scandir scanner.
+
+Usage: ``PYTHONPATH=src python benchmarks/bench_source_scan.py [--files 60000] [--workers 8]``
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from stromschlag.core.source_scanner import scan_icon_sources
+
+_SIZES = ["16x16", "22x22", "24x24", "32x32", "48x48", "64x64", "256x256", "scalable"]
+_CATEGORIES = ["actions", "apps", "devices", "mimetypes", "places", "status"]
+
+
+def _make_tree(root: Path, count: int) -> None:
+    per_directory = max(1, count // (len(_SIZES) * len(_CATEGORIES)))
+    written = 0
+    for size in _SIZES:
+        suffix = ".svg" if size == "scalable" else ".png"
+        for category in _CATEGORIES:
+            directory = root / size / category
+            directory.mkdir(parents=True)
+            for index in range(per_directory):
+                (directory / f"{category}-{index:05d}{suffix}").touch()
+                written += 1
+                if written >= count:
+                    return
+
+
+def _glob_scan(directory: Path) -> list[tuple[str, Path, str | None]]:
+    """The import scan as it was done before ``scan_icon_sources``."""
+
+    winners: dict[str, tuple[int, Path, str | None]] = {}
+    for file_path in sorted(directory.rglob("*")):
+        if not file_path.is_file():
+            continue
+        suffix = file_path.suffix.lower()
+        if suffix not in {".png", ".svg", ".svgz"}:
+            continue
+        parts = {part.lower() for part in file_path.parts}
+        weight = (suffix not in {".svg", ".svgz"}) + 2 * ("scalable" not in parts)
+        weight += "apps" not in parts and "mimetypes" not in parts
+        existing = winners.get(file_path.stem)
+        if existing and existing[0] <= weight:
+            continue
+        category = file_path.parent.name if file_path.parent != directory else None
+        winners[file_path.stem] = (weight, file_path, category)
+    return [(name, data[1], data[2]) for name, data in sorted(winners.items())]
+
+
+def _timed(label: str, action) -> list:
+    start = time.perf_counter()
+    result = action()
+    print(f"{label:<20} {time.perf_counter() - start:6.2f}s  {len(result)} icons")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=60_000)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="stromschlag-bench-") as temp:
+        root = Path(temp) / "theme"
+        _make_tree(root, args.files)
+        print(f"files: {args.files}")
+        baseline = _timed("rglob + sort", lambda: _glob_scan(root))
+        _timed("scandir, 1 thread", lambda: scan_icon_sources(root, workers=1))
+        scanned = _timed("scandir, threads", lambda: scan_icon_sources(root, workers=args.workers))
+        assert scanned == baseline, "scanner disagrees with the glob scan"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Measure GUI time-to-first-paint and check it against a budget.
+
+Starts a fresh interpreter under ``-X importtime``, creates the main window
+and stops at its first paint event. Fails (exit status 1) when the wall-clock
+time exceeds ``--budget-ms`` or when a module that should be deferred was
+imported before the window appeared.
+
+Usage: ``PYTHONPATH=src python benchmarks/bench_startup.py [--budget-ms 1000] [--runs 5]``
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+_CHILD = r"""
+import sys
+from PySide6.QtCore import QEvent, QObject, QTimer
+from PySide6.QtWidgets import QApplication
+from stromschlag.gui.main_window import _PRELOADED_MODULES, MainWindow
+
+class FirstPaint(QObject):
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Type.Paint:
+            early = [name for name in _PRELOADED_MODULES if name in sys.modules]
+            print("PAINTED", ",".join(early), flush=True)
+            app.quit()
+        return False
+
+app = QApplication([])
+window = MainWindow()
+spy = FirstPaint()
+window.installEventFilter(spy)
+window.show()
+QTimer.singleShot(10000, app.quit)
+app.exec()
+"""
+
+
+def _run_once(env: dict[str, str]) -> tuple[float, list[str], dict[str, int]]:
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed = (time.perf_counter() - start) * 1000
+    painted = [line for line in completed.stdout.splitlines() if line.startswith("PAINTED")]
+    if not painted:
+        raise RuntimeError(f"window never painted:\n{completed.stderr[-2000:]}")
+    early = [name for name in painted[0].split(" ", 1)[1].split(",") if name] if " " in painted[0] else []
+    return elapsed, early, _import_times(completed.stderr)
+
+
+def _import_times(stderr: str) -> dict[str, int]:
+    """Map module name to cumulative import time (µs) from ``-X importtime`` output."""
+
+    times: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        times[name] = int(cumulative)
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=1000.0)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="number of slowest imports to list")
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    if not env.get("DISPLAY") and not env.get("WAYLAND_DISPLAY"):
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    results = [_run_once(env) for _ in range(args.runs)]
+    best, early, imports = min(results, key=lambda result: result[0])
+
+    print(f"first paint (best of {args.runs}): {best:.0f} ms  (budget {args.budget_ms:.0f} ms)")
+    print(f"stromschlag.gui.main_window import: {imports.get('stromschlag.gui.main_window', 0) / 1000:.1f} ms")
+    print("slowest top-level imports:")
+    top_level = {name: value for name, value in imports.items() if not name.startswith(" ")}
+    for name, value in sorted(top_level.items(), key=lambda item: -item[1])[: args.top]:
+        print(f"  {value / 1000:8.1f} ms  {name}")
+
+    failed = False
+    if early:
+        print(f"FAIL: deferred modules imported before first paint: {', '.join(early)}")
+        failed = True
+    if best > args.budget_ms:
+        print("FAIL: time to first paint is over budget")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
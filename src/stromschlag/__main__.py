@@ -1,6 +1,8 @@
 """Enable `python -m stromschlag`."""
-from .app import main
+import sys
+
+from .cli import main
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -1,15 +1,23 @@
 """Application entry point for Stromschlag."""
 from __future__ import annotations
 
-from PySide6.QtWidgets import QApplication
-
-from .gui.main_window import MainWindow
+import threading
 
 
 def main() -> None:
+    # Imported here so the command-line tools never load Qt.
+    from PySide6.QtCore import QTimer
+    from PySide6.QtWidgets import QApplication
+
+    from .gui.main_window import MainWindow, preload_modules
+
     app = QApplication.instance() or QApplication([])
     window = MainWindow()
     window.show()
+    # Warm up the deferred modules once the event loop has shown the window.
+    QTimer.singleShot(
+        0, lambda: threading.Thread(target=preload_modules, name="stromschlag-preload", daemon=True).start()
+    )
     app.exec()
 
 
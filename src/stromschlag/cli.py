@@ -0,0 +1,210 @@
+"""Command-line interface for Stromschlag.
+
+Without a subcommand the GUI is started. ``stromschlag export`` builds a
+pack from a ``stromschlag.yaml`` and ``stromschlag batch`` builds many at
+once; neither imports Qt (unless ``--render`` needs it), so they run on
+headless build machines.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Sequence
+
+from . import __version__
+
+if TYPE_CHECKING:
+    from .core.batch import ExportOptions
+
+# Mirrors stromschlag.core.exporters.LINK_MODES; importing the exporter (and
+# YAML with it) just to build the parser would slow down ``--help``.
+_LINK_MODES = ("copy", "hardlink", "reflink", "symlink")
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    arguments = sys.argv[1:] if argv is None else list(argv)
+    if not arguments:
+        return _run_gui()
+    args = _build_parser().parse_args(arguments)
+    if args.command is None:
+        return _run_gui()
+    return args.handler(args)
+
+
+def _run_gui() -> int:
+    from .app import main as run_gui
+
+    run_gui()
+    return 0
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="stromschlag",
+        description="Craft KDE Plasma and GNOME icon packs. Starts the GUI when no command is given.",
+    )
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    commands = parser.add_subparsers(dest="command", metavar="command")
+
+    export = commands.add_parser(
+        "export",
+        help="export a project into icon theme directories",
+        description="Export a stromschlag.yaml project into icon theme directories.",
+    )
+    export.add_argument("project", type=Path, help="stromschlag.yaml file or the directory containing it")
+    _add_export_arguments(export)
+    export.add_argument("--install", action="store_true", help="install the exported themes afterwards")
+    export.add_argument(
+        "--install-root",
+        dest="install_roots",
+        action="append",
+        type=Path,
+        metavar="DIR",
+        help="icon directory to install into; repeat for several (implies --install)",
+    )
+    export.set_defaults(handler=_run_export)
+
+    batch = commands.add_parser(
+        "batch",
+        help="export many projects in one run",
+        description="Export every matching project, sharing source digests and renders between them.",
+    )
+    batch.add_argument(
+        "projects",
+        nargs="+",
+        metavar="PROJECT",
+        help="stromschlag.yaml files, directories or glob patterns such as 'packs/**/stromschlag.yaml'",
+    )
+    _add_export_arguments(batch)
+    batch.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="projects exported in parallel processes (default: %(default)s)",
+    )
+    batch.set_defaults(handler=_run_batch, jobs=1)
+    return parser
+
+
+def _add_export_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        help="output directory (default: the project's output_dir, relative to the project file)",
+    )
+    parser.add_argument(
+        "-t",
+        "--target",
+        dest="targets",
+        action="append",
+        metavar="DESKTOP",
+        help="desktop target such as gnome or kde; repeat for several (default: the project's targets)",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=_parse_sizes,
+        help="comma-separated icon sizes, e.g. 16,32,48 (default: the project's base_sizes)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="parallel copy/render workers (default: %(default)s)",
+    )
+    parser.add_argument("--link-mode", choices=_LINK_MODES, default="copy", help="how duplicate outputs are written")
+    parser.add_argument("--incremental", action="store_true", help="only rewrite outputs whose sources changed")
+    parser.add_argument("--render", action="store_true", help="rasterize every size (requires PySide6)")
+
+
+def _parse_sizes(value: str) -> List[int]:
+    try:
+        sizes = [int(part) for part in value.replace(" ", "").split(",") if part]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size list: {value!r}") from None
+    if not sizes or any(size <= 0 for size in sizes):
+        raise argparse.ArgumentTypeError(f"invalid size list: {value!r}")
+    return sizes
+
+
+def _run_export(args: argparse.Namespace) -> int:
+    import yaml
+
+    from .core.batch import PROJECT_FILENAME, export_with_options, load_for_export
+    from .core.exporters import install_icon_pack
+
+    if args.jobs < 1:
+        return _fail("--jobs must be at least 1")
+    options = _export_options(args)
+    project_file = args.project / PROJECT_FILENAME if args.project.is_dir() else args.project
+    try:
+        settings, icons = load_for_export(project_file, options)
+    except (OSError, ValueError, yaml.YAMLError) as exc:
+        return _fail(f"cannot load {project_file}: {exc}")
+
+    try:
+        result = export_with_options(settings, icons, options)
+    except (OSError, RuntimeError, ValueError) as exc:
+        return _fail(f"export failed: {exc}")
+
+    print(
+        f"Exported '{result.theme_name}' to {result.pack_root}: "
+        f"{result.copied} copied, {result.rendered} rendered, "
+        f"{result.skipped} unchanged, {result.removed} removed"
+    )
+
+    if not (args.install or args.install_roots):
+        return 0
+    installed, failures = install_icon_pack(result, args.install_roots)
+    for path in installed:
+        print(f"Installed {path}")
+    for path, message in failures:
+        print(f"stromschlag: cannot install {path}: {message}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+def _run_batch(args: argparse.Namespace) -> int:
+    from .core.batch import build_projects, expand_project_paths
+
+    if args.jobs < 1 or args.workers < 1:
+        return _fail("--jobs and --workers must be at least 1")
+    projects = expand_project_paths(args.projects)
+    if not projects:
+        return _fail("no projects matched")
+
+    summary = build_projects(projects, _export_options(args), workers=args.workers)
+    for outcome in summary.outcomes:
+        if outcome.result is not None:
+            print(f"ok    {outcome.seconds:7.2f}s  {outcome.project} -> {outcome.result.pack_root}")
+        else:
+            print(f"FAIL  {outcome.seconds:7.2f}s  {outcome.project}: {outcome.error}")
+    failed = len(summary.failures)
+    print(f"{len(summary.outcomes)} projects, {failed} failed, {summary.seconds:.2f}s total")
+    return 1 if failed else 0
+
+
+def _export_options(args: argparse.Namespace) -> ExportOptions:
+    from .core.batch import ExportOptions
+
+    return ExportOptions(
+        output_dir=args.output,
+        targets=args.targets,
+        sizes=args.sizes,
+        jobs=args.jobs,
+        link_mode=args.link_mode,
+        incremental=args.incremental,
+        render=args.render,
+    )
+
+
+def _fail(message: str) -> int:
+    print(f"stromschlag: error: {message}", file=sys.stderr)
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
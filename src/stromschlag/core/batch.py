@@ -0,0 +1,219 @@
+"""Export many projects in one run, sharing caches between them."""
+from __future__ import annotations
+
+import glob
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from .exporters import ExportResult, export_icon_pack
+from .models import IconDefinition, PackSettings
+from .project_io import PROJECT_FILENAME, load_project, open_project_stream
+from .render_cache import RenderCache
+
+
+@dataclass(slots=True)
+class ExportOptions:
+    """Overrides and exporter settings applied to every project of a run."""
+
+    output_dir: Path | None = None
+    targets: List[str] | None = None
+    sizes: List[int] | None = None
+    jobs: int = 1
+    link_mode: str = "copy"
+    incremental: bool = False
+    render: bool = False
+
+
+@dataclass(slots=True)
+class ProjectOutcome:
+    project: Path
+    seconds: float
+    result: ExportResult | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass(slots=True)
+class BatchSummary:
+    outcomes: List[ProjectOutcome] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def failures(self) -> List[ProjectOutcome]:
+        return [outcome for outcome in self.outcomes if not outcome.ok]
+
+
+def expand_project_paths(patterns: Iterable[str]) -> List[Path]:
+    """Resolve files, directories and glob patterns (``**`` allowed) to project files.
+
+    Directories stand for the ``stromschlag.yaml`` inside them. Duplicates are
+    dropped; the order of first appearance is kept.
+    """
+
+    projects: List[Path] = []
+    seen = set()
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            matches = [Path(match) for match in sorted(glob.glob(os.path.expanduser(pattern), recursive=True))]
+        else:
+            matches = [Path(pattern).expanduser()]
+        for match in matches:
+            project = match / PROJECT_FILENAME if match.is_dir() else match
+            key = os.path.abspath(project)
+            if key not in seen:
+                seen.add(key)
+                projects.append(project)
+    return projects
+
+
+def load_for_export(project: Path, options: ExportOptions) -> Tuple[PackSettings, List[IconDefinition]]:
+    """Load ``project`` and apply ``options``.
+
+    A relative ``output_dir`` in the project is resolved against the project
+    file, so builds do not depend on the working directory.
+    """
+
+    settings, icons = load_project(project)
+    return _apply_options(project, settings, options), icons
+
+
+def export_project(
+    project: Path,
+    options: ExportOptions,
+    *,
+    prune_render_cache: bool = True,
+) -> ExportResult:
+    """Load and export one project file."""
+
+    settings, icons = load_for_export(project, options)
+    return export_with_options(settings, icons, options, prune_render_cache=prune_render_cache)
+
+
+def export_with_options(
+    settings: PackSettings,
+    icons: List[IconDefinition],
+    options: ExportOptions,
+    *,
+    prune_render_cache: bool = True,
+) -> ExportResult:
+    return export_icon_pack(
+        settings,
+        icons,
+        jobs=options.jobs,
+        link_mode=options.link_mode,
+        incremental=options.incremental,
+        render=options.render,
+        prune_render_cache=prune_render_cache,
+    )
+
+
+def build_projects(
+    projects: Sequence[Path],
+    options: ExportOptions,
+    *,
+    workers: int = 1,
+) -> BatchSummary:
+    """Export every project, ``workers`` at a time on a process pool.
+
+    Each worker process reuses its source digests across the projects it
+    builds, and all workers share the on-disk render cache, so artwork that
+    several packs use is hashed and rasterized once per run. Theme indexes
+    are not involved: exports never scan installed themes. The largest
+    project files are scheduled first to keep the pool busy until the end.
+
+    A failing project is recorded in the summary and does not stop the run.
+    Projects that would export into the same pack directory fail up front,
+    since their outputs would overwrite each other.
+    """
+
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    start = time.perf_counter()
+    outcomes: List[ProjectOutcome | None] = [None] * len(projects)
+    for index, error in _pack_root_collisions(projects, options).items():
+        outcomes[index] = ProjectOutcome(projects[index], 0.0, error=error)
+    order = sorted(
+        (index for index, outcome in enumerate(outcomes) if outcome is None),
+        key=lambda index: -_file_size(projects[index]),
+    )
+
+    if workers == 1 or len(order) < 2:
+        for index in order:
+            outcomes[index] = _build_project(projects[index], options)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(workers, len(order))) as executor:
+            futures = {index: executor.submit(_build_project, projects[index], options) for index in order}
+            for index, future in futures.items():
+                outcomes[index] = future.result()
+
+    if options.render:
+        RenderCache().prune()
+    return BatchSummary(
+        outcomes=[outcome for outcome in outcomes if outcome is not None],
+        seconds=time.perf_counter() - start,
+    )
+
+
+def _apply_options(project: Path, settings: PackSettings, options: ExportOptions) -> PackSettings:
+    if options.output_dir is not None:
+        settings.output_dir = options.output_dir
+    elif not settings.output_dir.is_absolute():
+        settings.output_dir = project.parent / settings.output_dir
+    if options.targets:
+        settings.targets = list(options.targets)
+    if options.sizes:
+        settings.base_sizes = list(options.sizes)
+    return settings
+
+
+def _pack_root_collisions(projects: Sequence[Path], options: ExportOptions) -> Dict[int, str]:
+    """Map the index of every project sharing its pack directory with another to an error.
+
+    Only project headers are read. Projects that cannot be read are left to
+    the build, which reports their error.
+    """
+
+    by_root: Dict[str, List[int]] = {}
+    for index, project in enumerate(projects):
+        try:
+            with open_project_stream(project) as stream:
+                settings = _apply_options(project, stream.settings, options)
+        except Exception:  # noqa: BLE001 - reported by the build itself
+            continue
+        root = os.path.abspath(settings.output_dir / settings.theme_slug())
+        by_root.setdefault(root, []).append(index)
+
+    errors: Dict[int, str] = {}
+    for root, indexes in by_root.items():
+        if len(indexes) < 2:
+            continue
+        for index in indexes:
+            others = ", ".join(str(projects[other]) for other in indexes if other != index)
+            errors[index] = f"ValueError: exports to {root}, as does {others}"
+    return errors
+
+
+def _build_project(project: Path, options: ExportOptions) -> ProjectOutcome:
+    start = time.perf_counter()
+    try:
+        # Pruning is left to the end of the run so concurrent workers never
+        # evict renders another project is about to reuse.
+        result = export_project(project, options, prune_render_cache=False)
+    except Exception as exc:  # noqa: BLE001 - reported per project in the summary
+        return ProjectOutcome(project, time.perf_counter() - start, error=f"{type(exc).__name__}: {exc}")
+    return ProjectOutcome(project, time.perf_counter() - start, result=result)
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
@@ -0,0 +1,99 @@
+"""Size limit with least-recently-used eviction for on-disk caches."""
+from __future__ import annotations
+
+import contextlib
+import os
+import threading
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+from .utils import atomic_write_text
+
+# Temporary files younger than this may still be written by another process.
+_TEMPORARY_GRACE_SECONDS = 3600
+_USAGE_FILE = "usage"
+
+
+class DiskBudget:
+    """Keeps the files below ``root`` under ``max_bytes``.
+
+    Caches store their entries in subdirectories of ``root``, refresh an
+    entry's mtime when they use it and report the size of each new entry to
+    :meth:`add`. Reported bytes go to a small usage ledger in ``root``, so
+    :meth:`prune` only walks the cache once the ledger says it is over
+    budget. Other processes' changes make the ledger an estimate; each walk
+    writes the measured size back. :meth:`add` may be called from several
+    threads.
+    """
+
+    def __init__(self, root: Path, max_bytes: int) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self._added = 0
+        self._lock = threading.Lock()
+
+    def add(self, size: int) -> None:
+        with self._lock:
+            self._added += size
+
+    def record(self) -> None:
+        """Add the bytes reported since the last call to the usage ledger."""
+
+        with self._lock:
+            added, self._added = self._added, 0
+        if added:
+            with contextlib.suppress(OSError):
+                with open(self.root / _USAGE_FILE, "a", encoding="ascii") as handle:
+                    handle.write(f"{added}\n")
+
+    def prune(self) -> int:
+        """Evict least recently used files until the cache fits; return files removed."""
+
+        self.record()
+        usage = self._read_usage()
+        if usage is not None and sum(usage) <= self.max_bytes:
+            if len(usage) > 1:
+                self._write_usage(sum(usage))
+            return 0
+
+        entries: List[Tuple[int, int, Path]] = []
+        total = 0
+        stale_before = time.time_ns() - _TEMPORARY_GRACE_SECONDS * 10**9
+        for directory, _subdirs, files in os.walk(self.root):
+            if directory == os.fspath(self.root):
+                continue  # the usage ledger, not a cache entry
+            for name in files:
+                path = Path(directory) / name
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                if name.endswith(".tmp") and stat.st_mtime_ns > stale_before:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, path))
+                total += stat.st_size
+
+        removed = 0
+        for _mtime, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            with contextlib.suppress(OSError):
+                path.unlink()
+                removed += 1
+            total -= size
+        self._write_usage(total)
+        return removed
+
+    def _read_usage(self) -> List[int] | None:
+        """Return the ledger's entries, or None when the cache must be measured."""
+
+        try:
+            text = (self.root / _USAGE_FILE).read_text(encoding="ascii")
+            return [int(line) for line in text.split()]
+        except (OSError, ValueError):
+            return None
+
+    def _write_usage(self, total: int) -> None:
+        with contextlib.suppress(OSError):
+            atomic_write_text(self.root / _USAGE_FILE, f"{total}\n")
@@ -0,0 +1,85 @@
+"""Manifest of exported files used for incremental re-exports."""
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List
+
+from .utils import atomic_write_text
+
+MANIFEST_FILENAME = ".stromschlag-manifest.json"
+_MANIFEST_VERSION = 1
+
+
+@dataclass(slots=True)
+class ManifestEntry:
+    """What an export wrote for one source file."""
+
+    size: int
+    mtime_ns: int
+    digest: str
+    destinations: List[str]
+
+
+@dataclass(slots=True)
+class ExportManifest:
+    """Sources, their fingerprints and destinations from the previous export.
+
+    Destinations are stored as POSIX paths relative to the pack root.
+    """
+
+    link_mode: str = "copy"
+    entries: Dict[str, ManifestEntry] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, pack_root: Path) -> ExportManifest:
+        """Return the manifest stored in ``pack_root`` or an empty one."""
+
+        try:
+            data = json.loads((pack_root / MANIFEST_FILENAME).read_text(encoding="utf-8"))
+            if data.get("version") != _MANIFEST_VERSION:
+                return cls()
+            return cls(
+                link_mode=data.get("link_mode", "copy"),
+                entries={
+                    source: ManifestEntry(**payload)
+                    for source, payload in data.get("entries", {}).items()
+                },
+            )
+        except (OSError, ValueError, TypeError, AttributeError):
+            return cls()
+
+    def save(self, pack_root: Path) -> None:
+        payload = {
+            "version": _MANIFEST_VERSION,
+            "link_mode": self.link_mode,
+            "entries": {source: asdict(entry) for source, entry in self.entries.items()},
+        }
+        atomic_write_text(pack_root / MANIFEST_FILENAME, json.dumps(payload, separators=(",", ":")))
+
+    def destinations(self) -> set[str]:
+        return {destination for entry in self.entries.values() for destination in entry.destinations}
+
+    def keep_leftovers(self, previous: ExportManifest) -> None:
+        """List the destinations of ``previous`` that this manifest no longer covers.
+
+        A full export leaves outputs of removed or renamed icons on disk;
+        keeping them in the manifest lets the next incremental export remove
+        them.
+        """
+
+        current = self.destinations()
+        for source, entry in previous.entries.items():
+            leftover = [destination for destination in entry.destinations if destination not in current]
+            if not leftover:
+                continue
+            if source in self.entries:
+                self.entries[source].destinations.extend(leftover)
+            else:
+                self.entries[source] = ManifestEntry(
+                    size=entry.size,
+                    mtime_ns=entry.mtime_ns,
+                    digest=entry.digest,
+                    destinations=leftover,
+                )
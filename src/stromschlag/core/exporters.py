@@ -1,13 +1,41 @@
 """Export helpers for creating themed icon directories."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+import contextlib
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from shutil import copy2, copytree
-from typing import Dict, Iterable, List, Sequence, Tuple
+from shutil import copy2, copystat, copytree
+from typing import Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+try:  # pragma: no cover - platform specific
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
+
+from . import rasterize
+from .export_manifest import ExportManifest, ManifestEntry
+from .file_status import StatSnapshot
 from .models import IconDefinition, PackSettings
-from .project_io import save_project
-from .utils import ensure_directory, icon_filename
+from .project_binary import sidecar_path
+from .project_io import dump_project, is_plain_scalar, refresh_project_sidecar, write_project_document
+from .render_cache import RenderCache
+from .utils import (
+    cached_file_digest,
+    ensure_directory,
+    icon_filename,
+    write_stream_if_changed,
+    write_text_if_changed,
+)
+
+# Theme descriptors are rendered once against this prefix and specialised per
+# target. Icon file names are slugs, so the placeholder paths are always plain
+# scalars; only prefixes YAML also writes unquoted can be substituted.
+_TARGET_PREFIX_PLACEHOLDER = "/stromschlag-target-prefix"
+_TARGET_PREFIX = re.compile(rf"^(\s*source_path: ){re.escape(_TARGET_PREFIX_PLACEHOLDER)}/", re.MULTILINE)
 
 
 @dataclass(slots=True)
@@ -18,43 +46,232 @@ class ThemeTarget:
     scalable_dir: Path
 
 
+@dataclass(slots=True)
+class ExportTimings:
+    """Wall-clock seconds spent in each phase of an export."""
+
+    prepare: float = 0.0
+    copy: float = 0.0
+    render: float = 0.0
+    descriptors: float = 0.0
+
+    @property
+    def total(self) -> float:
+        return self.prepare + self.copy + self.render + self.descriptors
+
+
 @dataclass(slots=True)
 class ExportResult:
+    """What an export wrote; ``copied``, ``rendered`` and ``skipped`` count output files."""
+
     pack_root: Path
     theme_name: str
     theme_slug: str
     targets: List[ThemeTarget]
+    copied: int = 0
+    rendered: int = 0
+    skipped: int = 0
+    removed: int = 0
+    render_cache_hits: int = 0
+    render_cache_misses: int = 0
+    timings: ExportTimings = field(default_factory=ExportTimings)
+
+
+@dataclass(frozen=True, slots=True)
+class ExportEvent:
+    """Progress report passed to the ``progress`` callback of :func:`export_icon_pack`.
+
+    ``kind`` is one of :data:`EXPORT_EVENTS` and ``count`` the number of
+    output files it covers. ``planned`` comes first and counts every output;
+    the ``copied``, ``rendered`` and ``skipped`` counts add up to it. A
+    ``failed`` event carries the error message right before the export
+    raises.
+    """
+
+    kind: str
+    count: int
+    source: Path | None = None
+    message: str | None = None
+
+
+EXPORT_EVENTS = ("planned", "copied", "rendered", "skipped", "failed")
+
+ExportProgress = Callable[[ExportEvent], None]
+
+
+class ExportCancelled(Exception):
+    """Raised by :func:`export_icon_pack` when its ``cancelled`` callback returns True."""
+
+
+LINK_MODES = ("copy", "hardlink", "reflink", "symlink")
+
+_FICLONE = 0x40049409
+
+
+@dataclass(slots=True)
+class _CopyJob:
+    """Write ``source`` to every destination; render it at ``size`` when set."""
+
+    source: Path
+    destinations: List[Path]
+    size: int | None = None
+
+    @property
+    def key(self) -> str:
+        return str(self.source) if self.size is None else f"{self.source}@{self.size}"
+
+
+class _Progress:
+    """Reports events to the caller's callback and polls for cancellation."""
+
+    __slots__ = ("_callback", "_cancelled")
 
+    def __init__(self, callback: ExportProgress | None, cancelled: Callable[[], bool] | None) -> None:
+        self._callback = callback
+        self._cancelled = cancelled
 
-def export_icon_pack(settings: PackSettings, icons: Iterable[IconDefinition]) -> ExportResult:
+    def emit(self, kind: str, count: int, source: Path | None = None, message: str | None = None) -> None:
+        if self._callback is not None and (count or kind == "failed"):
+            self._callback(ExportEvent(kind, count, source, message))
+
+    def cancelled(self) -> bool:
+        return self._cancelled is not None and self._cancelled()
+
+    def check(self) -> None:
+        if self.cancelled():
+            raise ExportCancelled("Export cancelled")
+
+
+def export_icon_pack(
+    settings: PackSettings,
+    icons: Iterable[IconDefinition],
+    *,
+    jobs: int = 1,
+    link_mode: str = "copy",
+    incremental: bool = False,
+    render: bool = False,
+    render_cache: RenderCache | None = None,
+    prune_render_cache: bool = True,
+    file_status: StatSnapshot | None = None,
+    progress: ExportProgress | None = None,
+    cancelled: Callable[[], bool] | None = None,
+) -> ExportResult:
     """Export icons for the configured desktop targets (GTK/GNOME, KDE/Qt).
 
-    Returns an :class:`ExportResult` describing the exported directories.
+    All file copies are planned up front and then executed on a thread pool
+    with ``jobs`` workers (``1`` copies sequentially on the calling thread).
+    With a ``link_mode`` other than ``"copy"`` each distinct source is copied
+    once and every other destination becomes a hardlink, a reflink or a
+    relative symlink to that copy, falling back to a plain copy whenever the
+    filesystem refuses.
+
+    Every export records each source's size, mtime, digest and destinations
+    in a manifest in the pack root. Incremental exports copy only new or
+    changed sources, or those with a missing output, and delete outputs that
+    no icon produces anymore. Full exports do not hash their sources; their
+    manifest leaves the digest empty, so a later incremental export trusts
+    an unchanged size and mtime and otherwise copies again. Descriptor files
+    are only rewritten when their content changes.
+
+    With ``render`` every source (SVG or bitmap) is rasterized at each of
+    ``settings.base_sizes`` into the fixed-size directories using a pool of
+    ``jobs`` processes; ``scalable`` keeps the original artwork. Rendering
+    needs PySide6, which is imported only when this stage runs. Renders are
+    looked up in ``render_cache`` (the user's :class:`RenderCache` by
+    default) by source digest and size, so identical artwork is only
+    rasterized once across exports and packs. The cache is trimmed to its
+    size limit afterwards unless ``prune_render_cache`` is False.
+
+    Every source is stat'ed once, ``jobs`` at a time, into ``file_status``
+    (a fresh :class:`StatSnapshot` by default); later existence, size and
+    mtime checks are answered from it. Pass a snapshot to share those
+    results with the caller.
+
+    ``progress`` receives an :class:`ExportEvent` on the calling thread as
+    outputs are planned, written or skipped. ``cancelled`` is polled between
+    files; once it returns True the export stops with
+    :class:`ExportCancelled`, leaving the files written so far in place.
+
+    Returns an :class:`ExportResult` describing the exported directories,
+    including the time each phase took.
     """
 
+    if jobs < 1:
+        raise ValueError("jobs must be at least 1")
+    if link_mode not in LINK_MODES:
+        raise ValueError(f"Unknown link mode: {link_mode}")
     icon_list = list(icons)
     if not icon_list:
         raise ValueError("No icons provided for export")
 
+    reporter = _Progress(progress, cancelled)
+    timings = ExportTimings()
+    started = time.perf_counter()
+    if file_status is None:
+        file_status = StatSnapshot()
+    file_status.prefetch((icon.source_path for icon in icon_list), workers=jobs)
+
     pack_root = settings.output_dir / settings.theme_slug()
     targets = _prepare_theme_targets(pack_root, settings)
 
-    for icon in icon_list:
-        if not icon.has_source_asset():
-            continue
-
-        filename = icon_filename(icon.name)
-        _copy_source_asset(icon.source_path, filename, targets)
-
-    _write_project_descriptors(pack_root, targets, settings, icon_list)
+    copy_jobs = _plan_jobs(icon_list, targets, render, file_status)
+    planned = sum(len(job.destinations) for job in copy_jobs)
+    reporter.emit("planned", planned)
+    pending = copy_jobs
+    skipped = removed = 0
+    digests: Dict[Path, str] = {}
+    manifest: ExportManifest | None = None
+    if incremental:
+        previous = ExportManifest.load(pack_root)
+        pending, manifest = _select_changed_jobs(
+            pack_root, pending, previous, link_mode, digests, file_status, reporter
+        )
+        skipped = planned - sum(len(job.destinations) for job in pending)
+        reporter.emit("skipped", skipped)
+        removed = _remove_stale_outputs(pack_root, previous.destinations() - manifest.destinations())
+    render_jobs = [job for job in pending if job.size is not None]
+    started = _lap(timings, "prepare", started)
+
+    _run_copy_jobs([job for job in pending if job.size is None], jobs, link_mode, progress=reporter)
+    started = _lap(timings, "copy", started)
+    hits = misses = 0
+    if render_jobs:
+        cache = render_cache or RenderCache()
+        hits, misses = _run_render_jobs(render_jobs, jobs, link_mode, cache, digests, file_status, reporter)
+        if prune_render_cache:
+            cache.prune()
+        else:
+            cache.record_usage()
+    started = _lap(timings, "render", started)
+
+    reporter.check()
+    _write_project_descriptors(pack_root, targets, settings, icon_list, file_status)
+    if manifest is None:
+        manifest = _record_jobs(pack_root, copy_jobs, link_mode, digests, file_status)
+        manifest.keep_leftovers(ExportManifest.load(pack_root))
+    manifest.save(pack_root)
+    _lap(timings, "descriptors", started)
     return ExportResult(
         pack_root=pack_root,
         theme_name=settings.name,
         theme_slug=settings.theme_slug(),
         targets=targets,
+        copied=sum(len(job.destinations) for job in pending if job.size is None),
+        rendered=sum(len(job.destinations) for job in render_jobs),
+        skipped=skipped,
+        removed=removed,
+        render_cache_hits=hits,
+        render_cache_misses=misses,
+        timings=timings,
     )
 
 
+def _lap(timings: ExportTimings, phase: str, started: float) -> float:
+    now = time.perf_counter()
+    setattr(timings, phase, now - started)
+    return now
+
+
 def _prepare_theme_targets(root: Path, settings: PackSettings) -> List[ThemeTarget]:
     themes: List[ThemeTarget] = []
     comment = settings.theme_comment()
@@ -84,48 +301,394 @@ def _prepare_theme_targets(root: Path, settings: PackSettings) -> List[ThemeTarg
     return themes
 
 
-def _copy_source_asset(source: Path | None, filename: str, targets: List[ThemeTarget]) -> None:
-    if source is None:
-        return
-    suffix = source.suffix.lower()
+def _plan_jobs(
+    icons: List[IconDefinition],
+    targets: List[ThemeTarget],
+    render: bool,
+    file_status: StatSnapshot,
+) -> List[_CopyJob]:
+    """Group the outputs of ``icons`` into one job per source (and render size).
+
+    Icons whose names map to the same file write the same destinations; the
+    last such icon wins, as it would when copying one icon after another,
+    and no destination is written by two jobs that may run concurrently.
+    """
+
+    copy_jobs: Dict[str, _CopyJob] = {}
+    owners: Dict[Path, _CopyJob] = {}
+    for icon in icons:
+        if icon.source_path is None or not icon.has_source_asset(file_status):
+            continue
+        for planned in _plan_icon_jobs(icon.source_path, icon_filename(icon.name), targets, render):
+            job = copy_jobs.get(planned.key)
+            if job is None:
+                job = copy_jobs[planned.key] = _CopyJob(source=planned.source, destinations=[], size=planned.size)
+            for destination in planned.destinations:
+                owner = owners.get(destination)
+                if owner is job:
+                    continue
+                if owner is not None:
+                    owner.destinations.remove(destination)
+                owners[destination] = job
+                job.destinations.append(destination)
+    return [job for job in copy_jobs.values() if job.destinations]
+
+
+def _plan_icon_jobs(source: Path, filename: str, targets: List[ThemeTarget], render: bool) -> List[_CopyJob]:
+    if not render:
+        return [_plan_copy_job(source, filename, targets)]
+    jobs = [_CopyJob(source=source, destinations=[target.scalable_dir / filename for target in targets])]
+    for size in targets[0].size_dirs:
+        jobs.append(
+            _CopyJob(
+                source=source,
+                destinations=[target.size_dirs[size] / filename for target in targets],
+                size=size,
+            )
+        )
+    return jobs
+
+
+def _plan_copy_job(source: Path, filename: str, targets: List[ThemeTarget]) -> _CopyJob:
+    destinations: List[Path] = []
+    is_vector = source.suffix.lower() in {".svg", ".svgz"}
     for target in targets:
-        if suffix in {".svg", ".svgz"}:
-            copy2(source, target.scalable_dir / filename)
+        if not is_vector:
+            destinations.extend(directory / filename for directory in target.size_dirs.values())
+        destinations.append(target.scalable_dir / filename)
+    return _CopyJob(source=source, destinations=destinations)
+
+
+def _select_changed_jobs(
+    pack_root: Path,
+    copy_jobs: List[_CopyJob],
+    previous: ExportManifest,
+    link_mode: str,
+    digests: Dict[Path, str],
+    file_status: StatSnapshot,
+    progress: _Progress,
+) -> Tuple[List[_CopyJob], ExportManifest]:
+    """Split off the jobs whose source or destinations changed since ``previous``.
+
+    A job is only skipped while all of its outputs are still on disk.
+    Sources whose size and mtime match the manifest are trusted without
+    hashing; otherwise the digest decides, so a touched but identical file is
+    still skipped.
+    """
+
+    manifest = ExportManifest(link_mode=link_mode)
+    pending: List[_CopyJob] = []
+    same_layout = previous.link_mode == link_mode
+    listings: Dict[Path, set[str]] = {}
+    for job in copy_jobs:
+        progress.check()
+        status = file_status.stat(job.source)
+        destinations = [destination.relative_to(pack_root).as_posix() for destination in job.destinations]
+        recorded = previous.entries.get(job.key)
+        reusable = (
+            same_layout
+            and recorded is not None
+            and recorded.destinations == destinations
+            and all(_output_present(destination, listings) for destination in job.destinations)
+        )
+        if reusable and recorded.size == status.size and recorded.mtime_ns == status.mtime_ns:
+            digest = recorded.digest
+        else:
+            digest = _source_digest(job.source, digests, file_status)
+            if not reusable or digest != recorded.digest:
+                pending.append(job)
+        manifest.entries[job.key] = ManifestEntry(
+            size=status.size,
+            mtime_ns=status.mtime_ns,
+            digest=digest,
+            destinations=destinations,
+        )
+    return pending, manifest
+
+
+def _output_present(path: Path, listings: Dict[Path, set[str]]) -> bool:
+    # One listing per output directory instead of one stat per output.
+    names = listings.get(path.parent)
+    if names is None:
+        try:
+            names = listings[path.parent] = set(os.listdir(path.parent))
+        except OSError:
+            names = listings[path.parent] = set()
+    return path.name in names
+
+
+def _record_jobs(
+    pack_root: Path,
+    copy_jobs: List[_CopyJob],
+    link_mode: str,
+    digests: Dict[Path, str],
+    file_status: StatSnapshot,
+) -> ExportManifest:
+    """Describe a full export; digests not computed along the way are left empty."""
+
+    manifest = ExportManifest(link_mode=link_mode)
+    for job in copy_jobs:
+        status = file_status.stat(job.source)
+        manifest.entries[job.key] = ManifestEntry(
+            size=status.size,
+            mtime_ns=status.mtime_ns,
+            digest=digests.get(job.source, ""),
+            destinations=[destination.relative_to(pack_root).as_posix() for destination in job.destinations],
+        )
+    return manifest
+
+
+def _remove_stale_outputs(pack_root: Path, stale: Iterable[str]) -> int:
+    removed = 0
+    for relative in stale:
+        path = pack_root / relative
+        if path.is_symlink() or path.exists():
+            _unlink_if_present(path)
+            removed += 1
+    return removed
+
+
+def _run_render_jobs(
+    render_jobs: List[_CopyJob],
+    workers: int,
+    link_mode: str,
+    cache: RenderCache,
+    digests: Dict[Path, str],
+    file_status: StatSnapshot,
+    progress: _Progress,
+) -> Tuple[int, int]:
+    """Rasterize each job into its first destination, then fan it out to the rest.
+
+    Renders come from ``cache`` when possible; misses are rendered into the
+    cache first. A job is reported as rendered once its image is in the
+    cache. Returns ``(cache hits, cache misses)``.
+    """
+
+    tasks: List[rasterize.RenderTask] = []
+    reserved: Dict[Tuple[str, int], Tuple[Path, Path]] = {}
+    waiting: Dict[Tuple[str, int], List[_CopyJob]] = {}
+    cached: List[Tuple[_CopyJob, Path]] = []
+    hits = 0
+    for job in render_jobs:
+        assert job.size is not None
+        progress.check()
+        digest = _source_digest(job.source, digests, file_status)
+        path = cache.lookup(digest, job.size)
+        if path is not None:
+            hits += 1
+            progress.emit("rendered", len(job.destinations), job.source)
+        elif (digest, job.size) in reserved:
+            hits += 1
+            path = reserved[(digest, job.size)][1]
+            waiting[(digest, job.size)].append(job)
         else:
-            for directory in target.size_dirs.values():
-                copy2(source, directory / filename)
-            copy2(source, target.scalable_dir / filename)
+            temporary, path = cache.reserve(digest, job.size)
+            reserved[(digest, job.size)] = (temporary, path)
+            waiting[(digest, job.size)] = [job]
+            tasks.append((str(job.source), job.size, str(temporary)))
+        cached.append((job, path))
+
+    task_jobs = list(waiting.values())
+
+    def rendered(index: int) -> None:
+        for job in task_jobs[index]:
+            progress.emit("rendered", len(job.destinations), job.source)
+
+    try:
+        try:
+            rasterize.render_many(tasks, workers, done=rendered, cancelled=progress.cancelled)
+        except (OSError, RuntimeError, ValueError) as exc:
+            progress.emit("failed", 0, message=str(exc))
+            raise
+        progress.check()
+        for temporary, path in reserved.values():
+            cache.commit(temporary, path)
+    finally:
+        for temporary, _ in reserved.values():
+            _unlink_if_present(temporary)
+
+    fan_out = [
+        _CopyJob(source=path, destinations=[job.destinations[0]]) for job, path in cached
+    ]
+    for job in fan_out:
+        _unlink_if_present(job.destinations[0])
+    _run_copy_jobs(fan_out, workers)
+    replicas = [
+        _CopyJob(source=job.destinations[0], destinations=job.destinations[1:])
+        for job in render_jobs
+        if len(job.destinations) > 1
+    ]
+    _run_copy_jobs(replicas, workers, link_mode, link_to_source=True)
+    return hits, len(tasks)
+
+
+def _source_digest(source: Path, digests: Dict[Path, str], file_status: StatSnapshot) -> str:
+    digest = digests.get(source)
+    if digest is None:
+        digest = digests[source] = cached_file_digest(source, file_status)
+    return digest
+
+
+_OutputTask = Tuple[Path, Path, str]
+"""``(source, destination, link mode)``; ``"copy"`` copies instead of linking."""
+
+
+def _run_copy_jobs(
+    copy_jobs: List[_CopyJob],
+    workers: int,
+    link_mode: str = "copy",
+    *,
+    link_to_source: bool = False,
+    progress: _Progress | None = None,
+) -> None:
+    """Execute ``copy_jobs``, reporting each to ``progress`` on the calling thread.
+
+    Every destination is a task of its own, so a source with many sizes is
+    spread over the pool instead of being copied by one thread. When the
+    other destinations link to a job's first one, the first copies run as
+    an earlier round.
+    """
+
+    def execute(task: _OutputTask) -> None:
+        # Tasks still queued when the export is cancelled finish without writing.
+        if progress is None or not progress.cancelled():
+            _write_output(*task)
+
+    if link_mode == "copy" or link_to_source:
+        rounds = [[[(job.source, destination, link_mode) for destination in job.destinations] for job in copy_jobs]]
+    else:
+        rounds = [
+            [[(job.source, job.destinations[0], "copy")] for job in copy_jobs],
+            [
+                [(job.destinations[0], destination, link_mode) for destination in job.destinations[1:]]
+                for job in copy_jobs
+            ],
+        ]
+    if workers <= 1 or sum(len(job.destinations) for job in copy_jobs) < 2:
+        for index, tasks in enumerate(rounds):
+            _report_copies(copy_jobs, tasks, map(execute, _flatten(tasks)), progress, index == len(rounds) - 1)
+        return
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="stromschlag-export") as executor:
+        for index, tasks in enumerate(rounds):
+            outcomes = executor.map(execute, _flatten(tasks))
+            _report_copies(copy_jobs, tasks, outcomes, progress, index == len(rounds) - 1)
+
+
+def _flatten(tasks: List[List[_OutputTask]]) -> Iterator[_OutputTask]:
+    return (task for job_tasks in tasks for task in job_tasks)
+
+
+def _report_copies(
+    copy_jobs: List[_CopyJob],
+    tasks: List[List[_OutputTask]],
+    outcomes: Iterator[None],
+    progress: _Progress | None,
+    done: bool,
+) -> None:
+    """Wait for each job's tasks; report the job as copied when ``done``, and any failure."""
+
+    for job, job_tasks in zip(copy_jobs, tasks):
+        for _task in job_tasks:
+            try:
+                next(outcomes)
+            except OSError as exc:
+                if progress is not None:
+                    progress.emit("failed", len(job.destinations), job.source, str(exc))
+                raise
+        if progress is not None:
+            progress.check()
+            if done:
+                progress.emit("copied", len(job.destinations), job.source)
+
+
+def _write_output(source: Path, destination: Path, link_mode: str) -> None:
+    if link_mode == "copy":
+        # A link left by an earlier export would be written through.
+        _unlink_if_present(destination)
+        copy2(source, destination)
+    else:
+        _link_or_copy(source, destination, link_mode)
+
+
+def _link_or_copy(primary: Path, destination: Path, link_mode: str) -> None:
+    _unlink_if_present(destination)
+    try:
+        if link_mode == "hardlink":
+            os.link(primary, destination)
+        elif link_mode == "symlink":
+            os.symlink(os.path.relpath(primary, destination.parent), destination)
+        else:
+            _reflink(primary, destination)
+    except OSError:
+        _unlink_if_present(destination)
+        copy2(primary, destination)
+
+
+def _reflink(source: Path, destination: Path) -> None:
+    """Clone ``source`` into ``destination`` with ``FICLONE`` (btrfs, xfs, ...)."""
+    if fcntl is None:
+        raise OSError("Reflinks are not supported on this platform")
+    with open(source, "rb") as src, open(destination, "wb") as dst:
+        fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    copystat(source, destination)
+
+
+def _unlink_if_present(path: Path) -> None:
+    with contextlib.suppress(FileNotFoundError):
+        path.unlink()
 
 
 def _write_project_descriptors(
     pack_root: Path,
     targets: List[ThemeTarget],
     settings: PackSettings,
-    icons: Iterable[IconDefinition],
+    icons: List[IconDefinition],
+    file_status: StatSnapshot,
 ) -> None:
-    icon_snapshot = [
-        IconDefinition(name=icon.name, source_path=icon.source_path, category=icon.category)
-        for icon in icons
-    ]
-    save_project(pack_root / "stromschlag.yaml", settings, icon_snapshot, include_categories=False)
+    """Write ``stromschlag.yaml`` into the pack root and into every theme.
+
+    The pack root lists the original artwork; the themes point at their
+    exported scalable copies and differ only in that directory, so their
+    document is serialized once and the prefix swapped per target. Every file
+    is streamed to disk atomically and left alone when unchanged. The pack
+    root's document, which is what reopening the pack loads, also gets its
+    binary sidecar when the project is large.
+    """
 
-    for target in targets:
-        themed_icons = [
+    descriptor = pack_root / "stromschlag.yaml"
+    written = write_stream_if_changed(
+        descriptor,
+        lambda handle: write_project_document(handle, settings, icons, include_categories=False),
+    )
+    if written or not sidecar_path(descriptor).exists():
+        refresh_project_sidecar(descriptor, settings, icons, include_categories=False)
+
+    present = [icon.has_source_asset(file_status) for icon in icons]
+
+    def themed(scalable_dir: Path | str) -> List[IconDefinition]:
+        return [
             IconDefinition(
                 name=icon.name,
-                source_path=(target.scalable_dir / icon_filename(icon.name))
-                if icon.has_source_asset()
-                else None,
+                source_path=Path(scalable_dir) / icon_filename(icon.name) if has_asset else None,
                 category=icon.category,
             )
-            for icon in icons
+            for icon, has_asset in zip(icons, present)
         ]
-        save_project(
-            target.theme_root / "stromschlag.yaml",
-            settings,
-            themed_icons,
-            include_categories=False,
-        )
+
+    template: str | None = None
+    for target in targets:
+        prefix = str(target.scalable_dir)
+        if is_plain_scalar(f"{prefix}/{icon_filename('icon')}"):
+            if template is None:
+                template = dump_project(settings, themed(_TARGET_PREFIX_PLACEHOLDER), include_categories=False)
+            text = _TARGET_PREFIX.sub(lambda match: f"{match.group(1)}{prefix}/", template)
+            write_stream_if_changed(target.theme_root / "stromschlag.yaml", lambda handle: handle.write(text))
+        else:
+            themed_icons = themed(target.scalable_dir)
+            write_stream_if_changed(
+                target.theme_root / "stromschlag.yaml",
+                lambda handle: write_project_document(handle, settings, themed_icons, include_categories=False),
+            )
 
 
 _DEFAULT_ICON_DIRS: Tuple[Path, ...] = (
@@ -199,4 +762,4 @@ def _write_index_theme(
             )
         content += extra
 
-    theme_file.write_text(content)
+    write_text_if_changed(theme_file, content)
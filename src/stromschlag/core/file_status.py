@@ -0,0 +1,80 @@
+"""Per-operation cache of artwork file status.
+
+Exports, previews and validation all ask whether an icon's artwork exists,
+and the exporter also needs its size and mtime. On network filesystems each
+of those questions is a round trip, so a :class:`StatSnapshot` answers them
+from a single ``os.stat`` per path. A snapshot does not notice later changes
+on disk; make a new one (or :meth:`StatSnapshot.invalidate` it) per operation.
+"""
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable
+
+
+@dataclass(frozen=True, slots=True)
+class FileStatus:
+    exists: bool
+    size: int = 0
+    mtime_ns: int = 0
+    inode: int = 0
+
+
+MISSING = FileStatus(exists=False)
+
+
+class StatSnapshot:
+    """Remembers one :class:`FileStatus` per path, following symlinks like ``Path.exists``.
+
+    Lookups may come from several threads; at worst a path is stat'ed twice.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, FileStatus] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stat(self, path: Path | str) -> FileStatus:
+        key = os.fspath(path)
+        status = self._entries.get(key)
+        if status is None:
+            status = self._entries[key] = _stat(key)
+        return status
+
+    def exists(self, path: Path | str | None) -> bool:
+        return path is not None and self.stat(path).exists
+
+    def prefetch(self, paths: Iterable[Path | str | None], workers: int | None = None) -> None:
+        """Stat every path not cached yet, ``workers`` at a time.
+
+        The calls mostly wait on the filesystem, so a thread pool overlaps
+        their latency on network mounts. ``workers=1`` stats serially.
+        """
+
+        keys = list(dict.fromkeys(os.fspath(path) for path in paths if path is not None))
+        keys = [key for key in keys if key not in self._entries]
+        if len(keys) > 1 and workers != 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                self._entries.update(zip(keys, executor.map(_stat, keys)))
+        else:
+            self._entries.update((key, _stat(key)) for key in keys)
+
+    def invalidate(self, path: Path | str | None = None) -> None:
+        """Forget ``path``, or every path when called without one."""
+
+        if path is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(os.fspath(path), None)
+
+
+def _stat(path: str) -> FileStatus:
+    try:
+        result = os.stat(path)
+    except (OSError, ValueError):
+        return MISSING
+    return FileStatus(exists=True, size=result.st_size, mtime_ns=result.st_mtime_ns, inode=result.st_ino)
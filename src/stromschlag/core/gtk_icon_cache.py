@@ -0,0 +1,110 @@
+"""Memory-mapped reader for GTK ``icon-theme.cache`` files.
+
+The format is written by ``gtk-update-icon-cache``. All integers are big
+endian and all offsets are absolute::
+
+    Header:    CARD16 major, CARD16 minor, CARD32 hash_offset, CARD32 directory_list_offset
+    DirList:   CARD32 n_directories, CARD32 directory_offset[n_directories]
+    Hash:      CARD32 n_buckets, CARD32 icon_offset[n_buckets]
+    Icon:      CARD32 chain_offset, CARD32 name_offset, CARD32 image_list_offset
+    ImageList: CARD32 n_images, Image[n_images]
+    Image:     CARD16 directory_index, CARD16 flags, CARD32 image_data_offset
+
+Strings are NUL terminated. Empty buckets and chain ends use ``0xFFFFFFFF``.
+"""
+from __future__ import annotations
+
+import mmap
+import struct
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+CACHE_FILENAME = "icon-theme.cache"
+
+HAS_SUFFIX_XPM = 1
+HAS_SUFFIX_SVG = 2
+HAS_SUFFIX_PNG = 4
+HAS_ICON_FILE = 8
+
+_NO_OFFSET = 0xFFFFFFFF
+_HEADER = struct.Struct(">HHII")
+_CARD32 = struct.Struct(">I")
+_ICON = struct.Struct(">III")
+_IMAGE = struct.Struct(">HHI")
+
+
+class GtkIconCache:
+    """Read-only view over an ``icon-theme.cache`` file.
+
+    The file is memory-mapped and decoded lazily with ``struct.unpack_from``;
+    only the icon names and directory strings that are requested get copied
+    out of the mapping. Raises ``ValueError`` for unsupported or corrupt files.
+    """
+
+    def __init__(self, path: Path) -> None:
+        with open(path, "rb") as handle:
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            major, _minor, self._hash_offset, self._directory_offset = _HEADER.unpack_from(self._map, 0)
+            if major != 1:
+                raise ValueError(f"Unsupported icon cache version {major}")
+            self._directories = self._read_directories()
+        except (struct.error, UnicodeDecodeError) as exc:
+            self.close()
+            raise ValueError(f"Corrupt icon cache: {path}") from exc
+        except ValueError:
+            self.close()
+            raise
+
+    def __enter__(self) -> GtkIconCache:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._map.close()
+
+    @property
+    def directories(self) -> List[str]:
+        return list(self._directories)
+
+    def iter_images(self) -> Iterator[Tuple[str, int, int]]:
+        """Yield ``(icon name, directory index, flags)`` for every image in the cache.
+
+        The directory index points into :attr:`directories`.
+        """
+
+        data = self._map
+        n_directories = len(self._directories)
+        try:
+            (n_buckets,) = _CARD32.unpack_from(data, self._hash_offset)
+            for bucket in range(n_buckets):
+                (icon_offset,) = _CARD32.unpack_from(data, self._hash_offset + 4 + 4 * bucket)
+                while icon_offset != _NO_OFFSET:
+                    chain_offset, name_offset, image_list_offset = _ICON.unpack_from(data, icon_offset)
+                    name = self._read_string(name_offset)
+                    (n_images,) = _CARD32.unpack_from(data, image_list_offset)
+                    for index in range(n_images):
+                        directory_index, flags, _ = _IMAGE.unpack_from(
+                            data, image_list_offset + 4 + _IMAGE.size * index
+                        )
+                        if directory_index >= n_directories:
+                            raise ValueError(f"Invalid directory index {directory_index}")
+                        yield name, directory_index, flags
+                    icon_offset = chain_offset
+        except (struct.error, UnicodeDecodeError) as exc:
+            raise ValueError("Corrupt icon cache") from exc
+
+    def _read_directories(self) -> List[str]:
+        (count,) = _CARD32.unpack_from(self._map, self._directory_offset)
+        return [
+            self._read_string(_CARD32.unpack_from(self._map, self._directory_offset + 4 + 4 * index)[0])
+            for index in range(count)
+        ]
+
+    def _read_string(self, offset: int) -> str:
+        end = self._map.find(b"\0", offset)
+        if end < 0:
+            raise ValueError("Unterminated string in icon cache")
+        return self._map[offset:end].decode("utf-8")
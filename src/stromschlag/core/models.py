@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import List
 
 from .. import __version__
+from .file_status import StatSnapshot
 from .utils import slugify
 
 
@@ -17,7 +18,10 @@ class IconDefinition:
     source_path: Path | None = None
     category: str | None = None
 
-    def has_source_asset(self) -> bool:
+    def has_source_asset(self, file_status: StatSnapshot | None = None) -> bool:
+        """Whether the artwork exists, answered from ``file_status`` when given."""
+        if file_status is not None:
+            return file_status.exists(self.source_path)
         return self.source_path is not None and self.source_path.exists()
 
 
@@ -0,0 +1,199 @@
+"""Binary sidecar for large ``stromschlag.yaml`` projects.
+
+The YAML file stays the human-editable source of truth. Next to it, large
+projects get a ``.<name>.bin`` file holding the same model, which loads much
+faster than parsing YAML. The sidecar records the size, mtime and inode of the
+YAML file it was made from and is ignored as soon as any of them change.
+
+All integers are little endian::
+
+    Header:   8s magic, u16 version, u16 flags, u64 yaml_size, i64 yaml_mtime_ns,
+              u64 yaml_inode, u32 n_strings, u32 n_icons
+    Pool:     u32 length[n_strings] (in characters), u32 blob_size, UTF-8 blob of all strings
+    Settings: u32 name, author, description, inherits, output_dir (pool indexes),
+              u32 n_sizes, i32 sizes[n_sizes], u32 n_targets, u32 targets[n_targets]
+    Icons:    u32 (name, category, source_path)[n_icons] (pool indexes)
+
+Missing categories and source paths are stored as ``0xFFFFFFFF``.
+"""
+from __future__ import annotations
+
+import contextlib
+import os
+import struct
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+from .models import IconDefinition, PackSettings
+from .utils import atomic_write_bytes
+
+BINARY_THRESHOLD = 2000
+"""Projects with at least this many icons get a binary sidecar."""
+
+_MAGIC = b"STRMPRJ\0"
+_VERSION = 1
+_NONE = 0xFFFFFFFF
+_HEADER = struct.Struct("<8sHHQqQII")
+_SETTINGS = struct.Struct("<5I")
+_COUNT = struct.Struct("<I")
+# Lone surrogates (undecodable file names) must survive the round trip.
+_ERRORS = "surrogatepass"
+
+SourceStamp = Tuple[int, int, int]
+"""``(size, mtime_ns, inode)`` of the YAML file a sidecar was made from."""
+
+
+def sidecar_path(project: Path) -> Path:
+    return project.with_name(f".{project.name}.bin")
+
+
+def source_stamp(project: Path) -> SourceStamp:
+    stat = os.stat(project)
+    return stat.st_size, stat.st_mtime_ns, stat.st_ino
+
+
+def read_sidecar(project: Path) -> Tuple[PackSettings, List[IconDefinition]] | None:
+    """Return the model stored next to ``project``, or ``None`` if missing, stale or corrupt."""
+
+    try:
+        data = sidecar_path(project).read_bytes()
+        stamp, settings, icons = decode_project(data)
+        if stamp != source_stamp(project):
+            return None
+    except (OSError, ValueError):
+        return None
+    return settings, icons
+
+
+def write_sidecar(
+    project: Path,
+    settings: PackSettings,
+    icons: Sequence[IconDefinition],
+    stamp: SourceStamp,
+) -> None:
+    """Atomically store the model next to ``project``.
+
+    ``stamp`` must be taken before the model was read from (or after it was
+    written to) ``project``, so a concurrent edit leaves the sidecar stale.
+    """
+
+    atomic_write_bytes(sidecar_path(project), encode_project(settings, icons, stamp))
+
+
+def remove_sidecar(project: Path) -> None:
+    with contextlib.suppress(FileNotFoundError):
+        sidecar_path(project).unlink()
+
+
+def encode_project(settings: PackSettings, icons: Sequence[IconDefinition], stamp: SourceStamp) -> bytes:
+    """Serialize the model; raises ``ValueError`` for values the format cannot hold."""
+
+    strings: List[str] = []
+    pool: Dict[str, int] = {}
+
+    def intern(value: str | None) -> int:
+        if value is None:
+            return _NONE
+        if not isinstance(value, str):
+            raise ValueError(f"Unsupported project value: {value!r}")
+        index = pool.get(value)
+        if index is None:
+            index = pool[value] = len(strings)
+            strings.append(value)
+        return index
+
+    settings_row = [
+        intern(settings.name),
+        intern(settings.author),
+        intern(settings.description),
+        intern(settings.inherits),
+        intern(str(settings.output_dir)),
+    ]
+    targets = [intern(target) for target in settings.targets]
+    icon_rows: List[int] = []
+    for icon in icons:
+        icon_rows.append(intern(icon.name))
+        icon_rows.append(intern(icon.category))
+        icon_rows.append(intern(None if icon.source_path is None else str(icon.source_path)))
+
+    size, mtime_ns, inode = stamp
+    try:
+        blob = "".join(strings).encode("utf-8", _ERRORS)
+        return b"".join(
+            (
+                _HEADER.pack(_MAGIC, _VERSION, 0, size, mtime_ns, inode, len(strings), len(icons)),
+                struct.pack(f"<{len(strings)}I", *(len(value) for value in strings)),
+                _COUNT.pack(len(blob)),
+                blob,
+                _SETTINGS.pack(*settings_row),
+                _COUNT.pack(len(settings.base_sizes)),
+                struct.pack(f"<{len(settings.base_sizes)}i", *settings.base_sizes),
+                _COUNT.pack(len(targets)),
+                struct.pack(f"<{len(targets)}I", *targets),
+                struct.pack(f"<{len(icon_rows)}I", *icon_rows),
+            )
+        )
+    except struct.error as exc:
+        raise ValueError(f"Project cannot be stored in a sidecar: {exc}") from exc
+
+
+def decode_project(data: bytes) -> Tuple[SourceStamp, PackSettings, List[IconDefinition]]:
+    """Decode :func:`encode_project` output; raises ``ValueError`` for corrupt data."""
+
+    try:
+        magic, version, _flags, size, mtime_ns, inode, n_strings, n_icons = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("Not a Stromschlag project sidecar")
+        offset = _HEADER.size
+        lengths = struct.unpack_from(f"<{n_strings}I", data, offset)
+        offset += 4 * n_strings
+        (blob_size,) = _COUNT.unpack_from(data, offset)
+        offset += 4
+        text = data[offset:offset + blob_size].decode("utf-8", _ERRORS)
+        offset += blob_size
+
+        strings: List[str] = []
+        start = 0
+        for length in lengths:
+            strings.append(text[start:start + length])
+            start += length
+        if start != len(text):
+            raise ValueError("Corrupt string pool")
+
+        name, author, description, inherits, output_dir = _SETTINGS.unpack_from(data, offset)
+        offset += _SETTINGS.size
+        (n_sizes,) = _COUNT.unpack_from(data, offset)
+        sizes = struct.unpack_from(f"<{n_sizes}i", data, offset + 4)
+        offset += 4 + 4 * n_sizes
+        (n_targets,) = _COUNT.unpack_from(data, offset)
+        targets = struct.unpack_from(f"<{n_targets}I", data, offset + 4)
+        offset += 4 + 4 * n_targets
+        rows = struct.unpack_from(f"<{3 * n_icons}I", data, offset)
+        if offset + 12 * n_icons != len(data):
+            raise ValueError("Trailing data in project sidecar")
+
+        # YAML may hold nulls for the text settings; keep them as they were loaded.
+        settings = PackSettings(
+            name=_optional(strings, name),
+            author=_optional(strings, author),
+            description=_optional(strings, description),
+            inherits=_optional(strings, inherits),
+            base_sizes=list(sizes),
+            output_dir=Path(strings[output_dir]),
+            targets=[strings[target] for target in targets],
+        )
+        icons = [
+            IconDefinition(
+                name=strings[rows[index]],
+                category=_optional(strings, rows[index + 1]),
+                source_path=None if rows[index + 2] == _NONE else Path(strings[rows[index + 2]]),
+            )
+            for index in range(0, len(rows), 3)
+        ]
+    except (struct.error, IndexError, UnicodeDecodeError) as exc:
+        raise ValueError("Corrupt project sidecar") from exc
+    return (size, mtime_ns, inode), settings, icons
+
+
+def _optional(strings: List[str], index: int) -> str | None:
+    return None if index == _NONE else strings[index]
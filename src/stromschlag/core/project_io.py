@@ -1,21 +1,186 @@
 """Helpers for reading and writing Stromschlag project files."""
 from __future__ import annotations
 
+import io
+from dataclasses import fields
 from pathlib import Path
-from typing import Iterable, List, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, TextIO, Tuple
 
 import yaml
+from yaml.events import (
+    AliasEvent,
+    MappingEndEvent,
+    MappingStartEvent,
+    ScalarEvent,
+    SequenceEndEvent,
+    SequenceStartEvent,
+    StreamEndEvent,
+)
+from yaml.nodes import MappingNode, Node, ScalarNode, SequenceNode
 
 from .models import IconDefinition, PackSettings
+from .project_binary import BINARY_THRESHOLD, SourceStamp, read_sidecar, remove_sidecar, source_stamp, write_sidecar
+from .utils import atomic_write_text
 
+try:
+    from yaml import CSafeDumper as _SafeDumper, CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper, SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+PROJECT_FILENAME = "stromschlag.yaml"
 _PROJECT_HEADER = "# Icon pack generated with Stromschlag - https://github.com/br0sinski/Stromschlag\n"
 
 
-def load_project(path: Path) -> Tuple[PackSettings, List[IconDefinition]]:
-    """Load a Stromschlag project from disk and return settings plus icons."""
-    data = yaml.safe_load(path.read_text()) or {}
+def load_project(path: Path, *, refresh_sidecar: bool = False) -> Tuple[PackSettings, List[IconDefinition]]:
+    """Load a Stromschlag project from disk and return settings plus icons.
+
+    Large projects are read from their binary sidecar while it still matches
+    the YAML file; otherwise the YAML is parsed. Loading leaves the project's
+    directory untouched unless ``refresh_sidecar`` is True, in which case a
+    missing or stale sidecar is rewritten (or removed below the size limit).
+    """
+    cached = read_sidecar(path)
+    if cached is not None:
+        return cached
+    stamp = source_stamp(path)
+    data = yaml.load(path.read_text(), Loader=_SafeLoader) or {}
+    settings = _settings_from(data)
+    icons = [_icon_from(payload, index) for index, payload in enumerate(data.get("icons", []), start=1)]
+    if refresh_sidecar:
+        _refresh_sidecar(path, settings, icons, stamp)
+    return settings, icons
+
+
+class ProjectStream:
+    """Reads a project incrementally: the settings first, then icons in batches.
+
+    :attr:`settings` is available as soon as the stream is open and holds
+    every top-level key that precedes ``icons``, which is all of them for
+    files written by :func:`save_project`. Iterating yields lists of up to
+    ``batch_size`` icons, in file order; keys found after ``icons`` are
+    applied to :attr:`settings` once the last batch has been yielded.
+
+    Projects with a current binary sidecar are served from it. Otherwise the
+    YAML is parsed event by event, so only one batch of icons is built at a
+    time, and the sidecar is only rewritten when ``refresh_sidecar`` is True,
+    as for :func:`load_project`. A stream can be iterated once; close it (or
+    use it as a context manager) to release the file when stopping early.
+    """
+
+    def __init__(self, path: Path, batch_size: int = 1000, *, refresh_sidecar: bool = False) -> None:
+        self.path = path
+        self._batch_size = batch_size
+        self._refresh_sidecar = refresh_sidecar
+        self._handle: TextIO | None = None
+        self._loader: Any = None
+        self._data: Dict[Any, Any] = {}
+        self._anchors: Dict[str, Node] = {}
+        self._stamp = source_stamp(path)
+        cached = read_sidecar(path)
+        if cached is not None:
+            self.settings, self._cached_icons = cached
+            return
+        self._cached_icons = None
+        self._handle = path.open()
+        try:
+            self._loader = _SafeLoader(self._handle)
+            self._read_header()
+        except BaseException:
+            self.close()
+            raise
+        self.settings = _settings_from(self._data)
+
+    def __enter__(self) -> ProjectStream:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._loader is not None:
+            self._loader.dispose()
+            self._loader = None
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def __iter__(self) -> Iterator[List[IconDefinition]]:
+        if self._cached_icons is not None:
+            icons, self._cached_icons = self._cached_icons, []
+            for start in range(0, len(icons), self._batch_size):
+                yield icons[start:start + self._batch_size]
+            return
+        if self._loader is None:
+            return
+        try:
+            icons = yield from self._read_icons()
+            self._read_trailer()
+        finally:
+            self.close()
+        trailing = _settings_from(self._data)
+        for field in fields(PackSettings):
+            if field.name != "version":
+                setattr(self.settings, field.name, getattr(trailing, field.name))
+        if self._refresh_sidecar:
+            _refresh_sidecar(self.path, self.settings, icons, self._stamp)
+
+    def _read_header(self) -> None:
+        loader = self._loader
+        loader.get_event()  # StreamStartEvent
+        if loader.check_event(StreamEndEvent):
+            self.close()  # an empty file is an empty project, as in load_project
+            return
+        loader.get_event()  # DocumentStartEvent
+        if not loader.check_event(MappingStartEvent):
+            if _read_value(loader, self._anchors) is not None:
+                raise ValueError(f"{self.path} does not contain a project mapping")
+            self.close()
+            return
+        loader.get_event()
+        while not loader.check_event(MappingEndEvent):
+            key = _read_value(loader, self._anchors)
+            if key == "icons":
+                return
+            self._data[key] = _read_value(loader, self._anchors)
+        # No ``icons`` key: the header holds the whole project and there are no icons.
+        self.close()
+
+    def _read_icons(self) -> Iterator[List[IconDefinition]]:
+        loader = self._loader
+        icons: List[IconDefinition] = []
+        if not loader.check_event(SequenceStartEvent):
+            # ``icons: null`` or similar; treat like a missing list.
+            _read_value(loader, self._anchors)
+            return icons
+        loader.get_event()
+        batch: List[IconDefinition] = []
+        while not loader.check_event(SequenceEndEvent):
+            batch.append(_icon_from(_read_value(loader, self._anchors), len(icons) + len(batch) + 1))
+            if len(batch) >= self._batch_size:
+                icons.extend(batch)
+                yield batch
+                batch = []
+        loader.get_event()
+        if batch:
+            icons.extend(batch)
+            yield batch
+        return icons
+
+    def _read_trailer(self) -> None:
+        loader = self._loader
+        while not loader.check_event(MappingEndEvent):
+            key = _read_value(loader, self._anchors)
+            self._data[key] = _read_value(loader, self._anchors)
+
+
+def open_project_stream(path: Path, batch_size: int = 1000, *, refresh_sidecar: bool = False) -> ProjectStream:
+    """Open ``path`` for incremental reading; see :class:`ProjectStream`."""
 
-    settings = PackSettings(
+    return ProjectStream(path, batch_size, refresh_sidecar=refresh_sidecar)
+
+
+def _settings_from(data: Dict[Any, Any]) -> PackSettings:
+    return PackSettings(
         name=data.get("name", "Untitled Icon Pack"),
         author=data.get("author", "Unknown"),
         description=data.get("description", ""),
@@ -25,18 +190,71 @@ def load_project(path: Path) -> Tuple[PackSettings, List[IconDefinition]]:
         targets=[str(target) for target in data.get("targets", ["gnome", "kde"])],
     )
 
-    icons: List[IconDefinition] = []
-    for index, payload in enumerate(data.get("icons", []), start=1):
-        name = payload.get("name", f"Icon {index}")
-        source_path_str = payload.get("source_path")
-        icons.append(
-            IconDefinition(
-                name=name,
-                source_path=Path(source_path_str).expanduser() if source_path_str else None,
-                category=payload.get("category"),
+
+def _icon_from(payload: Dict[str, Any], index: int) -> IconDefinition:
+    source_path_str = payload.get("source_path")
+    return IconDefinition(
+        name=payload.get("name", f"Icon {index}"),
+        source_path=Path(source_path_str).expanduser() if source_path_str else None,
+        category=payload.get("category"),
+    )
+
+
+def _read_value(loader: Any, anchors: Dict[str, Node]) -> Any:
+    """Compose and construct the next complete value from the loader's event stream."""
+
+    value = loader.construct_object(_compose_node(loader, anchors), deep=True)
+    # The constructor memoizes per node; drop it so a long stream does not accumulate.
+    loader.constructed_objects = {}
+    return value
+
+
+def _compose_node(loader: Any, anchors: Dict[str, Node]) -> Node:
+    """Build the node for the next value, like ``yaml.composer.Composer.compose_node``.
+
+    libyaml's parser only exposes whole documents or single events, so the
+    composition is redone here to stop after each icon.
+    """
+
+    event = loader.get_event()
+    if isinstance(event, AliasEvent):
+        if event.anchor not in anchors:
+            raise yaml.composer.ComposerError(
+                None, None, f"found undefined alias {event.anchor!r}", event.start_mark
             )
-        )
-    return settings, icons
+        return anchors[event.anchor]
+
+    node: Node
+    if isinstance(event, ScalarEvent):
+        tag = _resolve_tag(loader, ScalarNode, event, event.value)
+        node = ScalarNode(tag, event.value, event.start_mark, event.end_mark, style=event.style)
+    elif isinstance(event, SequenceStartEvent):
+        tag = _resolve_tag(loader, SequenceNode, event, None)
+        node = SequenceNode(tag, [], event.start_mark, None, flow_style=event.flow_style)
+    elif isinstance(event, MappingStartEvent):
+        tag = _resolve_tag(loader, MappingNode, event, None)
+        node = MappingNode(tag, [], event.start_mark, None, flow_style=event.flow_style)
+    else:
+        raise yaml.composer.ComposerError(None, None, f"unexpected {type(event).__name__}", event.start_mark)
+    if event.anchor is not None:
+        anchors[event.anchor] = node
+
+    if isinstance(node, SequenceNode):
+        while not loader.check_event(SequenceEndEvent):
+            node.value.append(_compose_node(loader, anchors))
+        node.end_mark = loader.get_event().end_mark
+    elif isinstance(node, MappingNode):
+        while not loader.check_event(MappingEndEvent):
+            item_key = _compose_node(loader, anchors)
+            node.value.append((item_key, _compose_node(loader, anchors)))
+        node.end_mark = loader.get_event().end_mark
+    return node
+
+
+def _resolve_tag(loader: Any, kind: type, event: Any, value: str | None) -> str:
+    if event.tag is None or event.tag == "!":
+        return loader.resolve(kind, value, event.implicit)
+    return event.tag
 
 
 def save_project(
@@ -46,7 +264,86 @@ def save_project(
     *,
     include_categories: bool = True,
 ) -> None:
-    """Persist the project as a YAML document."""
+    """Persist the project as a YAML document, plus a binary sidecar when large.
+
+    The document is written to a temporary file that replaces ``path``, so an
+    interrupted save leaves the previous project intact.
+    """
+    icons = list(icons)
+    atomic_write_text(path, dump_project(settings, icons, include_categories=include_categories))
+    refresh_project_sidecar(path, settings, icons, include_categories=include_categories)
+
+
+def refresh_project_sidecar(
+    path: Path,
+    settings: PackSettings,
+    icons: Iterable[IconDefinition],
+    *,
+    include_categories: bool = True,
+) -> None:
+    """Store the binary sidecar of a project just written to ``path`` from these values.
+
+    Call it right after writing the document, with the same arguments, so the
+    sidecar matches the file; :func:`save_project` does so itself.
+    """
+    # Store the icons the way load_project will read them back from the YAML.
+    loaded_icons = [
+        IconDefinition(
+            name=icon.name,
+            source_path=icon.source_path.expanduser() if icon.source_path is not None else None,
+            category=icon.category if include_categories and icon.category else None,
+        )
+        for icon in icons
+    ]
+    try:
+        stamp = source_stamp(path)
+    except OSError:
+        return
+    _refresh_sidecar(path, settings, loaded_icons, stamp)
+
+
+def _refresh_sidecar(
+    path: Path,
+    settings: PackSettings,
+    icons: List[IconDefinition],
+    stamp: SourceStamp,
+) -> None:
+    # The sidecar only speeds up loading, so failing to write it is not an error.
+    try:
+        if len(icons) >= BINARY_THRESHOLD:
+            write_sidecar(path, settings, icons, stamp)
+        else:
+            remove_sidecar(path)
+    except (OSError, ValueError):
+        pass
+
+
+def is_plain_scalar(value: str) -> bool:
+    """Whether project files store ``value`` unquoted and on a single line."""
+    text = yaml.dump(value, Dumper=_SafeDumper, width=-1)
+    return text.rstrip("\n").removesuffix("\n...") == value
+
+
+def dump_project(
+    settings: PackSettings,
+    icons: Iterable[IconDefinition],
+    *,
+    include_categories: bool = True,
+) -> str:
+    """Render the project document that :func:`save_project` writes."""
+    buffer = io.StringIO()
+    write_project_document(buffer, settings, icons, include_categories=include_categories)
+    return buffer.getvalue()
+
+
+def write_project_document(
+    handle: TextIO,
+    settings: PackSettings,
+    icons: Iterable[IconDefinition],
+    *,
+    include_categories: bool = True,
+) -> None:
+    """Stream the document of :func:`dump_project` into ``handle``."""
     payload = {
         "name": settings.name,
         "author": settings.author,
@@ -72,6 +369,5 @@ def save_project(
             for icon in icons
         ],
     }
-    path.parent.mkdir(parents=True, exist_ok=True)
-    yaml_text = yaml.safe_dump(payload, sort_keys=False)
-    path.write_text(f"{_PROJECT_HEADER}{yaml_text}")
+    handle.write(_PROJECT_HEADER)
+    yaml.dump(payload, handle, Dumper=_SafeDumper, sort_keys=False)
@@ -0,0 +1,161 @@
+"""Offscreen rasterization of icon sources into fixed-size PNG files.
+
+PySide6 is only imported when something is actually rendered, so importing
+this module (and the exporter) does not pull in Qt. SVG and SVGZ sources
+are drawn with ``QSvgRenderer``; bitmap sources are downscaled with Qt's
+smooth (area-averaging) filter. Every output is a square, transparent PNG
+with the artwork centered and its aspect ratio preserved.
+"""
+from __future__ import annotations
+
+import importlib.util
+import os
+from pathlib import Path
+from typing import Any, Callable, Sequence, Tuple
+
+RENDER_VERSION = 1
+"""Bump whenever a change to the rendering code alters its output pixels."""
+
+RenderTask = Tuple[str, int, str]
+"""``(source path, size in pixels, destination path)``."""
+
+_VECTOR_SUFFIXES = {".svg", ".svgz"}
+# Rendering parameters; all of them are part of render_fingerprint().
+_OUTPUT_FORMAT = "PNG"
+_CANVAS_FORMAT = "Format_ARGB32_Premultiplied"
+_RENDER_HINTS = ("Antialiasing", "SmoothPixmapTransform")
+_application: Any = None
+
+
+def rendering_available() -> bool:
+    """Return True when the Qt modules needed for rendering are importable."""
+    return importlib.util.find_spec("PySide6") is not None
+
+
+def render_fingerprint() -> str:
+    """Return a short digest of everything besides source and size that shapes a render.
+
+    Covers :data:`RENDER_VERSION`, the canvas and output formats, the painter
+    hints and the installed PySide6 release, whose SVG renderer and image
+    scaler change between versions.
+    """
+
+    import hashlib
+    import importlib.metadata
+
+    try:
+        qt_version = importlib.metadata.version("PySide6")
+    except importlib.metadata.PackageNotFoundError:
+        qt_version = ""
+    text = "|".join((str(RENDER_VERSION), _OUTPUT_FORMAT, _CANVAS_FORMAT, *_RENDER_HINTS, qt_version))
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:12]
+
+
+def render_many(
+    tasks: Sequence[RenderTask],
+    workers: int = 1,
+    *,
+    done: Callable[[int], None] | None = None,
+    cancelled: Callable[[], bool] | None = None,
+) -> None:
+    """Render every task, spreading the work over ``workers`` processes.
+
+    Worker processes are spawned (not forked) so rendering is safe to start
+    from a running Qt application. ``done`` is called on the calling thread
+    with each task's index once it is rendered. ``cancelled`` is polled
+    between tasks; when it returns True the remaining tasks are dropped and
+    the function returns early.
+    """
+
+    if not tasks:
+        return
+    if not rendering_available():
+        raise RuntimeError("Rendering icon sizes requires PySide6 with the QtSvg module")
+    if workers <= 1 or len(tasks) < 2:
+        for index, task in enumerate(tasks):
+            if cancelled is not None and cancelled():
+                return
+            render_icon(*task)
+            if done is not None:
+                done(index)
+        return
+
+    # Imported here: the process pool machinery is only needed for pooled renders.
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    context = multiprocessing.get_context("spawn")
+    chunksize = max(1, len(tasks) // (workers * 8))
+    executor = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+    try:
+        for index, _ in enumerate(executor.map(_render_task, tasks, chunksize=chunksize)):
+            if done is not None:
+                done(index)
+            if cancelled is not None and cancelled():
+                break
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def render_icon(source: str, size: int, destination: str) -> None:
+    """Render ``source`` as a ``size``x``size`` PNG written to ``destination``."""
+
+    image = render_image(Path(source), size)
+    if not image.save(destination, _OUTPUT_FORMAT):
+        raise OSError(f"Unable to write rendered icon: {destination}")
+
+
+def _render_task(task: RenderTask) -> None:
+    render_icon(*task)
+
+
+def render_image(source: Path, size: int) -> Any:
+    """Return ``source`` rendered into a transparent ``size``x``size`` ``QImage``.
+
+    ``QImage`` painting is thread-safe, so this may run on worker threads.
+    """
+
+    _ensure_gui_application()
+    from PySide6.QtCore import QRectF, Qt
+    from PySide6.QtGui import QImage, QPainter
+
+    canvas = QImage(size, size, getattr(QImage.Format, _CANVAS_FORMAT))
+    canvas.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(canvas)
+    for hint in _RENDER_HINTS:
+        painter.setRenderHint(getattr(QPainter.RenderHint, hint))
+    try:
+        if source.suffix.lower() in _VECTOR_SUFFIXES:
+            from PySide6.QtSvg import QSvgRenderer
+
+            renderer = QSvgRenderer(str(source))
+            if not renderer.isValid():
+                raise ValueError(f"Unable to read SVG artwork: {source}")
+            renderer.setAspectRatioMode(Qt.AspectRatioMode.KeepAspectRatio)
+            renderer.render(painter, QRectF(0, 0, size, size))
+        else:
+            original = QImage(str(source))
+            if original.isNull():
+                raise ValueError(f"Unable to read image artwork: {source}")
+            scaled = original.scaled(
+                size,
+                size,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+            painter.drawImage((size - scaled.width()) // 2, (size - scaled.height()) // 2, scaled)
+    finally:
+        painter.end()
+    return canvas
+
+
+def _ensure_gui_application() -> None:
+    """Create an offscreen QGuiApplication unless one is already running."""
+
+    global _application
+    from PySide6.QtGui import QGuiApplication
+
+    if QGuiApplication.instance() is None:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        _application = QGuiApplication([])
+
@@ -0,0 +1,67 @@
+"""Content-addressed cache of rasterized icon sizes."""
+from __future__ import annotations
+
+import contextlib
+import os
+from pathlib import Path
+from typing import Tuple
+
+from .disk_budget import DiskBudget
+from .rasterize import render_fingerprint
+from .utils import ensure_directory, user_cache_dir
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+class RenderCache:
+    """PNG renders stored by source digest, target size and render parameters.
+
+    Entries live under ``<user cache>/renders``. A hit refreshes the entry's
+    mtime, and :meth:`prune` evicts the least recently used files once the
+    cache grows beyond ``max_bytes`` (see :class:`DiskBudget`).
+    """
+
+    def __init__(self, cache_dir: Path | None = None, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self._root = (cache_dir or user_cache_dir()) / "renders"
+        self._fingerprint = render_fingerprint()
+        self._budget = DiskBudget(self._root, max_bytes)
+
+    def path_for(self, digest: str, size: int) -> Path:
+        key = f"{digest}-{size}-{self._fingerprint}"
+        return self._root / key[:2] / f"{key}.png"
+
+    def lookup(self, digest: str, size: int) -> Path | None:
+        """Return the cached render for ``(digest, size)`` and mark it as recently used."""
+
+        path = self.path_for(digest, size)
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def reserve(self, digest: str, size: int) -> Tuple[Path, Path]:
+        """Return ``(temporary path, final path)`` for a render about to be produced.
+
+        Render into the temporary path and pass both to :meth:`commit`, so
+        concurrent exports never observe a partially written file.
+        """
+
+        path = self.path_for(digest, size)
+        ensure_directory(path.parent)
+        return path.with_name(f".{path.stem}.{os.getpid()}.tmp"), path
+
+    def commit(self, temporary: Path, path: Path) -> None:
+        with contextlib.suppress(OSError):
+            self._budget.add(temporary.stat().st_size)
+        os.replace(temporary, path)
+
+    def record_usage(self) -> None:
+        """Add the bytes committed since the last call to the cache's usage ledger."""
+
+        self._budget.record()
+
+    def prune(self) -> int:
+        """Evict least recently used renders until the cache fits; return files removed."""
+
+        return self._budget.prune()
@@ -0,0 +1,318 @@
+"""In-memory fuzzy search for filtering large icon lists."""
+from __future__ import annotations
+
+import threading
+from typing import Iterable, List, Sequence, Tuple
+
+from .models import IconDefinition
+
+SearchFields = Tuple[str, str, str]
+"""``(name, category, source file stem)`` of one searchable icon."""
+
+# Scoring weights for FuzzyMatcher. Only their relative size matters.
+_MATCH_SCORE = 1.0
+_CONSECUTIVE_BONUS = 2.0
+_BOUNDARY_BONUS = 3.0
+_PREFIX_BONUS = 4.0
+_EXACT_BONUS = 8.0
+_GAP_PENALTY = 1.0
+_LENGTH_PENALTY = 0.01
+_FIELD_WEIGHTS = (1.0, 0.6, 0.9)
+_SEPARATORS = frozenset(" -_./")
+
+
+class FuzzyMatcher:
+    """Ranked subsequence search over icon names, categories and source stems.
+
+    A query matches an icon when its characters appear in order in one of the
+    fields. Matches earn bonuses for consecutive runs, word boundaries
+    (separators and camelCase humps) and a match at the very start; gaps and
+    long fields cost a little. The name field weighs most, then the source
+    stem, then the category.
+
+    Each icon's lowercased fields and a bitmask of their characters are
+    computed once, so most non-matching icons are rejected with one integer
+    test, and a contiguous match in a field without camelCase humps is scored
+    without looking at its characters. A query that extends the previous one
+    (the usual case while typing) only re-scores the previous matches.
+
+    :meth:`update`, :meth:`remove` and :meth:`extend` keep the index in step
+    with edits to the icon list. They may be called while another thread
+    searches; that search sees the icons as they were when it started.
+    """
+
+    def __init__(self, entries: Sequence[SearchFields] = ()) -> None:
+        self._lock = threading.Lock()
+        self._texts: List[SearchFields] = []
+        self._humps: List[Tuple[str | None, ...] | None] = []
+        self._masks: List[int] = []
+        self._generation = 0
+        self._last_query = ""
+        self._last_rows: List[int] = []
+        self.rebuild(entries)
+
+    @classmethod
+    def for_icons(cls, icons: Iterable[IconDefinition]) -> "FuzzyMatcher":
+        return cls([search_fields(icon) for icon in icons])
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def rebuild(self, entries: Sequence[SearchFields]) -> None:
+        """Index ``entries``; row ``i`` of the index is ``entries[i]``."""
+
+        texts, humps, masks = _index_entries(entries)
+        with self._lock:
+            self._texts, self._humps, self._masks = texts, humps, masks
+            self._generation += 1
+            self._last_query = ""
+            self._last_rows = []
+
+    def update(self, row: int, entry: SearchFields) -> None:
+        """Re-index ``row`` after its icon was renamed or its source changed."""
+
+        (texts,), (humps,), (mask,) = _index_entries([entry])
+        with self._lock:
+            # Replace rather than mutate the lists: a concurrent search keeps its snapshot.
+            self._texts = self._texts.copy()
+            self._humps = self._humps.copy()
+            self._masks = self._masks.copy()
+            self._texts[row], self._humps[row], self._masks[row] = texts, humps, mask
+            self._generation += 1
+            if self._last_query and row not in self._last_rows:
+                self._last_rows = self._last_rows + [row]
+
+    def remove(self, row: int) -> None:
+        """Drop ``row``; later rows move up by one, as in the icon list."""
+
+        with self._lock:
+            self._texts = self._texts[:row] + self._texts[row + 1:]
+            self._humps = self._humps[:row] + self._humps[row + 1:]
+            self._masks = self._masks[:row] + self._masks[row + 1:]
+            self._generation += 1
+            self._last_rows = [value - 1 if value > row else value for value in self._last_rows if value != row]
+
+    def extend(self, entries: Sequence[SearchFields]) -> None:
+        """Index ``entries`` as new rows after the existing ones."""
+
+        texts, humps, masks = _index_entries(entries)
+        with self._lock:
+            first = len(self._texts)
+            self._texts = self._texts + texts
+            self._humps = self._humps + humps
+            self._masks = self._masks + masks
+            self._generation += 1
+            if self._last_query:
+                self._last_rows = self._last_rows + list(range(first, len(self._texts)))
+
+    def search(self, query: str) -> List[Tuple[int, float]] | None:
+        """Return ``(row, score)`` pairs, best first, or ``None`` for an empty query."""
+
+        query = query.strip().lower()
+        with self._lock:
+            if not query:
+                self._last_query = ""
+                return None
+            all_texts, all_humps, masks = self._texts, self._humps, self._masks
+            generation = self._generation
+            if self._last_query and query.startswith(self._last_query):
+                candidates: Iterable[int] = self._last_rows
+            else:
+                candidates = range(len(all_texts))
+
+        query_mask = _char_mask(query)
+        size = len(query)
+        # Score of a contiguous match before its first character's boundary bonus.
+        run_score = (
+            _MATCH_SCORE * size
+            + _CONSECUTIVE_BONUS * (size - 1)
+            + _BOUNDARY_BONUS * sum(char in _SEPARATORS for char in query[:-1])
+        )
+        matches: List[Tuple[int, float]] = []
+        for row in candidates:
+            if query_mask & ~masks[row]:
+                continue
+            humps = all_humps[row]
+            best: float | None = None
+            for index, text in enumerate(all_texts[row]):
+                score = _field_score(query, run_score, text, humps[index] if humps is not None else None)
+                if score is not None:
+                    score *= _FIELD_WEIGHTS[index]
+                    if best is None or score > best:
+                        best = score
+            if best is not None:
+                matches.append((row, best))
+
+        rows = [row for row, _score in matches]
+        with self._lock:
+            if generation == self._generation:
+                self._last_query, self._last_rows = query, rows
+            else:
+                self._last_query = ""  # the icons changed meanwhile; the next search starts over
+        matches.sort(key=lambda match: (-match[1], match[0]))
+        return matches
+
+
+def search_fields(icon: IconDefinition) -> SearchFields:
+    """Return the fields :class:`FuzzyMatcher` searches for ``icon``."""
+
+    stem = icon.source_path.stem if icon.source_path is not None else ""
+    return icon.name, icon.category or "", stem
+
+
+class _CharBits(dict):
+    """Bit of each character in :func:`_char_mask`, filled in on first use."""
+
+    def __missing__(self, char: str) -> int:
+        if "a" <= char <= "z":
+            bit = 1 << (ord(char) - 97)
+        elif "0" <= char <= "9":
+            bit = 1 << (ord(char) - 22)
+        else:
+            bit = 1 << (36 + ord(char) % 28)
+        self[char] = bit
+        return bit
+
+
+_CHAR_BITS = _CharBits()
+
+
+def _char_mask(text: str) -> int:
+    mask = 0
+    for bit in map(_CHAR_BITS.__getitem__, set(text)):
+        mask |= bit
+    return mask
+
+
+def _index_entries(
+    entries: Sequence[SearchFields],
+) -> Tuple[List[SearchFields], List[Tuple[str | None, ...] | None], List[int]]:
+    """Return the lowercased fields, camelCase sources and character masks of ``entries``."""
+
+    all_texts: List[SearchFields] = []
+    all_humps: List[Tuple[str | None, ...] | None] = []
+    masks: List[int] = []
+    for name, category, stem in entries:
+        texts = (name.lower(), category.lower(), stem.lower())
+        all_texts.append(texts)
+        masks.append(_char_mask("".join(texts)))
+        humps = None
+        for index, (original, text) in enumerate(zip((name, category, stem), texts)):
+            if original == text and text.islower():
+                continue  # no uppercase letters, so no humps
+            # A few characters change length when lowercased; keep positions aligned.
+            source = original if len(original) == len(text) else text
+            if any(before.islower() and char.isupper() for before, char in zip(source, source[1:])):
+                if humps is None:
+                    humps = [None, None, None]
+                humps[index] = source
+        all_humps.append(tuple(humps) if humps is not None else None)
+    return all_texts, all_humps, masks
+
+
+def _field_score(query: str, run_score: float, text: str, humps: str | None) -> float | None:
+    """Score the best alignment of ``query`` in ``text``, or ``None`` if absent.
+
+    ``humps`` is the original spelling of a field with camelCase humps, which
+    earn boundary bonuses; it is ``None`` for every other field.
+    ``run_score`` is the query's contiguous-match score from the search.
+    """
+
+    size = len(query)
+    if size > len(text):
+        return None
+
+    # A contiguous occurrence is preferred over any scattered alignment.
+    score: float | None = None
+    if humps is None:
+        # Boundaries only follow separators, so inside an occurrence they are
+        # fixed by the query; occurrences differ only in their first character.
+        if text.startswith(query):
+            score = run_score + _BOUNDARY_BONUS + _PREFIX_BONUS
+        else:
+            start = text.find(query)
+            if start >= 0:
+                score = run_score
+                while start >= 0:
+                    if text[start - 1] in _SEPARATORS:
+                        score += _BOUNDARY_BONUS
+                        break
+                    start = text.find(query, start + 1)
+    else:
+        start = text.find(query)
+        if start >= 0:
+            bonuses = _bonuses(text, humps)
+            best = sum(bonuses[start:start + size])
+            start = text.find(query, start + 1)
+            while start >= 0:
+                best = max(best, sum(bonuses[start:start + size]))
+                start = text.find(query, start + 1)
+            score = best + _CONSECUTIVE_BONUS * (size - 1)
+
+    if score is None:
+        cursor = -1
+        for char in query:
+            cursor = text.find(char, cursor + 1)
+            if cursor < 0:
+                return None
+        score = _subsequence_score(query, text, _bonuses(text, humps))
+
+    if size == len(text):
+        score += _EXACT_BONUS
+    return score - _LENGTH_PENALTY * (len(text) - size)
+
+
+def _bonuses(text: str, humps: str | None) -> List[float]:
+    """Per-position match scores of ``text``, boundary bonuses included."""
+
+    if humps is not None:
+        return [_MATCH_SCORE + _position_bonus(humps, index) for index in range(len(humps))]
+    after_separator = _MATCH_SCORE + _BOUNDARY_BONUS
+    bonuses = [after_separator if before in _SEPARATORS else _MATCH_SCORE for before in text[:-1]]
+    bonuses.insert(0, after_separator + _PREFIX_BONUS)
+    return bonuses
+
+
+def _subsequence_score(query: str, text: str, bonuses: List[float]) -> float:
+    """Best-scoring scattered alignment of a query known to be a subsequence.
+
+    Dynamic programming over positions: ``previous[j]`` holds the best score
+    of the query prefix so far with its last character at position ``j``; each
+    step either extends a consecutive run or jumps a gap from the best earlier
+    position.
+    """
+
+    length = len(text)
+    previous: List[float | None] = [
+        bonuses[position] if char == query[0] else None for position, char in enumerate(text)
+    ]
+    for char in query[1:]:
+        current: List[float | None] = [None] * length
+        before_gap: float | None = None
+        for position in range(1, length):
+            if position >= 2:
+                candidate = previous[position - 2]
+                if candidate is not None and (before_gap is None or candidate > before_gap):
+                    before_gap = candidate
+            if text[position] != char:
+                continue
+            adjacent = previous[position - 1]
+            best: float | None = None
+            if adjacent is not None:
+                best = adjacent + _CONSECUTIVE_BONUS
+            if before_gap is not None and (best is None or before_gap - _GAP_PENALTY > best):
+                best = before_gap - _GAP_PENALTY
+            if best is not None:
+                current[position] = best + bonuses[position]
+        previous = current
+
+    return max(score for score in previous if score is not None)
+
+
+def _position_bonus(text: str, position: int) -> float:
+    if position == 0:
+        return _BOUNDARY_BONUS + _PREFIX_BONUS
+    before = text[position - 1]
+    if before in _SEPARATORS or (before.islower() and text[position].isupper()):
+        return _BOUNDARY_BONUS
+    return 0.0
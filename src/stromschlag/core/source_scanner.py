@@ -0,0 +1,216 @@
+"""Discover project files and icon artwork in folders opened as projects."""
+from __future__ import annotations
+
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from .project_io import PROJECT_FILENAME
+
+_ALLOWED_SUFFIXES = {".png", ".svg", ".svgz"}
+_VECTOR_SUFFIXES = {".svg", ".svgz"}
+_PREFERRED_CATEGORIES = {"apps", "mimetypes"}
+
+# Folders that only ever hold artwork; a project file is never searched below them.
+_ASSET_DIRECTORIES = frozenset(
+    {
+        "scalable",
+        "symbolic",
+        "actions",
+        "apps",
+        "categories",
+        "devices",
+        "emblems",
+        "emotes",
+        "mimetypes",
+        "panel",
+        "places",
+        "status",
+        "system",
+        "ui",
+    }
+)
+_SIZE_DIRECTORY = re.compile(r"\d+x\d+(@\d+x?)?")
+
+IconSource = Tuple[str, Path, str | None]
+"""``(icon name, artwork path, category)``; the category is the parent folder's name."""
+
+# name -> (weight, path parts below the scanned folder, path, category)
+_Winners = Dict[str, Tuple[int, Tuple[str, ...], str, str | None]]
+
+
+def scan_icon_sources(
+    directory: Path,
+    workers: int | None = None,
+    cancelled: Callable[[], bool] | None = None,
+) -> List[IconSource]:
+    """Return one artwork file per icon name found below ``directory``, sorted by name.
+
+    When several files share a name, the lowest weight wins: vectors beat
+    bitmaps, files under a ``scalable`` folder beat sized ones, and ``apps``
+    or ``mimetypes`` folders beat other categories. Ties go to the path that
+    sorts first. The folder is walked with :func:`os.scandir`, one top-level
+    subtree per thread, and each subtree keeps its own winners, which are
+    merged at the end. Symlinked folders are not followed. ``cancelled`` is
+    polled once per folder; a cancelled scan returns an empty list.
+    """
+
+    lowered = {part.lower() for part in directory.parts}
+    base_flags = ("scalable" in lowered, not lowered.isdisjoint(_PREFERRED_CATEGORIES))
+    try:
+        with os.scandir(directory) as iterator:
+            top_level = list(iterator)
+    except OSError:
+        return []
+
+    winners: _Winners = {}
+    subtrees: List[os.DirEntry[str]] = []
+    for entry in top_level:
+        if _is_directory(entry):
+            subtrees.append(entry)
+        else:
+            _consider(entry, (), None, base_flags, winners)
+
+    if len(subtrees) > 1 and workers != 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_scan_subtree, subtrees, repeat(base_flags), repeat(cancelled)))
+    else:
+        results = [_scan_subtree(subtree, base_flags, cancelled) for subtree in subtrees]
+
+    if cancelled is not None and cancelled():
+        return []
+    for result in results:
+        for name, candidate in result.items():
+            existing = winners.get(name)
+            if existing is None or candidate[:2] < existing[:2]:
+                winners[name] = candidate
+    return [(name, Path(winners[name][2]), winners[name][3]) for name in sorted(winners)]
+
+
+def find_project_descriptor(
+    directory: Path,
+    max_depth: int = 4,
+    max_directories: int = 5000,
+    cancelled: Callable[[], bool] | None = None,
+) -> Path | None:
+    """Return the ``stromschlag.yaml`` closest to ``directory``, or ``None``.
+
+    The folder itself may also hold a capitalised ``Stromschlag.yaml``.
+    Below it the search is breadth first, in name order, and stops at the
+    first match, ``max_depth`` folders down or after ``max_directories``
+    folders, so opening a home directory by mistake stays cheap. Hidden and
+    symlinked folders are skipped, as are icon asset folders (``NxN``,
+    ``scalable`` and the category names). ``cancelled`` is polled once per
+    folder.
+    """
+
+    top_level = top_level_descriptor(directory)
+    if top_level is not None:
+        return top_level
+
+    level = [str(directory)]
+    visited = 0
+    for _depth in range(max_depth + 1):
+        next_level: List[str] = []
+        for current in level:
+            if visited >= max_directories or (cancelled is not None and cancelled()):
+                return None
+            visited += 1
+            try:
+                with os.scandir(current) as iterator:
+                    children = sorted(iterator, key=lambda entry: entry.name)
+            except OSError:
+                continue
+            for entry in children:
+                if _is_directory(entry):
+                    if not entry.name.startswith(".") and not _is_asset_directory(entry.name):
+                        next_level.append(entry.path)
+                elif current != str(directory) and entry.name == PROJECT_FILENAME:
+                    return Path(entry.path)
+        level = next_level
+    return None
+
+
+def top_level_descriptor(directory: Path) -> Path | None:
+    """Return the project file stored directly in ``directory``, or ``None``.
+
+    It takes precedence over any project file further down, including one
+    remembered from an earlier search.
+    """
+
+    for name in (PROJECT_FILENAME, PROJECT_FILENAME.capitalize()):
+        candidate = directory / name
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _is_asset_directory(name: str) -> bool:
+    lowered = name.lower()
+    return lowered in _ASSET_DIRECTORIES or _SIZE_DIRECTORY.fullmatch(lowered) is not None
+
+
+def _scan_subtree(
+    root: os.DirEntry[str],
+    base_flags: Tuple[bool, bool],
+    cancelled: Callable[[], bool] | None,
+) -> _Winners:
+    winners: _Winners = {}
+    stack = [(root.path, (root.name,), _flags(base_flags, root.name))]
+    while stack:
+        directory, parts, flags = stack.pop()
+        if cancelled is not None and cancelled():
+            break
+        try:
+            with os.scandir(directory) as iterator:
+                children = list(iterator)
+        except OSError:
+            continue
+        for entry in children:
+            if _is_directory(entry):
+                stack.append((entry.path, parts + (entry.name,), _flags(flags, entry.name)))
+            else:
+                _consider(entry, parts, parts[-1], flags, winners)
+    return winners
+
+
+def _consider(
+    entry: os.DirEntry[str],
+    parts: Tuple[str, ...],
+    category: str | None,
+    flags: Tuple[bool, bool],
+    winners: _Winners,
+) -> None:
+    name, suffix = os.path.splitext(entry.name)
+    suffix = suffix.lower()
+    if suffix not in _ALLOWED_SUFFIXES:
+        return
+    try:
+        if not entry.is_file():
+            return
+    except OSError:
+        return
+    in_scalable, in_preferred = flags
+    weight = (suffix not in _VECTOR_SUFFIXES) + 2 * (not in_scalable) + (not in_preferred)
+    existing = winners.get(name)
+    if existing is not None and existing[0] < weight:
+        return
+    file_parts = parts + (entry.name,)
+    if existing is not None and existing[0] == weight and existing[1] <= file_parts:
+        return
+    winners[name] = (weight, file_parts, entry.path, category)
+
+
+def _flags(parent: Tuple[bool, bool], name: str) -> Tuple[bool, bool]:
+    lowered = name.lower()
+    return parent[0] or lowered == "scalable", parent[1] or lowered in _PREFERRED_CATEGORIES
+
+
+def _is_directory(entry: os.DirEntry[str]) -> bool:
+    try:
+        return entry.is_dir(follow_symlinks=False)
+    except OSError:
+        return False
@@ -0,0 +1,76 @@
+"""Persistent on-disk index of installed icon theme contents."""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+from .utils import atomic_write_text, user_cache_dir
+
+_INDEX_VERSION = 1
+
+
+class ThemeIndexCache:
+    """Stores the icon entries of scanned themes below the user cache directory.
+
+    Every index records the ``st_mtime_ns`` of each directory that was walked.
+    Adding, removing or renaming an icon touches its parent directory, so an
+    index is reused only while all recorded directory mtimes still match -
+    the same invalidation rule GTK applies to ``icon-theme.cache``.
+    """
+
+    def __init__(self, cache_dir: Path | None = None) -> None:
+        self._root = (cache_dir or user_cache_dir()) / "themes"
+
+    def load(self, theme_root: Path) -> List[Tuple[str, Path, str]] | None:
+        """Return the cached entries for ``theme_root`` or ``None`` when stale."""
+
+        try:
+            data = json.loads(self._index_path(theme_root).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("version") != _INDEX_VERSION:
+            return None
+        if data.get("root") != str(theme_root):
+            return None
+
+        directories = data.get("directories") or {}
+        try:
+            for relative, mtime_ns in directories.items():
+                if os.stat(theme_root / relative).st_mtime_ns != mtime_ns:
+                    return None
+        except OSError:
+            return None
+
+        return [
+            (name, theme_root / relative, category)
+            for name, relative, category, _suffix in data.get("entries", [])
+        ]
+
+    def store(
+        self,
+        theme_root: Path,
+        entries: Sequence[Tuple[str, Path, str]],
+        directories: Dict[str, int],
+    ) -> None:
+        """Persist ``entries`` together with the directory mtimes seen while scanning."""
+
+        payload = {
+            "version": _INDEX_VERSION,
+            "root": str(theme_root),
+            "directories": directories,
+            "entries": [
+                [name, path.relative_to(theme_root).as_posix(), category, path.suffix]
+                for name, path, category in entries
+            ],
+        }
+        try:
+            atomic_write_text(self._index_path(theme_root), json.dumps(payload, separators=(",", ":")))
+        except OSError:
+            pass
+
+    def _index_path(self, theme_root: Path) -> Path:
+        digest = hashlib.sha1(str(theme_root).encode("utf-8", "surrogateescape")).hexdigest()
+        return self._root / f"{digest}.json"
@@ -1,11 +1,14 @@
 """Helpers for seeding new projects from installed icon themes."""
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Sequence, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
 
+from .gtk_icon_cache import CACHE_FILENAME, HAS_SUFFIX_PNG, HAS_SUFFIX_SVG, GtkIconCache
 from .models import IconDefinition
+from .theme_cache import ThemeIndexCache
 
 _SYSTEM_ICON_DIRS = [
     Path.home() / ".local/share/icons",
@@ -39,6 +42,17 @@ class BlueprintLoadResult:
     needs_selection: bool
 
 
+@dataclass(slots=True)
+class IconBatch:
+    """Icons yielded by :func:`iter_icon_batches`.
+
+    With ``replace`` the icons supersede everything yielded before.
+    """
+
+    icons: List[IconDefinition]
+    replace: bool = False
+
+
 @dataclass(slots=True)
 class ThemeCandidate:
     """Represents an installed icon theme that can seed a project."""
@@ -57,7 +71,7 @@ def load_icon_blueprint(
     themes = preferred_themes or _PREFERRED_THEMES
     root = _discover_theme_root(themes, extra_search_paths)
     if root:
-        entries = _collect_icon_entries(root, limit)
+        entries = _theme_entries(root, limit)
         if entries:
             return BlueprintLoadResult(
                 icons=_build_icon_definitions(entries),
@@ -68,10 +82,46 @@ def load_icon_blueprint(
 
 
 def load_icons_from_directory(theme_root: Path, limit: int | None = None) -> List[IconDefinition]:
-    entries = _collect_icon_entries(theme_root, limit)
+    entries = _theme_entries(theme_root, limit)
     return _build_icon_definitions(entries)
 
 
+def iter_icon_batches(
+    theme_root: Path,
+    batch_size: int = 500,
+    limit: int | None = None,
+    cancelled: Callable[[], bool] | None = None,
+) -> Iterator[IconBatch]:
+    """Yield the icons of ``theme_root`` in batches of at most ``batch_size``.
+
+    Themes listed in a fresh GTK or index cache come out in their final
+    order. Otherwise icons are yielded as the walk finds them, one per name,
+    and once the walk is done a single ``replace`` batch carries the ranked
+    list if it differs from what was yielded. ``cancelled`` is polled while
+    the theme is scanned and between batches; iteration stops as soon as it
+    returns True.
+    """
+
+    entries = _cached_theme_entries(theme_root, limit)
+    if entries is None:
+        yield from _walk_icon_batches(theme_root, batch_size, limit, cancelled)
+        return
+    for start in range(0, len(entries), batch_size):
+        if cancelled is not None and cancelled():
+            return
+        yield IconBatch(_build_icon_definitions(entries[start : start + batch_size]))
+
+
+def suggest_base_theme(
+    preferred_themes: Sequence[str] | None = None,
+    extra_search_paths: Iterable[Path] | None = None,
+) -> str | None:
+    """Return the name of the first installed preferred theme without scanning it."""
+
+    root = _discover_theme_root(preferred_themes or _PREFERRED_THEMES, extra_search_paths)
+    return root.name if root else None
+
+
 def list_installed_themes(
     extra_search_paths: Iterable[Path] | None = None,
 ) -> List[ThemeCandidate]:
@@ -117,23 +167,189 @@ def _discover_theme_root(
     return None
 
 
-def _collect_icon_entries(theme_root: Path, limit: int | None) -> List[Tuple[str, Path, str]]:
+def _theme_entries(
+    theme_root: Path,
+    limit: int | None,
+    cancelled: Callable[[], bool] | None = None,
+) -> List[Tuple[str, Path, str]]:
+    entries = _cached_theme_entries(theme_root, limit)
+    if entries is not None:
+        return entries
+    directories: Dict[str, int] = {}
+    entries = _collect_icon_entries(theme_root, None, directories, cancelled)
+    if cancelled is not None and cancelled():
+        return []
+    ThemeIndexCache().store(theme_root, entries, directories)
+    return entries if limit is None else entries[:limit]
+
+
+def _cached_theme_entries(theme_root: Path, limit: int | None) -> List[Tuple[str, Path, str]] | None:
+    entries = _entries_from_gtk_cache(theme_root, limit)
+    if entries is None:
+        entries = ThemeIndexCache().load(theme_root)
+        if entries is not None and limit is not None:
+            entries = entries[:limit]
+    return entries
+
+
+def _walk_icon_batches(
+    theme_root: Path,
+    batch_size: int,
+    limit: int | None,
+    cancelled: Callable[[], bool] | None,
+) -> Iterator[IconBatch]:
+    directories: Dict[str, int] = {}
+    buckets: List[List[Tuple[Tuple[str, ...], str, Path]]] = [[] for _ in _ICON_SUBDIRS]
+    yielded: List[Tuple[str, Path, str]] = []
+    seen = set()
+    pending_from = 0
+    for rank, parts, path in _scan_theme_files(theme_root, directories, cancelled):
+        stem = path.stem
+        buckets[rank].append((parts, stem, path))
+        if stem in seen or (limit is not None and len(yielded) >= limit):
+            continue
+        seen.add(stem)
+        yielded.append((stem, path, _ICON_SUBDIRS[rank]))
+        if len(yielded) - pending_from >= batch_size:
+            yield IconBatch(_build_icon_definitions(yielded[pending_from:]))
+            pending_from = len(yielded)
+    if cancelled is not None and cancelled():
+        return
+    if pending_from < len(yielded):
+        yield IconBatch(_build_icon_definitions(yielded[pending_from:]))
+
+    # Names seen first in a lower ranked folder, and the order, are settled here.
+    entries = _merge_category_buckets(buckets, None)
+    ThemeIndexCache().store(theme_root, entries, directories)
+    if limit is not None:
+        entries = entries[:limit]
+    if entries != yielded:
+        yield IconBatch(_build_icon_definitions(entries), replace=True)
+
+
+def _collect_icon_entries(
+    theme_root: Path,
+    limit: int | None,
+    directories: Dict[str, int] | None = None,
+    cancelled: Callable[[], bool] | None = None,
+) -> List[Tuple[str, Path, str]]:
+    buckets: List[List[Tuple[Tuple[str, ...], str, Path]]] = [[] for _ in _ICON_SUBDIRS]
+    for rank, parts, path in _scan_theme_files(theme_root, directories, cancelled):
+        buckets[rank].append((parts, path.stem, path))
+    return _merge_category_buckets(buckets, limit)
+
+
+def _entries_from_gtk_cache(theme_root: Path, limit: int | None) -> List[Tuple[str, Path, str]] | None:
+    """Enumerate icons from the theme's ``icon-theme.cache`` when it is up to date.
+
+    The cache counts as fresh when it is at least as new as the theme root and
+    every directory it lists. Returns ``None`` so callers fall back to walking
+    the theme when the cache is missing, stale or unreadable.
+    """
+
+    cache_path = theme_root / CACHE_FILENAME
+    try:
+        cache_mtime = os.stat(cache_path).st_mtime_ns
+        if os.stat(theme_root).st_mtime_ns > cache_mtime:
+            return None
+        with GtkIconCache(cache_path) as cache:
+            directories = cache.directories
+            for directory in directories:
+                if os.stat(theme_root / directory).st_mtime_ns > cache_mtime:
+                    return None
+            parts = [tuple(directory.split("/")) for directory in directories]
+            ranks = [_category_rank(directory_parts) for directory_parts in parts]
+            buckets: List[List[Tuple[Tuple[str, ...], str, Path]]] = [[] for _ in _ICON_SUBDIRS]
+            for name, index, flags in cache.iter_images():
+                rank = ranks[index]
+                if rank is None:
+                    continue
+                for flag, suffix in ((HAS_SUFFIX_PNG, ".png"), (HAS_SUFFIX_SVG, ".svg")):
+                    if flags & flag:
+                        filename = f"{name}{suffix}"
+                        buckets[rank].append(
+                            (parts[index] + (filename,), name, theme_root / directories[index] / filename)
+                        )
+    except (OSError, ValueError):
+        return None
+    return _merge_category_buckets(buckets, limit)
+
+
+def _category_rank(parts: Sequence[str]) -> int | None:
+    ranks = [_ICON_SUBDIRS.index(part) for part in parts if part in _ICON_SUBDIRS]
+    return min(ranks) if ranks else None
+
+
+def _merge_category_buckets(
+    buckets: List[List[Tuple[Tuple[str, ...], str, Path]]], limit: int | None
+) -> List[Tuple[str, Path, str]]:
     entries: List[Tuple[str, Path, str]] = []
     seen = set()
-    for category in _ICON_SUBDIRS:
-        for suffix in _ALLOWED_SUFFIXES:
-            pattern = f"**/{category}/**/*{suffix}"
-            for path in theme_root.glob(pattern):
-                if not path.is_file():
+    for category, bucket in zip(_ICON_SUBDIRS, buckets):
+        bucket.sort(key=lambda item: item[0])
+        for _, stem, path in bucket:
+            if stem in seen:
+                continue
+            seen.add(stem)
+            entries.append((stem, path, category))
+            if limit is not None and len(entries) >= limit:
+                return entries
+    return entries
+
+
+def _scan_theme_files(
+    theme_root: Path,
+    directories: Dict[str, int] | None = None,
+    cancelled: Callable[[], bool] | None = None,
+) -> Iterator[Tuple[int, Tuple[str, ...], Path]]:
+    """Walk ``theme_root`` once and yield icon files below a category directory.
+
+    Each item is ``(category rank, relative path parts, path)``. A file nested
+    below several category directories is attributed to the one listed first in
+    ``_ICON_SUBDIRS``. Symlinked directories are only followed when they are
+    named after a category (and never below another followed link), mirroring
+    how the previous glob patterns behaved. When ``directories`` is given it is
+    filled with the ``st_mtime_ns`` of every walked directory, keyed by its
+    POSIX path relative to ``theme_root``. ``cancelled`` is polled once per
+    directory and ends the walk early when it returns True.
+    """
+
+    ranks = {name: index for index, name in enumerate(_ICON_SUBDIRS)}
+    stack: List[Tuple[str, Tuple[str, ...], int | None, bool]] = [(str(theme_root), (), None, False)]
+    while stack:
+        directory, parts, rank, via_link = stack.pop()
+        if cancelled is not None and cancelled():
+            return
+        try:
+            if directories is not None:
+                directories["/".join(parts) or "."] = os.stat(directory).st_mtime_ns
+            with os.scandir(directory) as iterator:
+                children = list(iterator)
+        except OSError:
+            continue
+        for entry in children:
+            name = entry.name
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+            if is_dir:
+                child_rank = ranks.get(name)
+                is_link = entry.is_symlink()
+                if is_link and (child_rank is None or via_link):
                     continue
-                stem = path.stem
-                if stem in seen:
+                if child_rank is None or (rank is not None and rank < child_rank):
+                    child_rank = rank
+                stack.append((entry.path, parts + (name,), child_rank, via_link or is_link))
+                continue
+            if rank is None or os.path.splitext(name)[1] not in _ALLOWED_SUFFIXES:
+                continue
+            try:
+                if not entry.is_file():
                     continue
-                seen.add(stem)
-                entries.append((stem, path, category))
-                if limit is not None and len(entries) >= limit:
-                    return entries
-    return entries
+            except OSError:
+                continue
+            yield rank, parts + (name,), Path(entry.path)
 
 
 def _build_icon_definitions(entries: Sequence[Tuple[str, Path, str]]) -> List[IconDefinition]:
@@ -1,12 +1,26 @@
 """Utility helpers used across the Stromschlag core modules."""
 from __future__ import annotations
 
+import contextlib
+import filecmp
+import hashlib
+import os
+from collections import OrderedDict
 from pathlib import Path
 import re
-from typing import Iterable, Tuple
+import stat
+import threading
+from typing import TYPE_CHECKING, Callable, Iterable, TextIO, Tuple
+
+if TYPE_CHECKING:
+    from .file_status import StatSnapshot
 
 
 _HEX_RE = re.compile(r"^#?(?P<value>[0-9a-fA-F]{6})$")
+# Most recently used digests; 64k entries take roughly 25 MB.
+_DIGEST_MEMO: OrderedDict[Tuple[str, int, int, int], str] = OrderedDict()
+_DIGEST_MEMO_SIZE = 65536
+_DIGEST_MEMO_LOCK = threading.Lock()
 
 
 def ensure_hex(color: str) -> str:
@@ -42,3 +56,143 @@ def ensure_directory(path: Path) -> None:
 def icon_filename(value: str) -> str:
     """Return a canonical filename for an icon (without directories)."""
     return f"{slugify(value)}.png"
+
+
+def user_cache_dir() -> Path:
+    """Return the Stromschlag cache directory, honoring ``$XDG_CACHE_HOME``."""
+    base = os.environ.get("XDG_CACHE_HOME", "")
+    root = Path(base) if os.path.isabs(base) else Path.home() / ".cache"
+    return root / "stromschlag"
+
+
+def _create_temporary(path: Path) -> Tuple[int, str]:
+    """Create a temporary file next to ``path``; return its descriptor and name.
+
+    ``tempfile.mkstemp`` would create it owner-only, and renaming it over
+    ``path`` would keep that. Instead the file gets ``path``'s current mode,
+    or the mode a plain ``open`` would give a new file under the umask.
+    """
+    try:
+        mode: int | None = stat.S_IMODE(os.stat(path).st_mode)
+    except OSError:
+        mode = None
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    while True:
+        temp_name = os.path.join(path.parent, f".{path.name}.{os.urandom(6).hex()}.tmp")
+        try:
+            fd = os.open(temp_name, flags, 0o666)
+        except FileExistsError:
+            continue
+        break
+    if mode is not None:
+        try:
+            os.chmod(temp_name, mode)
+        except BaseException:
+            os.close(fd)
+            os.unlink(temp_name)
+            raise
+    return fd, temp_name
+
+
+def atomic_write_text(path: Path, content: str) -> None:
+    """Write text to ``path`` through a temporary file that is renamed into place.
+
+    A new file gets the usual permissions; an existing one keeps its mode.
+    """
+    ensure_directory(path.parent)
+    fd, temp_name = _create_temporary(path)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(content)
+        os.replace(temp_name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(temp_name)
+        raise
+
+
+def atomic_write_bytes(path: Path, content: bytes) -> None:
+    """Binary counterpart of :func:`atomic_write_text`."""
+    ensure_directory(path.parent)
+    fd, temp_name = _create_temporary(path)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(content)
+        os.replace(temp_name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(temp_name)
+        raise
+
+
+def write_text_if_changed(path: Path, content: str) -> bool:
+    """Atomically write ``content`` unless ``path`` already holds it; return True if written."""
+    try:
+        if path.read_text(encoding="utf-8") == content:
+            return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    atomic_write_text(path, content)
+    return True
+
+
+def write_stream_if_changed(path: Path, write: Callable[[TextIO], None]) -> bool:
+    """Stream text from ``write`` into ``path`` atomically, unless it holds that text already.
+
+    The output goes to a temporary file first, so it is never held in memory
+    as a whole; an identical result is discarded and ``path`` keeps its
+    mtime. File modes are handled as in :func:`atomic_write_text`. Returns
+    True if ``path`` was replaced.
+    """
+    ensure_directory(path.parent)
+    fd, temp_name = _create_temporary(path)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            write(handle)
+        try:
+            unchanged = filecmp.cmp(temp_name, path, shallow=False)
+        except OSError:
+            unchanged = False
+        if unchanged:
+            os.unlink(temp_name)
+            return False
+        os.replace(temp_name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(temp_name)
+        raise
+    return True
+
+
+def file_digest(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    with open(path, "rb") as handle:
+        return hashlib.file_digest(handle, "sha256").hexdigest()
+
+
+def cached_file_digest(path: Path, file_status: StatSnapshot | None = None) -> str:
+    """Return :func:`file_digest`, memoized for this process.
+
+    Entries are keyed by path, inode, size and mtime, so an edited or
+    replaced file is hashed again. Packs exported in the same process (the
+    GUI session, or one worker of a batch build) share the memo, which keeps
+    the most recently used digests only. The key is taken from
+    ``file_status`` when given instead of a fresh ``os.stat``.
+    """
+    if file_status is not None and file_status.exists(path):
+        status = file_status.stat(path)
+        key = (str(path), status.inode, status.size, status.mtime_ns)
+    else:
+        stat = os.stat(path)
+        key = (str(path), stat.st_ino, stat.st_size, stat.st_mtime_ns)
+    with _DIGEST_MEMO_LOCK:
+        digest = _DIGEST_MEMO.get(key)
+        if digest is not None:
+            _DIGEST_MEMO.move_to_end(key)
+            return digest
+    digest = file_digest(path)
+    with _DIGEST_MEMO_LOCK:
+        _DIGEST_MEMO[key] = digest
+        while len(_DIGEST_MEMO) > _DIGEST_MEMO_SIZE:
+            _DIGEST_MEMO.popitem(last=False)
+    return digest
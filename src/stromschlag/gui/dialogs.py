@@ -0,0 +1,350 @@
+"""Dialogs used by the main window; imported on first use."""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable, List
+
+from PySide6.QtCore import Qt, QThreadPool
+from PySide6.QtWidgets import (
+    QCheckBox,
+    QComboBox,
+    QDialog,
+    QDialogButtonBox,
+    QFileDialog,
+    QFormLayout,
+    QHBoxLayout,
+    QLabel,
+    QListWidget,
+    QListWidgetItem,
+    QLineEdit,
+    QMessageBox,
+    QPlainTextEdit,
+    QProgressDialog,
+    QPushButton,
+    QVBoxLayout,
+    QWidget,
+)
+
+from ..core.models import IconDefinition, PackSettings
+from ..core.theme_loader import ThemeCandidate, list_installed_themes
+from .workers import ThemeLoadWorker
+
+
+class MetadataDialog(QDialog):
+    """Dialog that captures pack metadata for a project."""
+
+    def __init__(self, parent: QWidget | None, settings: PackSettings | None = None) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("Project metadata")
+        self._name_edit = QLineEdit(settings.name if settings else "")
+        self._author_edit = QLineEdit(settings.author if settings else "")
+        self._description_edit = QPlainTextEdit(settings.description if settings else "")
+        self._inherits_combo = QComboBox()
+        self._inherits_combo.addItems(["breeze", "papirus", "adwaita", "hicolor"])
+        if settings:
+            index = self._inherits_combo.findText(settings.inherits)
+            if index >= 0:
+                self._inherits_combo.setCurrentIndex(index)
+        self._sizes_edit = QLineEdit(
+            ",".join(str(size) for size in (settings.base_sizes if settings else [16, 24, 32, 48, 64, 128]))
+        )
+        self._output_dir_edit = QLineEdit(str(settings.output_dir if settings else Path("build")))
+        browse_button = QPushButton("Browse…")
+        browse_button.clicked.connect(self._select_output_directory)
+
+        self._gtk_checkbox = QCheckBox("GTK (GNOME, Cinnamon, Xfce)")
+        self._qt_checkbox = QCheckBox("Qt / KDE Plasma")
+        existing_targets = set(settings.targets if settings else ["gnome", "kde"])
+        self._gtk_checkbox.setChecked("gnome" in existing_targets)
+        self._qt_checkbox.setChecked("kde" in existing_targets)
+
+        form = QFormLayout(self)
+        form.addRow("Name", self._name_edit)
+        form.addRow("Author", self._author_edit)
+        form.addRow("Description", self._description_edit)
+        form.addRow("Inherits", self._inherits_combo)
+        form.addRow("Base sizes", self._sizes_edit)
+
+        output_row = QHBoxLayout()
+        output_row.addWidget(self._output_dir_edit)
+        output_row.addWidget(browse_button)
+        form.addRow("Output", output_row)
+
+        targets_widget = QWidget()
+        targets_layout = QVBoxLayout(targets_widget)
+        targets_layout.setContentsMargins(0, 0, 0, 0)
+        targets_layout.addWidget(self._gtk_checkbox)
+        targets_layout.addWidget(self._qt_checkbox)
+        form.addRow("Targets", targets_widget)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        buttons.accepted.connect(self._handle_accept)
+        buttons.rejected.connect(self.reject)
+        form.addWidget(buttons)
+
+        self._result: PackSettings | None = settings
+
+    @staticmethod
+    def prompt(parent: QWidget | None, settings: PackSettings | None) -> PackSettings | None:
+        dialog = MetadataDialog(parent, settings)
+        if dialog.exec() == QDialog.DialogCode.Accepted:
+            return dialog._result
+        return None
+
+    def _handle_accept(self) -> None:
+        name = self._name_edit.text().strip()
+        author = self._author_edit.text().strip()
+        if not name or not author:
+            QMessageBox.warning(self, "Missing fields", "Both name and author are required.")
+            return
+        sizes: List[int] = []
+        for chunk in self._sizes_edit.text().split(","):
+            chunk = chunk.strip()
+            if not chunk:
+                continue
+            try:
+                size = int(chunk)
+            except ValueError:
+                continue
+            if size > 0:
+                sizes.append(size)
+        if not sizes:
+            QMessageBox.warning(self, "Invalid sizes", "Provide at least one valid icon size.")
+            return
+        targets: List[str] = []
+        if self._gtk_checkbox.isChecked():
+            targets.append("gnome")
+        if self._qt_checkbox.isChecked():
+            targets.append("kde")
+        if not targets:
+            QMessageBox.warning(self, "Pick targets", "Select at least one target platform (GTK or Qt).")
+            return
+        self._result = PackSettings(
+            name=name,
+            author=author,
+            description=self._description_edit.toPlainText().strip(),
+            inherits=self._inherits_combo.currentText(),
+            base_sizes=sorted(set(sizes)),
+            output_dir=Path(self._output_dir_edit.text().strip() or "build"),
+            targets=targets,
+        )
+        self.accept()
+
+    def _select_output_directory(self) -> None:
+        directory = QFileDialog.getExistingDirectory(self, "Choose output directory")
+        if directory:
+            self._output_dir_edit.setText(directory)
+
+
+class BaseThemeDialog(QDialog):
+    """Dialog that captures the base theme, inherits value, and target platforms."""
+
+    def __init__(
+        self,
+        parent: QWidget | None = None,
+        default_theme: str | None = None,
+        extra_search_paths: Iterable[Path] | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("Choose base icon theme")
+        self.resize(560, 520)
+
+        self._themes: List[ThemeCandidate] = list_installed_themes(extra_search_paths)
+        self._list = QListWidget()
+        self._list.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
+        for candidate in self._themes:
+            item = QListWidgetItem(candidate.name)
+            item.setData(Qt.ItemDataRole.UserRole, candidate.path)
+            self._list.addItem(item)
+
+        intro = QLabel("Select one of your installed icon packs (or browse to a folder) to inherit from.")
+        intro.setWordWrap(True)
+
+        browse_button = QPushButton("Browse…")
+        browse_button.clicked.connect(self._browse_for_theme)
+
+        inherits_label = QLabel("Inherits")
+        self._inherits_edit = QLineEdit(default_theme or "breeze")
+
+        self._gtk_checkbox = QCheckBox("GTK (GNOME, Cinnamon, Xfce)")
+        self._qt_checkbox = QCheckBox("Qt / KDE Plasma")
+        self._gtk_checkbox.setChecked(True)
+        self._qt_checkbox.setChecked(True)
+
+        self._status_label = QLabel()
+        self._status_label.setStyleSheet("color: #666666;")
+        # Icons of the theme being loaded, filled in batch by batch.
+        self._icon_list = QListWidget()
+        self._icon_list.setSelectionMode(QListWidget.SelectionMode.NoSelection)
+        self._icon_list.setUniformItemSizes(True)
+        self._icon_list.hide()
+
+        button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        button_box.accepted.connect(self._handle_accept)
+        button_box.rejected.connect(self.reject)
+        self._ok_button = button_box.button(QDialogButtonBox.StandardButton.Ok)
+
+        inherits_row = QHBoxLayout()
+        inherits_row.addWidget(inherits_label)
+        inherits_row.addWidget(self._inherits_edit)
+
+        targets_widget = QWidget()
+        targets_layout = QVBoxLayout(targets_widget)
+        targets_layout.setContentsMargins(0, 0, 0, 0)
+        targets_layout.addWidget(self._gtk_checkbox)
+        targets_layout.addWidget(self._qt_checkbox)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(intro)
+        layout.addWidget(self._list)
+        layout.addWidget(browse_button, alignment=Qt.AlignmentFlag.AlignRight)
+        layout.addLayout(inherits_row)
+        layout.addWidget(targets_widget)
+        layout.addWidget(self._status_label)
+        layout.addWidget(self._icon_list)
+        layout.addWidget(button_box)
+
+        if self._list.count() > 0:
+            self._list.setCurrentRow(0)
+        if default_theme:
+            self._select_theme_by_name(default_theme)
+
+        self._selected_path: Path | None = None
+        self._result: tuple[List[IconDefinition], str, str, List[str]] | None = None
+        self._worker: ThemeLoadWorker | None = None
+        self._progress: QProgressDialog | None = None
+        self._pending: tuple[Path, str, List[str]] | None = None
+        self._loaded_icons: List[IconDefinition] = []
+
+    @staticmethod
+    def prompt(parent: QWidget | None = None, default_theme: str | None = None) -> tuple[List[IconDefinition], str, str, List[str]] | None:
+        dialog = BaseThemeDialog(parent, default_theme=default_theme)
+        if dialog.exec() == QDialog.DialogCode.Accepted:
+            return dialog._result
+        return None
+
+    def _select_theme_by_name(self, name: str) -> None:
+        for index in range(self._list.count()):
+            item = self._list.item(index)
+            if item.text().split(" (")[0].lower() == name.lower():
+                self._list.setCurrentRow(index)
+                if not self._inherits_edit.text().strip():
+                    self._inherits_edit.setText(name)
+                return
+
+    def _handle_accept(self) -> None:
+        path = self._resolve_selection()
+        if path is None:
+            QMessageBox.warning(self, "Select a theme", "Choose a theme from the list or browse to one.")
+            return
+        inherits_value = self._inherits_edit.text().strip() or path.name
+        targets: List[str] = []
+        if self._gtk_checkbox.isChecked():
+            targets.append("gnome")
+        if self._qt_checkbox.isChecked():
+            targets.append("kde")
+        if not targets:
+            QMessageBox.warning(self, "Pick targets", "Select at least one target platform (GTK or Qt).")
+            return
+        self._start_loading(path, inherits_value, targets)
+
+    def reject(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+        super().reject()
+
+    def _start_loading(self, path: Path, inherits_value: str, targets: List[str]) -> None:
+        if self._worker is not None:
+            return
+        self._pending = (path, inherits_value, targets)
+        self._loaded_icons = []
+        self._icon_list.clear()
+        self._icon_list.show()
+        self._status_label.setText(f"Scanning '{path.name}'…")
+        self._ok_button.setEnabled(False)
+
+        self._progress = QProgressDialog(f"Scanning '{path.name}'…", "Cancel", 0, 0, self)
+        self._progress.setWindowTitle("Loading theme")
+        self._progress.setWindowModality(Qt.WindowModality.WindowModal)
+        self._progress.setMinimumDuration(300)
+        self._progress.canceled.connect(self._cancel_loading)
+
+        worker = ThemeLoadWorker(path)
+        worker.signals.batch.connect(self._handle_icon_batch)
+        worker.signals.finished.connect(self._handle_load_finished)
+        worker.signals.failed.connect(self._handle_load_failed)
+        self._worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _cancel_loading(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+
+    def _handle_icon_batch(self, batch: List[IconDefinition], replace: bool) -> None:
+        if replace:
+            self._loaded_icons = batch
+            self._icon_list.clear()
+        else:
+            self._loaded_icons.extend(batch)
+        self._icon_list.addItems([icon.name for icon in batch])
+        message = f"Loaded {len(self._loaded_icons)} icons…"
+        self._status_label.setText(message)
+        if self._progress is not None:
+            self._progress.setLabelText(message)
+
+    def _finish_loading(self) -> None:
+        self._worker = None
+        if self._progress is not None:
+            self._progress.close()
+            self._progress.deleteLater()
+            self._progress = None
+        self._ok_button.setEnabled(True)
+
+    def _handle_load_failed(self, message: str) -> None:
+        self._finish_loading()
+        self._status_label.clear()
+        QMessageBox.warning(self, "Unable to load theme", message)
+
+    def _handle_load_finished(self, cancelled: bool) -> None:
+        self._finish_loading()
+        pending, self._pending = self._pending, None
+        if cancelled or pending is None:
+            self._status_label.setText("Loading cancelled.")
+            return
+        if not self._loaded_icons:
+            self._status_label.clear()
+            QMessageBox.warning(
+                self,
+                "No icons found",
+                "The selected folder does not contain any icon assets. Choose another theme.",
+            )
+            return
+
+        path, inherits_value, targets = pending
+        self._result = (self._loaded_icons, path.name, inherits_value, targets)
+        self.accept()
+
+    def _resolve_selection(self) -> Path | None:
+        item = self._list.currentItem()
+        if item is not None:
+            data = item.data(Qt.ItemDataRole.UserRole)
+            if isinstance(data, Path):
+                return data
+            if data:
+                return Path(str(data))
+        return self._selected_path
+
+    def _browse_for_theme(self) -> None:
+        directory = QFileDialog.getExistingDirectory(self, "Select icon theme folder", str(Path.home()))
+        if not directory:
+            return
+        path = Path(directory)
+        label = f"{path.name} ({path})"
+        item = QListWidgetItem(label)
+        item.setData(Qt.ItemDataRole.UserRole, path)
+        self._list.addItem(item)
+        self._list.setCurrentItem(item)
+        self._selected_path = path
+        if not self._inherits_edit.text().strip():
+            self._inherits_edit.setText(path.name)
+
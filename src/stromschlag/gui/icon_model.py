@@ -0,0 +1,368 @@
+"""Item model exposing project icons grouped by category."""
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Sequence, Set
+
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, QPersistentModelIndex, Qt
+from PySide6.QtGui import QIcon
+
+from ..core.models import IconDefinition
+from .thumbnails import ThumbnailKey, ThumbnailProvider
+
+IndexLike = QModelIndex | QPersistentModelIndex
+# Combined once: flags() runs for every row a view lays out, and enum "|" is slow in Python.
+_CATEGORY_FLAGS = Qt.ItemFlag.ItemIsEnabled
+_ICON_FLAGS = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemNeverHasChildren
+
+
+class _CategoryNode:
+    """One category: all of its icon rows in list order, and the rows on display.
+
+    ``shown`` is ``rows`` itself unless a search is applied.
+    """
+
+    __slots__ = ("key", "label", "sequence", "rows", "shown", "_positions")
+
+    def __init__(self, key: str, label: str, sequence: int) -> None:
+        self.key = key
+        self.label = label
+        self.sequence = sequence
+        self.rows: List[int] = []
+        self.shown = self.rows
+        self._positions: Dict[int, int] | None = None
+
+    def position(self, row: int) -> int:
+        """Return where icon ``row`` is displayed under this node, or -1."""
+
+        if self._positions is None:
+            self._positions = {value: index for index, value in enumerate(self.shown)}
+        return self._positions.get(row, -1)
+
+    def rows_changed(self) -> None:
+        self._positions = None
+
+
+class IconTreeModel(QAbstractItemModel):
+    """Two-level model over a list of icons: categories, then icons.
+
+    The model shares the icon list with its owner and performs structural
+    edits itself (:meth:`append_icon`, :meth:`append_icons`,
+    :meth:`remove_icon`), so views receive fine-grained
+    ``rowsInserted``/``rowsRemoved``/``dataChanged`` signals instead of a
+    full rebuild. Child rows carry their index into the icon
+    list under ``Qt.UserRole``. Decorations are requested lazily from the
+    :class:`ThumbnailProvider`, i.e. only for rows a view actually paints.
+
+    Icons are shown in list order unless :meth:`set_matches` applies a
+    search: then only matching icons and their categories are shown, best
+    match first. Applying or clearing a search is one model reset, which
+    views handle without asking about every hidden row.
+    """
+
+    def __init__(
+        self,
+        thumbnails: ThumbnailProvider,
+        category_label: Callable[[str], str],
+        parent: Any = None,
+    ) -> None:
+        super().__init__(parent)
+        self._icons: List[IconDefinition] = []
+        self._nodes: List[_CategoryNode] = []
+        self._node_by_key: Dict[str, _CategoryNode] = {}
+        # Displayed categories; the same list as _nodes unless a search is applied.
+        self._shown = self._nodes
+        self._category_label = category_label
+        self._thumbnails = thumbnails
+        self._awaiting: Dict[ThumbnailKey, Set[int]] = {}
+        self._next_sequence = 0
+        thumbnails.ready.connect(self._handle_thumbnail_ready)
+
+    # ------------------------------------------------------------------
+    # Mutation API
+    def set_icons(self, icons: List[IconDefinition]) -> None:
+        self.beginResetModel()
+        self._icons = icons
+        self._nodes = []
+        self._shown = self._nodes
+        self._node_by_key = {}
+        self._awaiting.clear()
+        self._thumbnails.cancel_pending()
+        for row, icon in enumerate(icons):
+            node = self._node_by_key.get(self._category_key(icon))
+            if node is None:
+                node = self._create_node(self._category_key(icon))
+                self._nodes.append(node)
+            node.rows.append(row)
+        self.endResetModel()
+
+    @property
+    def filtered(self) -> bool:
+        return self._shown is not self._nodes
+
+    def append_icon(self, icon: IconDefinition) -> int:
+        """Append ``icon`` to the shared list and return its row.
+
+        While a search is applied the new icon stays hidden.
+        """
+
+        if self.filtered:
+            self._append_hidden([icon])
+            return len(self._icons) - 1
+        key = self._category_key(icon)
+        node = self._node_by_key.get(key)
+        if node is None:
+            position = len(self._nodes)
+            self.beginInsertRows(QModelIndex(), position, position)
+            node = self._create_node(key)
+            self._nodes.append(node)
+            self.endInsertRows()
+        row = len(self._icons)
+        parent = self.createIndex(self._nodes.index(node), 0)
+        self.beginInsertRows(parent, len(node.rows), len(node.rows))
+        self._icons.append(icon)
+        node.rows.append(row)
+        node.rows_changed()
+        self.endInsertRows()
+        return row
+
+    def append_icons(self, icons: Sequence[IconDefinition]) -> None:
+        """Append ``icons`` to the shared list with one insertion per category.
+
+        While a search is applied the new icons stay hidden.
+        """
+
+        if self.filtered:
+            self._append_hidden(icons)
+            return
+        start = len(self._icons)
+        grouped: Dict[str, List[int]] = {}
+        for offset, icon in enumerate(icons):
+            grouped.setdefault(self._category_key(icon), []).append(start + offset)
+        self._icons.extend(icons)
+
+        new_keys = [key for key in grouped if key not in self._node_by_key]
+        if new_keys:
+            first = len(self._nodes)
+            self.beginInsertRows(QModelIndex(), first, first + len(new_keys) - 1)
+            for key in new_keys:
+                node = self._create_node(key)
+                node.rows.extend(grouped.pop(key))
+                self._nodes.append(node)
+            self.endInsertRows()
+
+        for key, rows in grouped.items():
+            node = self._node_by_key[key]
+            parent = self.createIndex(self._nodes.index(node), 0)
+            self.beginInsertRows(parent, len(node.rows), len(node.rows) + len(rows) - 1)
+            node.rows.extend(rows)
+            node.rows_changed()
+            self.endInsertRows()
+
+    def remove_icon(self, row: int) -> IconDefinition:
+        """Remove the icon at ``row`` from the shared list and return it."""
+
+        node = self._node_by_key[self._category_key(self._icons[row])]
+        position = node.position(row)
+        if position >= 0:
+            node_position = self._shown.index(node)
+            self.beginRemoveRows(self.createIndex(node_position, 0), position, position)
+        icon = self._icons.pop(row)
+        node.rows.remove(row)
+        if node.shown is not node.rows and position >= 0:
+            del node.shown[position]
+        for other in self._nodes:
+            other.rows[:] = [value - 1 if value > row else value for value in other.rows]
+            if other.shown is not other.rows:
+                other.shown[:] = [value - 1 if value > row else value for value in other.shown]
+            other.rows_changed()
+        if position >= 0:
+            self.endRemoveRows()
+
+        if position >= 0 and not node.shown:
+            self.beginRemoveRows(QModelIndex(), node_position, node_position)
+            del self._shown[node_position]
+            if not node.rows:
+                self._forget_node(node)
+            self.endRemoveRows()
+        elif not node.rows:
+            self._forget_node(node)
+        return icon
+
+    def set_matches(self, ranking: Sequence[int] | None) -> None:
+        """Show only the icon rows in ``ranking``, best first; ``None`` shows every icon.
+
+        Categories are ordered by their best-ranked icon.
+        """
+
+        if ranking is None and not self.filtered:
+            return
+        self.beginResetModel()
+        if ranking is None:
+            self._shown = self._nodes
+            for node in self._nodes:
+                node.shown = node.rows
+                node.rows_changed()
+        else:
+            for node in self._nodes:
+                node.shown = []
+                node.rows_changed()
+            shown: List[_CategoryNode] = []
+            icons = self._icons
+            node_by_key = self._node_by_key
+            for row in ranking:
+                node = node_by_key[self._category_key(icons[row])]
+                if not node.shown:
+                    shown.append(node)
+                node.shown.append(row)
+            self._shown = shown
+        self.endResetModel()
+
+    def icon_changed(self, row: int) -> None:
+        """Notify views that the name or artwork of the icon at ``row`` changed."""
+
+        index = self.index_for_row(row)
+        if index.isValid():
+            self.dataChanged.emit(index, index)
+
+    def icon_row(self, row: int, parent: IndexLike) -> int:
+        """Return the icon-list row behind child ``row`` of ``parent``, or -1 for categories."""
+
+        if not parent.isValid():
+            return -1
+        node = self._node_at(parent)
+        if node is None or not (0 <= row < len(node.shown)):
+            return -1
+        return node.shown[row]
+
+    def category_key(self, index: IndexLike) -> str | None:
+        """Return the category key of a top-level ``index``, or ``None`` for icons."""
+
+        if not index.isValid() or index.internalPointer() is not None:
+            return None
+        node = self._node_at(index)
+        return node.key if node is not None else None
+
+    def index_for_row(self, row: int) -> QModelIndex:
+        if not (0 <= row < len(self._icons)):
+            return QModelIndex()
+        node = self._node_by_key.get(self._category_key(self._icons[row]))
+        if node is None:
+            return QModelIndex()
+        position = node.position(row)
+        if position < 0:
+            return QModelIndex()
+        return self.createIndex(position, 0, node)
+
+    # ------------------------------------------------------------------
+    # QAbstractItemModel interface
+    def index(self, row: int, column: int, parent: IndexLike = QModelIndex()) -> QModelIndex:
+        if column != 0 or row < 0:
+            return QModelIndex()
+        if not parent.isValid():
+            if row >= len(self._shown):
+                return QModelIndex()
+            return self.createIndex(row, 0)
+        node = self._node_at(parent)
+        if node is None or row >= len(node.shown):
+            return QModelIndex()
+        return self.createIndex(row, 0, node)
+
+    def parent(self, index: IndexLike = QModelIndex()) -> QModelIndex:  # type: ignore[override]
+        if not index.isValid():
+            return QModelIndex()
+        node = index.internalPointer()
+        if node is None:
+            return QModelIndex()
+        return self.createIndex(self._shown.index(node), 0)
+
+    def rowCount(self, parent: IndexLike = QModelIndex()) -> int:
+        if not parent.isValid():
+            return len(self._shown)
+        if parent.internalPointer() is not None:
+            return 0
+        node = self._node_at(parent)
+        return len(node.shown) if node is not None else 0
+
+    def hasChildren(self, parent: IndexLike = QModelIndex()) -> bool:
+        # Views ask this for every row they lay out; icons never have children.
+        return not parent.isValid() or parent.internalPointer() is None
+
+    def columnCount(self, parent: IndexLike = QModelIndex()) -> int:
+        return 1
+
+    def flags(self, index: IndexLike) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        if index.internalPointer() is None:
+            return _CATEGORY_FLAGS
+        return _ICON_FLAGS
+
+    def data(self, index: IndexLike, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if node is None:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return self._shown[index.row()].label
+            return None
+
+        row = node.shown[index.row()]
+        icon = self._icons[row]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return icon.name
+        if role == Qt.ItemDataRole.UserRole:
+            return row
+        if role == Qt.ItemDataRole.DecorationRole:
+            return self._decoration(row, icon)
+        return None
+
+    # ------------------------------------------------------------------
+    # Helpers
+    def _append_hidden(self, icons: Sequence[IconDefinition]) -> None:
+        """Add ``icons`` to the list and their categories without showing them."""
+
+        for icon in icons:
+            key = self._category_key(icon)
+            node = self._node_by_key.get(key)
+            if node is None:
+                node = self._create_node(key)
+                node.shown = []
+                self._nodes.append(node)
+            node.rows.append(len(self._icons))
+            self._icons.append(icon)
+
+    def _forget_node(self, node: _CategoryNode) -> None:
+        if node in self._nodes:  # already gone when it was also the displayed node
+            self._nodes.remove(node)
+        del self._node_by_key[node.key]
+
+    def _decoration(self, row: int, icon: IconDefinition) -> QIcon | None:
+        key = self._thumbnails.key_for(icon.source_path)
+        if key is None:
+            return None
+        pixmap = self._thumbnails.request(key)
+        if pixmap is None:
+            self._awaiting.setdefault(key, set()).add(row)
+            return None
+        return QIcon(pixmap)
+
+    def _handle_thumbnail_ready(self, key: ThumbnailKey) -> None:
+        for row in self._awaiting.pop(key, ()):
+            if row < len(self._icons) and str(self._icons[row].source_path) == key[0]:
+                index = self.index_for_row(row)
+                if index.isValid():
+                    self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+
+    def _node_at(self, index: IndexLike) -> _CategoryNode | None:
+        row = index.row()
+        return self._shown[row] if 0 <= row < len(self._shown) else None
+
+    def _create_node(self, key: str) -> _CategoryNode:
+        node = _CategoryNode(key, self._category_label(key), self._next_sequence)
+        self._next_sequence += 1
+        self._node_by_key[key] = node
+        return node
+
+    @staticmethod
+    def _category_key(icon: IconDefinition) -> str:
+        return (icon.category or "other").lower()
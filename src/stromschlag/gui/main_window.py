@@ -1,16 +1,15 @@
 """Main window for the Stromschlag GUI."""
 from __future__ import annotations
 
+import os
+from functools import partial
 from pathlib import Path
-from typing import Iterable, List
+from typing import TYPE_CHECKING, Callable, List, Set, Tuple
 
-from PySide6.QtCore import QSettings, Qt
-from PySide6.QtGui import QAction, QIcon, QKeySequence, QPixmap, QShortcut
+from PySide6.QtCore import QModelIndex, QSettings, Qt, QThreadPool, QTimer
+from PySide6.QtGui import QAction, QKeySequence, QPixmap, QShortcut
 from PySide6.QtWidgets import (
-    QCheckBox,
-    QComboBox,
-    QDialog,
-    QDialogButtonBox,
+    QApplication,
     QFileDialog,
     QFormLayout,
     QGroupBox,
@@ -23,27 +22,50 @@ from PySide6.QtWidgets import (
     QMenuBar,
     QMenu,
     QMessageBox,
-    QPlainTextEdit,
+    QProgressDialog,
     QPushButton,
     QSplitter,
     QStackedWidget,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTreeView,
     QVBoxLayout,
     QWidget,
 )
 
-from ..core.exporters import ExportResult, export_icon_pack, install_icon_pack
+from ..core.file_status import StatSnapshot
 from ..core.models import IconDefinition, PackSettings
-from ..core.project_io import load_project
-from ..core.theme_loader import (
-    ThemeCandidate,
-    load_icon_blueprint,
-    load_icons_from_directory,
-    list_installed_themes,
+from .icon_model import IconTreeModel
+from .previews import PreviewProvider
+from .thumbnails import ThumbnailKey, ThumbnailProvider
+
+if TYPE_CHECKING:
+    from ..core.exporters import ExportResult
+    from ..core.search import FuzzyMatcher
+    from ..core.source_scanner import IconSource
+    from .workers import ExportWorker, FolderOpenWorker, ProjectLoadWorker, SearchWorker
+
+# YAML, the exporter, theme discovery, search and the dialogs are imported
+# where they are first used so the window can be shown sooner; see
+# preload_modules() for the background warm-up after the first paint.
+_PRELOADED_MODULES = (
+    "yaml",
+    "stromschlag.core.project_io",
+    "stromschlag.core.exporters",
+    "stromschlag.core.theme_loader",
+    "stromschlag.core.search",
 )
 
 
+def preload_modules() -> None:
+    """Import the deferred core modules; meant to run on a background thread."""
+    import importlib
+
+    for name in _PRELOADED_MODULES:
+        try:
+            importlib.import_module(name)
+        except ImportError:  # pragma: no cover - reported again on first real use
+            pass
+
+
 class MainWindow(QMainWindow):
     """Primary GUI surface for assembling icon pack projects."""
 
@@ -62,6 +84,9 @@ class MainWindow(QMainWindow):
         "custom": "Custom",
         "other": "Other",
     }
+    _THUMBNAIL_SIZE = 32
+    _PREVIEW_SIZE = 360
+    _FILTER_DEBOUNCE_MS = 150
 
     def __init__(self) -> None:
         super().__init__()
@@ -73,25 +98,58 @@ class MainWindow(QMainWindow):
         self._metadata_confirmed = False
         self._project_loaded = False
         self._last_export_result: ExportResult | None = None
+        self._project_worker: ProjectLoadWorker | None = None
+        self._project_origin: Path | None = None
+        self._descriptor_worker: FolderOpenWorker | None = None
+        self._descriptor_progress: QProgressDialog | None = None
+        self._export_worker: ExportWorker | None = None
+        self._export_progress: QProgressDialog | None = None
+        self._project_streaming = False
         self._settings_store = QSettings("Stromschlag", "Stromschlag")
         self._recent_projects: List[str] = []
         self._recent_menu: QMenu | None = None
         self._recent_list: QListWidget | None = None
         self._recent_placeholder_label: QLabel | None = None
 
+        # Artwork status shared by thumbnails, previews and export; cleared
+        # whenever the files may have changed behind our back.
+        self._file_status = StatSnapshot()
+        application = QApplication.instance()
+        if application is not None:
+            application.applicationStateChanged.connect(self._handle_application_state)
+
         # Project UI widgets created up front
-        self._icon_tree = QTreeWidget()
+        self._thumbnails = ThumbnailProvider(self._THUMBNAIL_SIZE, self, file_status=self._file_status)
+        self._icon_model = IconTreeModel(self._thumbnails, self._category_display_name, self)
+        self._icon_model.rowsInserted.connect(self._expand_inserted_category)
+        self._icon_tree = QTreeView()
         self._icon_tree.setHeaderHidden(True)
         self._icon_tree.setAnimated(True)
-        self._category_nodes: dict[str, QTreeWidgetItem] = {}
-        self._row_to_item: List[QTreeWidgetItem | None] = []
+        self._icon_tree.setUniformRowHeights(True)
+        self._icon_tree.setModel(self._icon_model)
+        # Connected after setModel so the view has reset its own state first.
+        self._icon_model.modelReset.connect(self._expand_categories)
+        # Categories the user folded stay folded when a search reshapes the tree.
+        self._collapsed_categories: Set[str] = set()
+        self._icon_tree.collapsed.connect(partial(self._track_category_expansion, True))
+        self._icon_tree.expanded.connect(partial(self._track_category_expansion, False))
         self._filter_edit = QLineEdit()
         self._filter_edit.setPlaceholderText("Search icons…")
         self._filter_edit.setClearButtonEnabled(True)
         self._filter_edit.textChanged.connect(self._handle_filter_change)
         self._filter_edit.setEnabled(False)
         self._filter_text = ""
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(self._FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self._apply_pending_filter)
+        self._search_index: FuzzyMatcher | None = None
+        self._search_index_stale = True
+        self._search_worker: SearchWorker | None = None
         self._preview_label = QLabel()
+        self._previews = PreviewProvider(self._PREVIEW_SIZE, parent=self, file_status=self._file_status)
+        self._previews.ready.connect(self._handle_preview_ready)
+        self._preview_key: ThumbnailKey | None = None
         self._icon_name_edit = QLineEdit()
         self._icon_name_edit.setPlaceholderText("Logical icon name (e.g., firefox)")
         self._icon_source_path_display = QLineEdit()
@@ -203,8 +261,8 @@ class MainWindow(QMainWindow):
 
         layout.addWidget(self._filter_edit)
 
-        self._icon_tree.currentItemChanged.connect(self._handle_tree_selection)
-        self._icon_tree.itemDoubleClicked.connect(self._handle_tree_double_click)
+        self._icon_tree.selectionModel().currentChanged.connect(self._handle_tree_selection)
+        self._icon_tree.doubleClicked.connect(self._handle_tree_double_click)
         layout.addWidget(self._icon_tree)
 
         button_row = QHBoxLayout()
@@ -219,10 +277,19 @@ class MainWindow(QMainWindow):
         return panel
 
     def _handle_filter_change(self, text: str) -> None:
-        self._filter_text = text.strip()
+        # Clearing the box applies at once; typing waits for a pause.
+        if text.strip():
+            self._filter_timer.start()
+        else:
+            self._filter_timer.stop()
+            self._apply_pending_filter()
+
+    def _apply_pending_filter(self) -> None:
+        self._filter_text = self._filter_edit.text().strip()
         if not self._project_loaded:
             return
-        self._refresh_icon_list()
+        # A new query selects its best match; clearing keeps the selection.
+        self._apply_icon_filter(None if self._filter_text else self._current_row())
 
     def _focus_filter_box(self) -> None:
         if not self._project_loaded:
@@ -234,7 +301,7 @@ class MainWindow(QMainWindow):
         panel = QGroupBox("Canvas preview")
         layout = QVBoxLayout(panel)
         self._preview_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self._preview_label.setMinimumSize(360, 360)
+        self._preview_label.setMinimumSize(self._PREVIEW_SIZE, self._PREVIEW_SIZE)
         layout.addStretch()
         layout.addWidget(self._preview_label, alignment=Qt.AlignmentFlag.AlignCenter)
         layout.addStretch()
@@ -404,19 +471,37 @@ class MainWindow(QMainWindow):
         self._persist_recent_projects()
         self._refresh_recent_ui()
 
-    def _discover_descriptor(self, directory: Path) -> Path | None:
-        preferred = directory / "stromschlag.yaml"
-        if preferred.exists():
-            return preferred
-        fallback = directory / "Stromschlag.yaml"
-        if fallback.exists():
-            return fallback
-        for candidate in directory.glob("**/stromschlag.yaml"):
-            return candidate
+    def _remembered_descriptor(self, directory: Path) -> Path | None:
+        from ..core.source_scanner import top_level_descriptor
+
+        # A project file saved into the folder since replaces the remembered one.
+        top_level = top_level_descriptor(directory)
+        if top_level is not None:
+            return top_level
+        stored = self._settings_store.value("projectDescriptors", {})
+        if not isinstance(stored, dict):
+            return None
+        location = stored.get(str(directory))
+        if location and Path(str(location)).is_file():
+            return Path(str(location))
         return None
 
-    def _build_project_from_directory(self, directory: Path) -> tuple[PackSettings, List[IconDefinition]]:
-        entries = self._collect_icon_sources(directory)
+    def _remember_descriptor(self, directory: Path, descriptor: Path) -> None:
+        """Remember where the project file of ``directory`` lives, for its recent entry."""
+        stored = self._settings_store.value("projectDescriptors", {})
+        locations = {str(key): str(value) for key, value in stored.items()} if isinstance(stored, dict) else {}
+        locations[str(directory)] = str(descriptor)
+        kept = set(self._recent_projects) | {str(directory)}
+        self._settings_store.setValue(
+            "projectDescriptors",
+            {key: value for key, value in locations.items() if key in kept},
+        )
+
+    def _build_project_from_directory(
+        self,
+        directory: Path,
+        entries: List[IconSource],
+    ) -> tuple[PackSettings, List[IconDefinition]]:
         icons = [
             IconDefinition(name=name, source_path=path, category=category)
             for name, path, category in entries
@@ -429,53 +514,30 @@ class MainWindow(QMainWindow):
         )
         return settings, icons
 
-    def _collect_icon_sources(self, directory: Path) -> List[tuple[str, Path, str | None]]:
-        allowed = {".png", ".svg", ".svgz"}
-        winners: dict[str, tuple[int, Path, str | None]] = {}
-        for file_path in sorted(directory.rglob("*")):
-            if not file_path.is_file():
-                continue
-            suffix = file_path.suffix.lower()
-            if suffix not in allowed:
-                continue
-            name = file_path.stem
-            normalized_parts = {part.lower() for part in file_path.parts}
-            weight = 0
-            if suffix not in {".svg", ".svgz"}:
-                weight += 1
-            if "scalable" not in normalized_parts:
-                weight += 2
-            if "apps" not in normalized_parts and "mimetypes" not in normalized_parts:
-                weight += 1
-            existing = winners.get(name)
-            if existing and existing[0] <= weight:
-                continue
-            category = file_path.parent.name if file_path.parent != directory else None
-            winners[name] = (weight, file_path, category)
-        return [
-            (name, data[1], data[2])
-            for name, data in sorted(winners.items(), key=lambda item: item[0])
-        ]
-
     # ------------------------------------------------------------------
     # Project lifecycle
     def _show_placeholder(self) -> None:
+        self._cancel_project_load()
         self._project_loaded = False
         self._last_export_result = None
         self._stack.setCurrentWidget(self._placeholder_view)
         self._update_action_states()
-        self._icon_tree.clear()
-        self._category_nodes.clear()
-        self._row_to_item = []
+        self._icons = []
+        self._icon_model.set_icons(self._icons)
+        self._invalidate_search_index()
+        self._search_worker = None
+        self._filter_timer.stop()
         self._filter_edit.clear()
         self._filter_edit.setEnabled(False)
         self._filter_text = ""
+        self._preview_key = None
         self._preview_label.clear()
         self._set_icon_form_enabled(False)
         self._set_metadata_form_enabled(False)
         self._update_metadata_panel()
 
     def _show_project_view(self) -> None:
+        self._file_status.invalidate()
         self._project_loaded = True
         self._stack.setCurrentWidget(self._project_view)
         self._update_action_states()
@@ -487,7 +549,8 @@ class MainWindow(QMainWindow):
         self._refresh_icon_list()
 
     def _update_action_states(self) -> None:
-        state = self._project_loaded
+        # Exporting a half-loaded project would silently drop icons.
+        state = self._project_loaded and self._project_worker is None and self._export_worker is None
         for action in (
             self._metadata_action,
             self._export_action,
@@ -497,8 +560,10 @@ class MainWindow(QMainWindow):
             action.setEnabled(state)
 
     def _new_project(self) -> None:
-        suggestion = load_icon_blueprint()
-        result = BaseThemeDialog.prompt(self, default_theme=suggestion.source_theme)
+        from ..core.theme_loader import suggest_base_theme
+        from .dialogs import BaseThemeDialog
+
+        result = BaseThemeDialog.prompt(self, default_theme=suggest_base_theme())
         if result is None:
             QMessageBox.information(
                 self,
@@ -506,6 +571,7 @@ class MainWindow(QMainWindow):
                 "Creating a project requires choosing a base icon theme.",
             )
             return
+        self._cancel_project_load()
         icons, source_theme, inherits, targets = result
 
         self._settings = PackSettings(
@@ -531,6 +597,7 @@ class MainWindow(QMainWindow):
         self._load_project_from_path(Path(path_str))
 
     def _load_project_from_path(self, path: Path) -> None:
+        self._cancel_project_load()
         if not path.exists():
             QMessageBox.warning(self, "Missing project", f"The path '{path}' does not exist.")
             self._remove_recent_entry(str(path))
@@ -540,25 +607,138 @@ class MainWindow(QMainWindow):
             return
         self._load_project_file(path)
 
-    def _load_project_file(self, path: Path) -> None:
-        try:
-            settings, icons = load_project(path)
-        except Exception as exc:  # pragma: no cover - filesystem errors
-            QMessageBox.critical(self, "Unable to open project", str(exc))
+    def _load_project_file(self, path: Path, origin: Path | None = None) -> None:
+        """Stream ``path`` in on a worker; icons appear batch by batch as they are parsed.
+
+        ``origin`` is the folder the user opened, recorded as the recent entry
+        instead of the project file's own folder.
+        """
+        from .workers import ProjectLoadWorker
+
+        worker = ProjectLoadWorker(path)
+        worker.signals.header.connect(partial(self._handle_project_header, worker))
+        worker.signals.batch.connect(partial(self._handle_project_batch, worker))
+        worker.signals.finished.connect(partial(self._handle_project_loaded, worker))
+        worker.signals.failed.connect(partial(self._handle_project_load_failed, worker))
+        self._project_worker = worker
+        self._project_origin = origin or path.parent
+        self.statusBar().showMessage(f"Opening '{path}'…")
+        QThreadPool.globalInstance().start(worker)
+
+    def _cancel_project_load(self) -> None:
+        self._cancel_descriptor_search()
+        worker, self._project_worker = self._project_worker, None
+        if worker is None:
             return
+        worker.cancel()
+        self.statusBar().clearMessage()
+        if self._project_streaming:
+            # Do not leave a partially read project open.
+            self._project_streaming = False
+            self._show_placeholder()
+
+    def _handle_project_header(self, worker: ProjectLoadWorker, settings: PackSettings) -> None:
+        if worker is not self._project_worker:
+            return
+        self._project_streaming = True
         self._settings = settings
         self._metadata_confirmed = True
-        self._icons = icons
+        self._icons = []
         self._last_export_result = None
         self._show_project_view()
-        self._record_recent_project(path.parent)
+
+    def _handle_project_batch(self, worker: ProjectLoadWorker, batch: List[IconDefinition]) -> None:
+        if worker is not self._project_worker:
+            return
+        first_batch = not self._icons
+        self._icon_model.append_icons(batch)
+        self._update_search_index(appended=len(batch))
+        if first_batch and not self._filter_text:
+            self._apply_icon_filter()
+        self.statusBar().showMessage(f"Loaded {len(self._icons)} icons…")
+
+    def _handle_project_loaded(self, worker: ProjectLoadWorker, cancelled: bool) -> None:
+        if worker is not self._project_worker:
+            return
+        self._project_worker = None
+        self._project_streaming = False
+        self._update_action_states()
+        if cancelled or self._project_origin is None:
+            return
+        # Settings stored after the icon list only arrive with the last batch.
+        self._update_metadata_panel()
+        if self._filter_text:
+            self._apply_icon_filter()
+        self._record_recent_project(self._project_origin)
+        self.statusBar().showMessage(f"Loaded {len(self._icons)} icons.", 5000)
+
+    def _handle_project_load_failed(self, worker: ProjectLoadWorker, message: str) -> None:
+        if worker is not self._project_worker:
+            return
+        self._project_worker = None
+        if self._project_streaming:
+            self._project_streaming = False
+            self._show_placeholder()
+        self.statusBar().clearMessage()
+        QMessageBox.critical(self, "Unable to open project", message)
 
     def _load_project_from_directory(self, directory: Path) -> None:
-        descriptor = self._discover_descriptor(directory)
-        if descriptor:
-            self._load_project_file(descriptor)
+        """Open the project file found in (or below) ``directory``, else import its artwork."""
+        descriptor = self._remembered_descriptor(directory)
+        if descriptor is not None:
+            self._load_project_file(descriptor, origin=directory)
+            return
+        from .workers import FolderOpenWorker
+
+        progress = QProgressDialog(f"Looking for a project in '{directory.name}'…", "Cancel", 0, 0, self)
+        progress.setWindowTitle("Opening project")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(300)
+        worker = FolderOpenWorker(directory)
+        progress.canceled.connect(worker.cancel)
+        worker.signals.scanning.connect(partial(self._handle_folder_scanning, worker, directory))
+        worker.signals.finished.connect(partial(self._handle_descriptor_search_finished, worker, directory))
+        self._descriptor_worker = worker
+        self._descriptor_progress = progress
+        QThreadPool.globalInstance().start(worker)
+
+    def _cancel_descriptor_search(self) -> None:
+        worker, self._descriptor_worker = self._descriptor_worker, None
+        if worker is not None:
+            worker.cancel()
+        if self._descriptor_progress is not None:
+            self._descriptor_progress.close()
+            self._descriptor_progress.deleteLater()
+            self._descriptor_progress = None
+
+    def _handle_folder_scanning(self, worker: FolderOpenWorker, directory: Path) -> None:
+        if worker is not self._descriptor_worker or self._descriptor_progress is None:
             return
-        settings, icons = self._build_project_from_directory(directory)
+        self._descriptor_progress.setLabelText(f"Importing icons from '{directory.name}'…")
+
+    def _handle_descriptor_search_finished(
+        self,
+        worker: FolderOpenWorker,
+        directory: Path,
+        descriptor: Path | None,
+        sources: List[IconSource],
+        cancelled: bool,
+    ) -> None:
+        if worker is not self._descriptor_worker:
+            return
+        self._cancel_descriptor_search()
+        if cancelled:
+            self.statusBar().showMessage("Opening cancelled.", 5000)
+            return
+        if descriptor is not None:
+            if descriptor.parent != directory:
+                self._remember_descriptor(directory, descriptor)
+            self._load_project_file(descriptor, origin=directory)
+            return
+        self._import_directory(directory, sources)
+
+    def _import_directory(self, directory: Path, sources: List[IconSource]) -> None:
+        settings, icons = self._build_project_from_directory(directory, sources)
         if not icons:
             QMessageBox.information(
                 self,
@@ -587,73 +767,143 @@ class MainWindow(QMainWindow):
     # ------------------------------------------------------------------
     # Icon manipulation
     def _refresh_icon_list(self, select_index: int | None = None) -> None:
-        self._icon_tree.blockSignals(True)
-        self._icon_tree.clear()
-        self._category_nodes.clear()
-        self._row_to_item = [None] * len(self._icons)
-        filter_text = (self._filter_text or "").lower()
-        matching_indices: List[int] = []
-
-        for idx, icon in enumerate(self._icons):
-            if filter_text and filter_text not in icon.name.lower():
-                continue
-            category_key = (icon.category or "other").lower()
-            parent = self._category_nodes.get(category_key)
-            if parent is None:
-                parent = QTreeWidgetItem([self._category_display_name(category_key)])
-                parent.setFirstColumnSpanned(True)
-                parent.setFlags(parent.flags() & ~Qt.ItemFlag.ItemIsSelectable)
-                self._icon_tree.addTopLevelItem(parent)
-                self._category_nodes[category_key] = parent
-            child = QTreeWidgetItem([icon.name])
-            child.setData(0, Qt.ItemDataRole.UserRole, idx)
-            pixmap = self._icon_pixmap(icon, 32)
-            if pixmap is not None:
-                child.setIcon(0, QIcon(pixmap))
-            parent.addChild(child)
-            self._row_to_item[idx] = child
-            matching_indices.append(idx)
-
-        self._icon_tree.expandAll()
-        self._icon_tree.blockSignals(False)
+        """Reload the whole icon model; use the fine-grained model calls for edits."""
+        self._icon_model.set_icons(self._icons)
+        self._invalidate_search_index()
+        self._apply_icon_filter(select_index)
+
+    def _apply_icon_filter(self, select_index: int | None = None) -> None:
+        """Show the icons matching the search box, then select ``select_index`` or the best match.
+
+        Icons are ranked on a worker thread; the tree keeps its current rows
+        until the matches arrive.
+        """
+        if not self._filter_text:
+            self._search_worker = None
+            self._icon_model.set_matches(None)
+            self._select_after_filter(select_index)
+            return
+
+        from .workers import SearchWorker
 
+        worker = SearchWorker(self._filter_text, self._search_index, list(self._icons))
+        worker.signals.finished.connect(partial(self._handle_search_finished, worker, select_index))
+        self._search_worker = worker
+        if self._search_index is None:
+            self._search_index_stale = False
+        # Ahead of queued thumbnail loads: the search result changes what is painted.
+        QThreadPool.globalInstance().start(worker, 1)
+
+    def _handle_search_finished(
+        self,
+        worker: SearchWorker,
+        select_index: int | None,
+        matcher: FuzzyMatcher,
+        matches: List[Tuple[int, float]],
+    ) -> None:
+        if worker is not self._search_worker:
+            return
+        self._search_worker = None
+        if self._search_index is None and not self._search_index_stale:
+            self._search_index = matcher
+        self._icon_model.set_matches([row for row, _score in matches])
+        self._select_after_filter(select_index)
+
+    def _select_after_filter(self, select_index: int | None) -> None:
         if not self._icons:
             self._handle_selection_change(-1)
             return
 
-        if not matching_indices:
-            self._icon_tree.setCurrentItem(None)
+        if self._icon_model.rowCount() == 0:
+            self._icon_tree.setCurrentIndex(QModelIndex())
             self._handle_selection_change(-1)
             self._preview_label.setPixmap(QPixmap())
             self._preview_label.setText("No icons match the current search.")
             return
 
-        if select_index is not None and select_index in matching_indices:
-            target = select_index
+        if select_index is None or not self._select_row(select_index):
+            first_category = self._icon_model.index(0, 0)
+            self._icon_tree.setCurrentIndex(self._icon_model.index(0, 0, first_category))
+
+    def _invalidate_search_index(self) -> None:
+        """Drop the search index after the icon list was replaced."""
+        self._search_index = None
+        self._search_index_stale = True
+
+    def _update_search_index(self, *, appended: int = 0, changed: int = -1, removed: int = -1) -> None:
+        """Apply an edit of the icon list to the search index.
+
+        ``appended`` counts icons added at the end of the list; ``changed`` and
+        ``removed`` are the rows of an edited or removed icon.
+        """
+        matcher = self._search_index
+        if matcher is None:
+            # A search may be indexing the icons as they were; don't keep that index.
+            self._search_index_stale = True
+            return
+        from ..core.search import search_fields
+
+        if appended:
+            matcher.extend([search_fields(icon) for icon in self._icons[-appended:]])
+        if changed >= 0:
+            matcher.update(changed, search_fields(self._icons[changed]))
+        if removed >= 0:
+            matcher.remove(removed)
+
+    def _expand_inserted_category(self, parent: QModelIndex, first: int, last: int) -> None:
+        if parent.isValid():
+            return
+        for row in range(first, last + 1):
+            self._icon_tree.expand(self._icon_model.index(row, 0))
+
+    def _expand_categories(self) -> None:
+        """Expand the categories after a model reset, except those the user folded."""
+        for row in range(self._icon_model.rowCount()):
+            index = self._icon_model.index(row, 0)
+            if self._icon_model.category_key(index) not in self._collapsed_categories:
+                self._icon_tree.expand(index)
+
+    def _track_category_expansion(self, collapsed: bool, index: QModelIndex) -> None:
+        key = self._icon_model.category_key(index)
+        if key is None:
+            return
+        if collapsed:
+            self._collapsed_categories.add(key)
         else:
-            target = matching_indices[0]
-        self._select_row(target)
+            self._collapsed_categories.discard(key)
 
     def _category_display_name(self, key: str) -> str:
         normalized = key.lower() if key else "other"
         return self._CATEGORY_LABELS.get(normalized, normalized.replace("-", " ").title())
 
-    def _select_row(self, row: int) -> None:
-        if not (0 <= row < len(self._row_to_item)):
-            self._icon_tree.setCurrentItem(None)
+    def _select_row(self, row: int) -> bool:
+        index = self._icon_model.index_for_row(row)
+        if not index.isValid():
+            self._icon_tree.setCurrentIndex(QModelIndex())
             self._handle_selection_change(-1)
+            return False
+        self._icon_tree.setCurrentIndex(index)
+        self._icon_tree.scrollTo(index)
+        return True
+
+    def _handle_application_state(self, state: Qt.ApplicationState) -> None:
+        """Pick up artwork edited in other applications when the user comes back."""
+        if state != Qt.ApplicationState.ApplicationActive or not len(self._file_status):
             return
-        item = self._row_to_item[row]
-        if item is None:
-            self._handle_selection_change(-1)
-            return
-        self._icon_tree.setCurrentItem(item)
+        self._file_status.invalidate()
+        self._icon_tree.viewport().update()
+        row = self._current_row()
+        if row >= 0:
+            self._show_preview(self._icons[row])
 
     def _current_row(self) -> int:
-        item = self._icon_tree.currentItem()
-        if item is None:
+        return self._row_for_index(self._icon_tree.currentIndex())
+
+    @staticmethod
+    def _row_for_index(index: QModelIndex) -> int:
+        if not index.isValid():
             return -1
-        data = item.data(0, Qt.ItemDataRole.UserRole)
+        data = index.data(Qt.ItemDataRole.UserRole)
         if data is None:
             return -1
         try:
@@ -667,51 +917,40 @@ class MainWindow(QMainWindow):
             name=name,
             category="custom",
         )
-        self._icons.append(icon)
-        self._refresh_icon_list(len(self._icons) - 1)
+        row = self._icon_model.append_icon(icon)
+        self._update_search_index(appended=1)
+        if not self._select_row(row):
+            self._filter_edit.clear()
+            self._select_row(row)
 
     def _remove_icon(self) -> None:
         row = self._current_row()
         if row < 0:
             return
-        self._icons.pop(row)
-        if self._icons:
-            self._refresh_icon_list(min(row, len(self._icons) - 1))
-        else:
-            self._icon_tree.clear()
-            self._row_to_item = []
-            self._handle_selection_change(-1)
+        self._icon_model.remove_icon(row)
+        self._update_search_index(removed=row)
+        next_row = min(row, len(self._icons) - 1)
+        if self._filter_text:
+            # Rows after the removed one shifted, so the match set must be rebuilt.
+            self._apply_icon_filter(next_row)
+        elif not self._icons or not self._select_row(next_row):
+            self._apply_icon_filter()
 
     # ------------------------------------------------------------------
     # Selection + preview
-    def _handle_tree_selection(self, current: QTreeWidgetItem | None, previous: QTreeWidgetItem | None) -> None:  # noqa: ARG002 - unused
-        row = -1
-        if current is not None:
-            data = current.data(0, Qt.ItemDataRole.UserRole)
-            if isinstance(data, int):
-                row = data
-            else:
-                try:
-                    row = int(data)
-                except (TypeError, ValueError):
-                    row = -1
-        self._handle_selection_change(row)
+    def _handle_tree_selection(self, current: QModelIndex, previous: QModelIndex) -> None:  # noqa: ARG002 - unused
+        self._handle_selection_change(self._row_for_index(current))
 
-    def _handle_tree_double_click(self, item: QTreeWidgetItem | None, column: int) -> None:  # noqa: ARG002 - unused
-        if item is None:
-            return
-        data = item.data(0, Qt.ItemDataRole.UserRole)
-        if data is None:
-            return
-        try:
-            row = int(data)
-        except (TypeError, ValueError):
+    def _handle_tree_double_click(self, index: QModelIndex) -> None:
+        row = self._row_for_index(index)
+        if row < 0:
             return
         self._select_row(row)
         self._choose_icon_file()
 
     def _handle_selection_change(self, row: int) -> None:
         if row < 0 or row >= len(self._icons):
+            self._preview_key = None
             self._preview_label.setText("Open or create a project, then select an icon to preview")
             self._preview_label.setPixmap(QPixmap())
             self._set_icon_form_enabled(False)
@@ -719,14 +958,46 @@ class MainWindow(QMainWindow):
         icon = self._icons[row]
         self._load_icon_into_form(icon)
         self._set_icon_form_enabled(True)
-        pixmap = self._icon_pixmap(icon, 360)
+        self._show_preview(icon)
+
+    def _show_preview(self, icon: IconDefinition) -> None:
+        """Show the cached preview, or the list thumbnail until the worker renders it."""
+        key = self._previews.key_for(icon.source_path)
+        self._preview_key = key
+        if key is None:
+            self._show_missing_preview()
+            return
+        pixmap = self._previews.request(key)
         if pixmap is None:
-            self._preview_label.setPixmap(QPixmap())
-            self._preview_label.setText("No artwork selected for this icon.")
+            pixmap = self._preview_placeholder(icon)
+        self._preview_label.setText("")
+        self._preview_label.setPixmap(pixmap)
+
+    def _preview_placeholder(self, icon: IconDefinition) -> QPixmap:
+        key = self._thumbnails.key_for(icon.source_path)
+        thumbnail = self._thumbnails.request(key) if key is not None else None
+        if thumbnail is None:
+            return QPixmap()
+        return thumbnail.scaled(
+            self._PREVIEW_SIZE,
+            self._PREVIEW_SIZE,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+
+    def _handle_preview_ready(self, key: ThumbnailKey, pixmap: QPixmap | None) -> None:
+        if key != self._preview_key:
+            return
+        if pixmap is None:
+            self._show_missing_preview()
             return
         self._preview_label.setText("")
         self._preview_label.setPixmap(pixmap)
 
+    def _show_missing_preview(self) -> None:
+        self._preview_label.setPixmap(QPixmap())
+        self._preview_label.setText("No artwork selected for this icon.")
+
     def _load_icon_into_form(self, icon: IconDefinition) -> None:
         self._suppress_form_updates = True
         self._icon_name_edit.setText(icon.name)
@@ -795,7 +1066,7 @@ class MainWindow(QMainWindow):
         if row < 0:
             return
         icon = self._icons[row]
-        start_dir = icon.source_path.parent if icon.source_path and icon.source_path.exists() else Path.home()
+        start_dir = icon.source_path.parent if icon.has_source_asset(self._file_status) else Path.home()
         path_str, _ = QFileDialog.getOpenFileName(
             self,
             "Select artwork",
@@ -805,10 +1076,12 @@ class MainWindow(QMainWindow):
         if not path_str:
             return
         path = Path(path_str)
+        self._file_status.invalidate(path)
         icon.source_path = path
         self._icon_source_path_display.setText(str(path))
-        self._preview_label.setPixmap(self._icon_pixmap(icon, 360))
-        self._refresh_icon_list(row)
+        self._show_preview(icon)
+        self._update_search_index(changed=row)
+        self._icon_model.icon_changed(row)
 
     def _handle_name_commit(self) -> None:
         if self._suppress_form_updates:
@@ -830,20 +1103,20 @@ class MainWindow(QMainWindow):
         if icon.name == name:
             return
         icon.name = name
-        self._refresh_icon_list(row)
-
-    def _icon_pixmap(self, icon: IconDefinition, size: int) -> QPixmap | None:
-        if icon.source_path and icon.source_path.exists():
-            pixmap = QIcon(str(icon.source_path)).pixmap(size, size)
-            if not pixmap.isNull():
-                return pixmap
-        return None
+        self._update_search_index(changed=row)
+        self._icon_model.icon_changed(row)
+        if self._filter_text:
+            self._apply_icon_filter(row)
+        else:
+            self._select_row(row)
 
     # ------------------------------------------------------------------
     # Metadata + export
     def _edit_metadata(self) -> None:
         if not self._project_loaded:
             return
+        from .dialogs import MetadataDialog
+
         updated = MetadataDialog.prompt(self, self._settings)
         if updated:
             self._settings = updated
@@ -855,6 +1128,8 @@ class MainWindow(QMainWindow):
             self._settings = PackSettings(name="Untitled Icon Pack", author="Unknown")
         if self._metadata_confirmed and self._settings.name and self._settings.author:
             return True
+        from .dialogs import MetadataDialog
+
         updated = MetadataDialog.prompt(self, self._settings)
         if updated:
             self._settings = updated
@@ -865,9 +1140,9 @@ class MainWindow(QMainWindow):
     def _export_pack(self) -> None:
         if not self._project_loaded:
             return
-        export_result = self._perform_export(prompt_for_directory=True)
-        if export_result is None:
-            return
+        self._perform_export(prompt_for_directory=True, on_success=self._announce_export)
+
+    def _announce_export(self, export_result: ExportResult) -> None:
         QMessageBox.information(
             self,
             "Export complete",
@@ -895,9 +1170,11 @@ class MainWindow(QMainWindow):
     def _install_pack(self, title: str, install_roots: List[Path]) -> None:
         if not self._project_loaded:
             return
-        export_result = self._perform_export(prompt_for_directory=False)
-        if export_result is None:
-            return
+        self._perform_export(prompt_for_directory=False, on_success=partial(self._install_export, title, install_roots))
+
+    def _install_export(self, title: str, install_roots: List[Path], export_result: ExportResult) -> None:
+        from ..core.exporters import install_icon_pack
+
         installed, failures = install_icon_pack(export_result, install_roots)
         message: List[str] = []
         if installed:
@@ -912,26 +1189,89 @@ class MainWindow(QMainWindow):
             message = ["No destinations were available for installation."]
         QMessageBox.information(self, title, "\n".join(message))
 
-    def _perform_export(self, *, prompt_for_directory: bool) -> ExportResult | None:
+    def _perform_export(
+        self,
+        *,
+        prompt_for_directory: bool,
+        on_success: Callable[[ExportResult], None],
+    ) -> None:
+        """Export on a worker thread behind a progress dialog, then call ``on_success``."""
+        if self._export_worker is not None:
+            return
         if not self._ensure_metadata():
-            return None
+            return
         if not self._icons:
             QMessageBox.information(self, "Add icons", "Create at least one icon first.")
-            return None
+            return
         assert self._settings is not None  # satisfied by _ensure_metadata
         if prompt_for_directory:
             export_dir = self._prompt_export_directory()
             if export_dir is None:
-                return None
+                return
             self._settings.output_dir = export_dir
-        try:
-            export_result = export_icon_pack(self._settings, self._icons)
-        except Exception as exc:  # pragma: no cover - filesystem errors
-            QMessageBox.critical(self, "Export failed", str(exc))
-            return None
+        from .workers import ExportWorker
+
+        # Export stats every source afresh; the thumbnails reuse the result.
+        self._file_status.invalidate()
+        worker = ExportWorker(self._settings, list(self._icons), self._file_status, jobs=os.cpu_count() or 1)
+        progress = QProgressDialog(f"Exporting '{self._settings.name}'…", "Cancel", 0, 0, self)
+        progress.setWindowTitle("Exporting icon theme")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(300)
+        progress.setAutoReset(False)
+        progress.setAutoClose(False)
+        progress.canceled.connect(worker.cancel)
+        worker.signals.progress.connect(partial(self._handle_export_progress, worker))
+        worker.signals.finished.connect(partial(self._handle_export_finished, worker, on_success))
+        worker.signals.failed.connect(partial(self._handle_export_failed, worker))
+        self._export_worker = worker
+        self._export_progress = progress
+        self._update_action_states()
+        QThreadPool.globalInstance().start(worker)
+
+    def _close_export_progress(self) -> None:
+        self._export_worker = None
+        if self._export_progress is not None:
+            self._export_progress.close()
+            self._export_progress.deleteLater()
+            self._export_progress = None
+        self._update_action_states()
+
+    def _handle_export_progress(self, worker: ExportWorker, done: int, total: int) -> None:
+        if worker is not self._export_worker or self._export_progress is None:
+            return
+        self._export_progress.setMaximum(total)
+        self._export_progress.setValue(min(done, total))
+        self._export_progress.setLabelText(f"Exported {done} of {total} files…")
+
+    def _handle_export_finished(
+        self,
+        worker: ExportWorker,
+        on_success: Callable[[ExportResult], None],
+        export_result: ExportResult | None,
+        cancelled: bool,
+    ) -> None:
+        if worker is not self._export_worker:
+            return
+        self._close_export_progress()
+        if cancelled or export_result is None:
+            self.statusBar().showMessage("Export cancelled.", 5000)
+            return
         self._record_recent_project(export_result.pack_root)
         self._last_export_result = export_result
-        return export_result
+        timings = export_result.timings
+        self.statusBar().showMessage(
+            f"Exported in {timings.total:.1f}s (prepare {timings.prepare:.1f}s, copy {timings.copy:.1f}s, "
+            f"render {timings.render:.1f}s, descriptors {timings.descriptors:.1f}s).",
+            10000,
+        )
+        on_success(export_result)
+
+    def _handle_export_failed(self, worker: ExportWorker, message: str) -> None:
+        if worker is not self._export_worker:
+            return
+        self._close_export_progress()
+        QMessageBox.critical(self, "Export failed", message)
 
     def _prompt_export_directory(self) -> Path | None:
         if self._settings is None:
@@ -946,246 +1286,3 @@ class MainWindow(QMainWindow):
         if not directory:
             return None
         return Path(directory)
-
-
-class MetadataDialog(QDialog):
-    """Dialog that captures pack metadata for a project."""
-
-    def __init__(self, parent: QWidget | None, settings: PackSettings | None = None) -> None:
-        super().__init__(parent)
-        self.setWindowTitle("Project metadata")
-        self._name_edit = QLineEdit(settings.name if settings else "")
-        self._author_edit = QLineEdit(settings.author if settings else "")
-        self._description_edit = QPlainTextEdit(settings.description if settings else "")
-        self._inherits_combo = QComboBox()
-        self._inherits_combo.addItems(["breeze", "papirus", "adwaita", "hicolor"])
-        if settings:
-            index = self._inherits_combo.findText(settings.inherits)
-            if index >= 0:
-                self._inherits_combo.setCurrentIndex(index)
-        self._sizes_edit = QLineEdit(
-            ",".join(str(size) for size in (settings.base_sizes if settings else [16, 24, 32, 48, 64, 128]))
-        )
-        self._output_dir_edit = QLineEdit(str(settings.output_dir if settings else Path("build")))
-        browse_button = QPushButton("Browse…")
-        browse_button.clicked.connect(self._select_output_directory)
-
-        self._gtk_checkbox = QCheckBox("GTK (GNOME, Cinnamon, Xfce)")
-        self._qt_checkbox = QCheckBox("Qt / KDE Plasma")
-        existing_targets = set(settings.targets if settings else ["gnome", "kde"])
-        self._gtk_checkbox.setChecked("gnome" in existing_targets)
-        self._qt_checkbox.setChecked("kde" in existing_targets)
-
-        form = QFormLayout(self)
-        form.addRow("Name", self._name_edit)
-        form.addRow("Author", self._author_edit)
-        form.addRow("Description", self._description_edit)
-        form.addRow("Inherits", self._inherits_combo)
-        form.addRow("Base sizes", self._sizes_edit)
-
-        output_row = QHBoxLayout()
-        output_row.addWidget(self._output_dir_edit)
-        output_row.addWidget(browse_button)
-        form.addRow("Output", output_row)
-
-        targets_widget = QWidget()
-        targets_layout = QVBoxLayout(targets_widget)
-        targets_layout.setContentsMargins(0, 0, 0, 0)
-        targets_layout.addWidget(self._gtk_checkbox)
-        targets_layout.addWidget(self._qt_checkbox)
-        form.addRow("Targets", targets_widget)
-
-        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
-        buttons.accepted.connect(self._handle_accept)
-        buttons.rejected.connect(self.reject)
-        form.addWidget(buttons)
-
-        self._result: PackSettings | None = settings
-
-    @staticmethod
-    def prompt(parent: QWidget | None, settings: PackSettings | None) -> PackSettings | None:
-        dialog = MetadataDialog(parent, settings)
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            return dialog._result
-        return None
-
-    def _handle_accept(self) -> None:
-        name = self._name_edit.text().strip()
-        author = self._author_edit.text().strip()
-        if not name or not author:
-            QMessageBox.warning(self, "Missing fields", "Both name and author are required.")
-            return
-        sizes: List[int] = []
-        for chunk in self._sizes_edit.text().split(","):
-            chunk = chunk.strip()
-            if not chunk:
-                continue
-            try:
-                size = int(chunk)
-            except ValueError:
-                continue
-            if size > 0:
-                sizes.append(size)
-        if not sizes:
-            QMessageBox.warning(self, "Invalid sizes", "Provide at least one valid icon size.")
-            return
-        targets: List[str] = []
-        if self._gtk_checkbox.isChecked():
-            targets.append("gnome")
-        if self._qt_checkbox.isChecked():
-            targets.append("kde")
-        if not targets:
-            QMessageBox.warning(self, "Pick targets", "Select at least one target platform (GTK or Qt).")
-            return
-        self._result = PackSettings(
-            name=name,
-            author=author,
-            description=self._description_edit.toPlainText().strip(),
-            inherits=self._inherits_combo.currentText(),
-            base_sizes=sorted(set(sizes)),
-            output_dir=Path(self._output_dir_edit.text().strip() or "build"),
-            targets=targets,
-        )
-        self.accept()
-
-    def _select_output_directory(self) -> None:
-        directory = QFileDialog.getExistingDirectory(self, "Choose output directory")
-        if directory:
-            self._output_dir_edit.setText(directory)
-
-
-class BaseThemeDialog(QDialog):
-    """Dialog that captures the base theme, inherits value, and target platforms."""
-
-    def __init__(
-        self,
-        parent: QWidget | None = None,
-        default_theme: str | None = None,
-        extra_search_paths: Iterable[Path] | None = None,
-    ) -> None:
-        super().__init__(parent)
-        self.setWindowTitle("Choose base icon theme")
-        self.resize(560, 520)
-
-        self._themes: List[ThemeCandidate] = list_installed_themes(extra_search_paths)
-        self._list = QListWidget()
-        self._list.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
-        for candidate in self._themes:
-            item = QListWidgetItem(candidate.name)
-            item.setData(Qt.ItemDataRole.UserRole, candidate.path)
-            self._list.addItem(item)
-
-        intro = QLabel("Select one of your installed icon packs (or browse to a folder) to inherit from.")
-        intro.setWordWrap(True)
-
-        browse_button = QPushButton("Browse…")
-        browse_button.clicked.connect(self._browse_for_theme)
-
-        inherits_label = QLabel("Inherits")
-        self._inherits_edit = QLineEdit(default_theme or "breeze")
-
-        self._gtk_checkbox = QCheckBox("GTK (GNOME, Cinnamon, Xfce)")
-        self._qt_checkbox = QCheckBox("Qt / KDE Plasma")
-        self._gtk_checkbox.setChecked(True)
-        self._qt_checkbox.setChecked(True)
-
-        button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
-        button_box.accepted.connect(self._handle_accept)
-        button_box.rejected.connect(self.reject)
-
-        inherits_row = QHBoxLayout()
-        inherits_row.addWidget(inherits_label)
-        inherits_row.addWidget(self._inherits_edit)
-
-        targets_widget = QWidget()
-        targets_layout = QVBoxLayout(targets_widget)
-        targets_layout.setContentsMargins(0, 0, 0, 0)
-        targets_layout.addWidget(self._gtk_checkbox)
-        targets_layout.addWidget(self._qt_checkbox)
-
-        layout = QVBoxLayout(self)
-        layout.addWidget(intro)
-        layout.addWidget(self._list)
-        layout.addWidget(browse_button, alignment=Qt.AlignmentFlag.AlignRight)
-        layout.addLayout(inherits_row)
-        layout.addWidget(targets_widget)
-        layout.addWidget(button_box)
-
-        if self._list.count() > 0:
-            self._list.setCurrentRow(0)
-        if default_theme:
-            self._select_theme_by_name(default_theme)
-
-        self._selected_path: Path | None = None
-        self._result: tuple[List[IconDefinition], str, str, List[str]] | None = None
-
-    @staticmethod
-    def prompt(parent: QWidget | None = None, default_theme: str | None = None) -> tuple[List[IconDefinition], str, str, List[str]] | None:
-        dialog = BaseThemeDialog(parent, default_theme=default_theme)
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            return dialog._result
-        return None
-
-    def _select_theme_by_name(self, name: str) -> None:
-        for index in range(self._list.count()):
-            item = self._list.item(index)
-            if item.text().split(" (")[0].lower() == name.lower():
-                self._list.setCurrentRow(index)
-                if not self._inherits_edit.text().strip():
-                    self._inherits_edit.setText(name)
-                return
-
-    def _handle_accept(self) -> None:
-        path = self._resolve_selection()
-        if path is None:
-            QMessageBox.warning(self, "Select a theme", "Choose a theme from the list or browse to one.")
-            return
-        inherits_value = self._inherits_edit.text().strip() or path.name
-        targets: List[str] = []
-        if self._gtk_checkbox.isChecked():
-            targets.append("gnome")
-        if self._qt_checkbox.isChecked():
-            targets.append("kde")
-        if not targets:
-            QMessageBox.warning(self, "Pick targets", "Select at least one target platform (GTK or Qt).")
-            return
-        try:
-            icons = load_icons_from_directory(path)
-        except Exception as exc:
-            QMessageBox.warning(self, "Unable to load theme", str(exc))
-            return
-        if not icons:
-            QMessageBox.warning(
-                self,
-                "No icons found",
-                "The selected folder does not contain any icon assets. Choose another theme.",
-            )
-            return
-
-        self._result = (icons, path.name, inherits_value, targets)
-        self.accept()
-
-    def _resolve_selection(self) -> Path | None:
-        item = self._list.currentItem()
-        if item is not None:
-            data = item.data(Qt.ItemDataRole.UserRole)
-            if isinstance(data, Path):
-                return data
-            if data:
-                return Path(str(data))
-        return self._selected_path
-
-    def _browse_for_theme(self) -> None:
-        directory = QFileDialog.getExistingDirectory(self, "Select icon theme folder", str(Path.home()))
-        if not directory:
-            return
-        path = Path(directory)
-        label = f"{path.name} ({path})"
-        item = QListWidgetItem(label)
-        item.setData(Qt.ItemDataRole.UserRole, path)
-        self._list.addItem(item)
-        self._list.setCurrentItem(item)
-        self._selected_path = path
-        if not self._inherits_edit.text().strip():
-            self._inherits_edit.setText(path.name)
-
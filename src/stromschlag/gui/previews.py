@@ -0,0 +1,113 @@
+"""Background rendering of the large canvas preview."""
+from __future__ import annotations
+
+from pathlib import Path
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Qt, Signal
+from PySide6.QtGui import QImage, QPixmap
+
+from ..core.file_status import StatSnapshot
+from ..core.rasterize import render_image
+from .thumbnails import ThumbnailCache, ThumbnailKey
+
+_VECTOR_SUFFIXES = {".svg", ".svgz"}
+
+
+def load_preview_image(path: Path, size: int) -> QImage | None:
+    """Decode ``path`` for a ``size`` pixel preview; safe to call from worker threads.
+
+    Vector artwork is rendered at ``size``; bitmaps are only ever scaled down.
+    """
+
+    if path.suffix.lower() in _VECTOR_SUFFIXES:
+        try:
+            return render_image(path, size)
+        except (OSError, ValueError):
+            return None
+    image = QImage(str(path))
+    if image.isNull():
+        return None
+    if image.width() > size or image.height() > size:
+        image = image.scaled(
+            size,
+            size,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+    return image
+
+
+class PreviewSignals(QObject):
+    loaded = Signal(object, object)
+
+
+class PreviewLoader(QRunnable):
+    """Decode a single preview on a thread pool."""
+
+    def __init__(self, key: ThumbnailKey) -> None:
+        super().__init__()
+        self.signals = PreviewSignals()
+        self._key = key
+
+    def run(self) -> None:
+        self.signals.loaded.emit(self._key, load_preview_image(Path(self._key[0]), self._key[2]))
+
+
+class PreviewProvider(QObject):
+    """Renders previews off the GUI thread, keeping the most recent ones in memory.
+
+    At most one preview renders at a time. Requests made meanwhile replace one
+    another, so arrowing quickly through the tree only renders the icon the
+    selection settles on. ``ready`` carries the key and the pixmap, or
+    ``None`` when the artwork could not be read. Source mtimes come from
+    ``file_status`` when given.
+    """
+
+    ready = Signal(object, object)
+
+    def __init__(
+        self,
+        size: int = 360,
+        capacity: int = 24,
+        parent: QObject | None = None,
+        file_status: StatSnapshot | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._size = size
+        self._file_status = file_status
+        self._cache = ThumbnailCache(capacity)
+        self._running: ThumbnailKey | None = None
+        self._pending: ThumbnailKey | None = None
+
+    def key_for(self, path: Path | None) -> ThumbnailKey | None:
+        return self._cache.key_for(path, self._size, self._file_status)
+
+    def request(self, key: ThumbnailKey) -> QPixmap | None:
+        """Return the cached preview for ``key`` or schedule it, superseding older requests."""
+
+        pixmap = self._cache.get(key)
+        if pixmap is not None:
+            return pixmap
+        if key == self._running:
+            self._pending = None
+        elif self._running is None:
+            self._start(key)
+        else:
+            self._pending = key
+        return None
+
+    def _start(self, key: ThumbnailKey) -> None:
+        self._running = key
+        loader = PreviewLoader(key)
+        loader.signals.loaded.connect(self._handle_loaded)
+        QThreadPool.globalInstance().start(loader)
+
+    def _handle_loaded(self, key: ThumbnailKey, image: QImage | None) -> None:
+        self._running = None
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            self._start(pending)
+        if image is None or image.isNull():
+            self.ready.emit(key, None)
+            return
+        self.ready.emit(key, self._cache.put(key, image))
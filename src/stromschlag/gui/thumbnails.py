@@ -0,0 +1,209 @@
+"""Thumbnail caching for the icon tree."""
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from functools import partial
+from pathlib import Path
+from typing import List, Tuple
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal
+from PySide6.QtGui import QImage, QPixmap
+
+from ..core.disk_budget import DiskBudget
+from ..core.file_status import StatSnapshot
+from ..core.rasterize import render_image
+from ..core.utils import ensure_directory, user_cache_dir
+
+ThumbnailKey = Tuple[str, int, int]
+"""``(source path, source mtime_ns, size)``."""
+
+DEFAULT_DISK_BYTES = 128 * 1024 * 1024
+
+
+class ThumbnailCache:
+    """In-memory LRU of decoded thumbnails, backed by PNG files on disk.
+
+    Keys embed the source's mtime, so edited artwork never hits a stale entry;
+    the entries it replaces are no longer used and age out of the disk store,
+    which :meth:`prune_disk` keeps under ``max_disk_bytes`` like the render
+    cache. :meth:`disk_path`, :meth:`load_image` and :meth:`prune_disk` are
+    safe to call from worker threads; the pixmap store must only be touched
+    on the GUI thread.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 4096,
+        cache_dir: Path | None = None,
+        max_disk_bytes: int = DEFAULT_DISK_BYTES,
+    ) -> None:
+        self._capacity = capacity
+        self._pixmaps: OrderedDict[ThumbnailKey, QPixmap] = OrderedDict()
+        self._root = (cache_dir or user_cache_dir()) / "thumbnails"
+        self._budget = DiskBudget(self._root, max_disk_bytes)
+
+    @staticmethod
+    def key_for(path: Path | None, size: int, file_status: StatSnapshot | None = None) -> ThumbnailKey | None:
+        if path is None:
+            return None
+        if file_status is not None:
+            status = file_status.stat(path)
+            return (str(path), status.mtime_ns, size) if status.exists else None
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        return str(path), mtime_ns, size
+
+    def get(self, key: ThumbnailKey) -> QPixmap | None:
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+        return pixmap
+
+    def put(self, key: ThumbnailKey, image: QImage) -> QPixmap:
+        pixmap = QPixmap.fromImage(image)
+        self._pixmaps[key] = pixmap
+        self._pixmaps.move_to_end(key)
+        while len(self._pixmaps) > self._capacity:
+            self._pixmaps.popitem(last=False)
+        return pixmap
+
+    def disk_path(self, key: ThumbnailKey) -> Path:
+        path, mtime_ns, size = key
+        digest = hashlib.sha1(f"{path}\0{mtime_ns}\0{size}".encode("utf-8", "surrogateescape")).hexdigest()
+        return self._root / digest[:2] / f"{digest}.png"
+
+    def load_image(self, key: ThumbnailKey) -> QImage | None:
+        """Decode a thumbnail from the disk store, rendering and storing it on a miss."""
+
+        stored = self.disk_path(key)
+        image = QImage(str(stored))
+        if not image.isNull():
+            with contextlib.suppress(OSError):
+                os.utime(stored)
+            return image
+        try:
+            image = render_image(Path(key[0]), key[2])
+        except (OSError, ValueError):
+            return None
+        try:
+            ensure_directory(stored.parent)
+            temporary = stored.with_name(f".{stored.stem}.{threading.get_ident()}.tmp")
+            if image.save(str(temporary), "PNG"):
+                self._budget.add(temporary.stat().st_size)
+                os.replace(temporary, stored)
+        except OSError:
+            pass
+        return image
+
+    def prune_disk(self) -> int:
+        """Evict least recently used thumbnails from disk; return files removed."""
+
+        return self._budget.prune()
+
+
+class ThumbnailSignals(QObject):
+    loaded = Signal(object, object)
+    finished = Signal()
+
+
+class ThumbnailLoader(QRunnable):
+    """Decode a list of thumbnails on a thread pool, emitting each as it is ready."""
+
+    def __init__(self, cache: ThumbnailCache, keys: List[ThumbnailKey]) -> None:
+        super().__init__()
+        self.signals = ThumbnailSignals()
+        self._cache = cache
+        self._keys = keys
+        self._cancel_event = threading.Event()
+
+    def cancel(self) -> None:
+        self._cancel_event.set()
+
+    def run(self) -> None:
+        for key in self._keys:
+            if self._cancel_event.is_set():
+                break
+            self.signals.loaded.emit(key, self._cache.load_image(key))
+        self._cache.prune_disk()
+        self.signals.finished.emit()
+
+
+class ThumbnailProvider(QObject):
+    """Hands out cached thumbnails and loads missing ones in the background.
+
+    Misses requested during one event-loop pass are batched into a single
+    :class:`ThumbnailLoader`; ``ready`` fires once a thumbnail is available.
+    :meth:`cancel_pending` drops the loads queued for icons that are gone.
+    Source mtimes come from ``file_status`` when given, so repaints do not
+    stat the artwork again.
+    """
+
+    ready = Signal(object)
+
+    def __init__(
+        self,
+        size: int = 32,
+        parent: QObject | None = None,
+        file_status: StatSnapshot | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._size = size
+        self._file_status = file_status
+        self._cache = ThumbnailCache()
+        self._queued: List[ThumbnailKey] = []
+        self._in_flight: set[ThumbnailKey] = set()
+        self._failures: set[ThumbnailKey] = set()
+        self._loaders: set[ThumbnailLoader] = set()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(0)
+        self._flush_timer.timeout.connect(self._flush)
+
+    def key_for(self, path: Path | None) -> ThumbnailKey | None:
+        return self._cache.key_for(path, self._size, self._file_status)
+
+    def request(self, key: ThumbnailKey) -> QPixmap | None:
+        """Return the thumbnail for ``key`` or queue it for loading."""
+
+        pixmap = self._cache.get(key)
+        if pixmap is None and key not in self._in_flight and key not in self._failures:
+            self._in_flight.add(key)
+            self._queued.append(key)
+            self._flush_timer.start()
+        return pixmap
+
+    def cancel_pending(self) -> None:
+        """Stop loading every queued thumbnail; later requests queue them again."""
+
+        for loader in self._loaders:
+            loader.cancel()
+        self._loaders.clear()
+        self._flush_timer.stop()
+        self._queued = []
+        self._in_flight.clear()
+
+    def _flush(self) -> None:
+        keys, self._queued = self._queued, []
+        if not keys:
+            return
+        loader = ThumbnailLoader(self._cache, keys)
+        loader.signals.loaded.connect(partial(self._handle_loaded, loader))
+        loader.signals.finished.connect(partial(self._loaders.discard, loader))
+        self._loaders.add(loader)
+        QThreadPool.globalInstance().start(loader)
+
+    def _handle_loaded(self, loader: ThumbnailLoader, key: ThumbnailKey, image: QImage | None) -> None:
+        if loader not in self._loaders:
+            return
+        self._in_flight.discard(key)
+        if image is None or image.isNull():
+            self._failures.add(key)
+            return
+        self._cache.put(key, image)
+        self.ready.emit(key)
@@ -0,0 +1,232 @@
+"""Background workers that keep long-running jobs off the GUI thread."""
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from typing import List
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from ..core.exporters import ExportCancelled, ExportEvent, export_icon_pack
+from ..core.file_status import StatSnapshot
+from ..core.models import IconDefinition, PackSettings
+from ..core.project_io import open_project_stream
+from ..core.search import FuzzyMatcher, search_fields
+from ..core.source_scanner import IconSource, find_project_descriptor, scan_icon_sources
+from ..core.theme_loader import iter_icon_batches
+
+
+class ThemeLoadSignals(QObject):
+    """Signals emitted by :class:`ThemeLoadWorker` (delivered on the GUI thread)."""
+
+    batch = Signal(list, bool)
+    finished = Signal(bool)
+    failed = Signal(str)
+
+
+class ThemeLoadWorker(QRunnable):
+    """Scan an icon theme on a thread pool and stream the icons back in batches.
+
+    ``batch`` carries the icons and True when they replace every earlier
+    batch (see :class:`~stromschlag.core.theme_loader.IconBatch`).
+    ``finished`` carries True when the scan was cancelled before completing.
+    """
+
+    def __init__(self, theme_root: Path, batch_size: int = 500) -> None:
+        super().__init__()
+        self.signals = ThemeLoadSignals()
+        self._theme_root = theme_root
+        self._batch_size = batch_size
+        self._cancel_event = threading.Event()
+
+    def cancel(self) -> None:
+        self._cancel_event.set()
+
+    def run(self) -> None:
+        try:
+            for batch in iter_icon_batches(
+                self._theme_root,
+                self._batch_size,
+                cancelled=self._cancel_event.is_set,
+            ):
+                self.signals.batch.emit(batch.icons, batch.replace)
+        except Exception as exc:  # pragma: no cover - filesystem errors
+            self.signals.failed.emit(str(exc))
+            return
+        self.signals.finished.emit(self._cancel_event.is_set())
+
+
+class SearchSignals(QObject):
+    """Signals emitted by :class:`SearchWorker` (delivered on the GUI thread)."""
+
+    finished = Signal(object, object)
+
+
+class SearchWorker(QRunnable):
+    """Rank icons against a search query on a thread pool.
+
+    Uses ``matcher``, or builds a :class:`FuzzyMatcher` over ``icons`` first
+    when it is ``None``. ``finished`` carries the matcher and the
+    ``(row, score)`` matches, best first.
+    """
+
+    def __init__(self, query: str, matcher: FuzzyMatcher | None, icons: List[IconDefinition]) -> None:
+        super().__init__()
+        self.signals = SearchSignals()
+        self._query = query
+        self._matcher = matcher
+        self._icons = icons
+
+    def run(self) -> None:
+        matcher = self._matcher
+        if matcher is None:
+            matcher = FuzzyMatcher([search_fields(icon) for icon in self._icons])
+        self.signals.finished.emit(matcher, matcher.search(self._query) or [])
+
+
+class ProjectLoadSignals(QObject):
+    """Signals emitted by :class:`ProjectLoadWorker` (delivered on the GUI thread)."""
+
+    header = Signal(object)
+    batch = Signal(list)
+    finished = Signal(bool)
+    failed = Signal(str)
+
+
+class ProjectLoadWorker(QRunnable):
+    """Read a project file on a thread pool and stream its icons back in batches.
+
+    ``header`` carries the :class:`PackSettings` before the first batch. Keys
+    stored after the icon list are applied to that same object before
+    ``finished``, which carries True when loading was cancelled.
+    """
+
+    def __init__(self, path: Path, batch_size: int = 1000) -> None:
+        super().__init__()
+        self.signals = ProjectLoadSignals()
+        self._path = path
+        self._batch_size = batch_size
+        self._cancel_event = threading.Event()
+
+    def cancel(self) -> None:
+        self._cancel_event.set()
+
+    def run(self) -> None:
+        try:
+            with open_project_stream(self._path, self._batch_size) as stream:
+                self.signals.header.emit(stream.settings)
+                for batch in stream:
+                    if self._cancel_event.is_set():
+                        break
+                    self.signals.batch.emit(batch)
+        except Exception as exc:  # pragma: no cover - unreadable or malformed projects
+            self.signals.failed.emit(str(exc))
+            return
+        self.signals.finished.emit(self._cancel_event.is_set())
+
+
+class FolderOpenSignals(QObject):
+    """Signals emitted by :class:`FolderOpenWorker` (delivered on the GUI thread)."""
+
+    scanning = Signal()
+    finished = Signal(object, list, bool)
+
+
+class FolderOpenWorker(QRunnable):
+    """Find what opening a folder should load, on a thread pool.
+
+    Looks for a project file below the folder; when there is none,
+    ``scanning`` is emitted and the folder's artwork is scanned instead.
+    ``finished`` carries the descriptor path (or ``None``), the scanned
+    icon sources (empty when a descriptor was found) and True when the work
+    was cancelled.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        super().__init__()
+        self.signals = FolderOpenSignals()
+        self._directory = directory
+        self._cancel_event = threading.Event()
+
+    def cancel(self) -> None:
+        self._cancel_event.set()
+
+    def run(self) -> None:
+        cancelled = self._cancel_event.is_set
+        descriptor = find_project_descriptor(self._directory, cancelled=cancelled)
+        sources: List[IconSource] = []
+        if descriptor is None and not cancelled():
+            self.signals.scanning.emit()
+            sources = scan_icon_sources(self._directory, cancelled=cancelled)
+        self.signals.finished.emit(descriptor, sources, cancelled())
+
+
+class ExportSignals(QObject):
+    """Signals emitted by :class:`ExportWorker` (delivered on the GUI thread)."""
+
+    progress = Signal(int, int)
+    finished = Signal(object, bool)
+    failed = Signal(str)
+
+
+class ExportWorker(QRunnable):
+    """Export an icon pack on a thread pool, reporting how many files are done.
+
+    ``progress`` carries ``(files done, files planned)`` at most every
+    ``interval`` seconds. ``finished`` carries the :class:`ExportResult`, or
+    ``None`` and True when the export was cancelled. Files are written by
+    ``jobs`` threads.
+    """
+
+    def __init__(
+        self,
+        settings: PackSettings,
+        icons: List[IconDefinition],
+        file_status: StatSnapshot | None = None,
+        interval: float = 0.05,
+        jobs: int = 1,
+    ) -> None:
+        super().__init__()
+        self.signals = ExportSignals()
+        self._settings = settings
+        self._icons = icons
+        self._file_status = file_status
+        self._jobs = jobs
+        self._interval = interval
+        self._cancel_event = threading.Event()
+        self._planned = 0
+        self._done = 0
+        self._reported_at = 0.0
+
+    def cancel(self) -> None:
+        self._cancel_event.set()
+
+    def run(self) -> None:
+        try:
+            result = export_icon_pack(
+                self._settings,
+                self._icons,
+                jobs=self._jobs,
+                file_status=self._file_status,
+                progress=self._handle_event,
+                cancelled=self._cancel_event.is_set,
+            )
+        except ExportCancelled:
+            self.signals.finished.emit(None, True)
+            return
+        except Exception as exc:  # pragma: no cover - filesystem errors
+            self.signals.failed.emit(str(exc))
+            return
+        self.signals.progress.emit(self._planned, self._planned)
+        self.signals.finished.emit(result, False)
+
+    def _handle_event(self, event: ExportEvent) -> None:
+        if event.kind == "planned":
+            self._planned = event.count
+        elif event.kind != "failed":
+            self._done += event.count
+        now = time.monotonic()
+        if event.kind == "planned" or now - self._reported_at >= self._interval:
+            self._reported_at = now
+            self.signals.progress.emit(self._done, self._planned)
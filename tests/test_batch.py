@@ -0,0 +1,90 @@
+"""Tests for batch builds of several projects."""
+from pathlib import Path
+
+import pytest
+
+from stromschlag.cli import main
+from stromschlag.core import utils
+from stromschlag.core.batch import ExportOptions, build_projects, expand_project_paths
+from stromschlag.core.models import IconDefinition, PackSettings
+from stromschlag.core.project_io import save_project
+
+
+def _make_project(root: Path, name: str, source: Path) -> Path:
+    settings = PackSettings(name=name, author="Tester", base_sizes=[32], targets=["kde"])
+    project_file = root / "stromschlag.yaml"
+    save_project(project_file, settings, [IconDefinition(name="folder", source_path=source)])
+    return project_file
+
+
+def _make_packs(tmp_path: Path) -> list[Path]:
+    shared = tmp_path / "art" / "folder.png"
+    shared.parent.mkdir()
+    shared.write_bytes(b"shared artwork")
+    return [_make_project(tmp_path / "packs" / name, name.title(), shared) for name in ("alpha", "beta")]
+
+
+def test_expand_project_paths_accepts_globs_and_directories(tmp_path: Path) -> None:
+    alpha, beta = _make_packs(tmp_path)
+
+    found = expand_project_paths([str(tmp_path / "packs" / "**" / "stromschlag.yaml"), str(alpha.parent)])
+
+    assert found == [alpha, beta]
+
+
+def test_build_projects_reports_outcomes(tmp_path: Path) -> None:
+    projects = _make_packs(tmp_path) + [tmp_path / "missing" / "stromschlag.yaml"]
+
+    summary = build_projects(projects, ExportOptions(output_dir=tmp_path / "out"), workers=2)
+
+    assert [outcome.project for outcome in summary.outcomes] == projects
+    assert [outcome.ok for outcome in summary.outcomes] == [True, True, False]
+    assert summary.failures[0].error is not None
+    for slug, name in (("alpha", "Alpha"), ("beta", "Beta")):
+        assert (tmp_path / "out" / slug / "kde" / name / "32x32" / "apps" / "folder.png").exists()
+
+
+def test_build_projects_fails_projects_sharing_a_pack_directory(tmp_path: Path) -> None:
+    alpha, beta = _make_packs(tmp_path)
+    twin = _make_project(tmp_path / "packs" / "twin", "Alpha", tmp_path / "art" / "folder.png")
+
+    summary = build_projects([alpha, beta, twin], ExportOptions(output_dir=tmp_path / "out"), workers=2)
+
+    assert [outcome.ok for outcome in summary.outcomes] == [False, True, False]
+    assert str(twin) in (summary.outcomes[0].error or "")
+    assert str(alpha) in (summary.outcomes[2].error or "")
+    assert not (tmp_path / "out" / "alpha").exists()
+    assert (tmp_path / "out" / "beta").exists()
+
+
+def test_digest_memo_rehashes_changed_files(tmp_path: Path) -> None:
+    source = tmp_path / "icon.png"
+    source.write_bytes(b"one")
+    first = utils.cached_file_digest(source)
+    assert utils.cached_file_digest(source) == first
+
+    source.write_bytes(b"two!")
+
+    assert utils.cached_file_digest(source) == utils.file_digest(source) != first
+
+
+def test_digest_memo_keeps_recent_entries_only(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(utils, "_DIGEST_MEMO_SIZE", 2)
+    utils._DIGEST_MEMO.clear()
+    sources = [tmp_path / f"{index}.png" for index in range(3)]
+    for source in sources:
+        source.write_bytes(source.name.encode("ascii"))
+        utils.cached_file_digest(source)
+
+    assert [key[0] for key in utils._DIGEST_MEMO] == [str(source) for source in sources[1:]]
+
+
+def test_batch_command_exits_nonzero_on_failure(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    alpha, _beta = _make_packs(tmp_path)
+
+    exit_code = main(["batch", str(alpha), str(tmp_path / "nope.yaml"), "--workers", "1"])
+
+    output = capsys.readouterr().out
+    assert exit_code == 1
+    assert "ok " in output and "FAIL" in output
+    assert "2 projects, 1 failed" in output
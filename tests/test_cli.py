@@ -0,0 +1,112 @@
+"""Tests for the command-line interface."""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from stromschlag.cli import main
+from stromschlag.core.models import IconDefinition, PackSettings
+from stromschlag.core.project_io import save_project
+
+
+def _make_project(root: Path) -> Path:
+    source = root / "art" / "folder.png"
+    source.parent.mkdir(parents=True)
+    source.write_bytes(b"png")
+    settings = PackSettings(name="CLI Pack", author="Tester", base_sizes=[32], targets=["gnome", "kde"])
+    project_file = root / "stromschlag.yaml"
+    save_project(project_file, settings, [IconDefinition(name="folder", source_path=source, category="apps")])
+    return project_file
+
+
+def test_export_uses_project_settings(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    project_file = _make_project(tmp_path)
+
+    assert main(["export", str(project_file), "--jobs", "1"]) == 0
+
+    pack_root = tmp_path / "build" / "cli-pack"
+    assert (pack_root / "gnome" / "CLI Pack" / "32x32" / "apps" / "folder.png").exists()
+    assert (pack_root / "kde" / "CLI Pack" / "32x32" / "apps" / "folder.png").exists()
+    assert "Exported 'CLI Pack'" in capsys.readouterr().out
+
+
+def test_export_flags_override_project(tmp_path: Path) -> None:
+    _make_project(tmp_path)
+    output = tmp_path / "out"
+
+    exit_code = main(
+        ["export", str(tmp_path), "--output", str(output), "--target", "kde", "--sizes", "16,48"]
+    )
+
+    theme_root = output / "cli-pack" / "kde" / "CLI Pack"
+    assert exit_code == 0
+    assert (theme_root / "16x16" / "apps" / "folder.png").exists()
+    assert (theme_root / "48x48" / "apps" / "folder.png").exists()
+    assert not (theme_root / "32x32").exists()
+    assert not (output / "cli-pack" / "gnome").exists()
+
+
+def test_export_installs_into_given_roots(tmp_path: Path) -> None:
+    _make_project(tmp_path)
+    icons_dir = tmp_path / "icons"
+
+    assert main(["export", str(tmp_path), "--target", "kde", "--install-root", str(icons_dir)]) == 0
+    assert (icons_dir / "cli-pack" / "index.theme").exists()
+
+
+def test_export_reports_missing_project(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["export", str(tmp_path / "missing.yaml")]) == 1
+    assert "cannot load" in capsys.readouterr().err
+
+
+def test_invalid_sizes_are_rejected(tmp_path: Path) -> None:
+    with pytest.raises(SystemExit):
+        main(["export", str(tmp_path), "--sizes", "16,big"])
+
+
+def test_export_does_not_import_qt(tmp_path: Path) -> None:
+    project_file = _make_project(tmp_path)
+    script = (
+        "import sys\n"
+        "from stromschlag.cli import main\n"
+        f"code = main(['export', {str(project_file)!r}])\n"
+        "assert not any(name.split('.')[0] == 'PySide6' for name in sys.modules), 'PySide6 imported'\n"
+        "sys.exit(code)\n"
+    )
+    completed = _run_python(script)
+
+    assert completed.returncode == 0, completed.stderr
+
+
+@pytest.mark.parametrize("command", [[], ["export"], ["batch"]])
+def test_help_does_not_import_the_exporter(command: list) -> None:
+    script = (
+        "import sys\n"
+        "from stromschlag.cli import main\n"
+        "try:\n"
+        f"    main({command + ['--help']!r})\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "loaded = {'stromschlag.core.exporters', 'yaml'} & set(sys.modules)\n"
+        "assert not loaded, sorted(loaded)\n"
+    )
+
+    completed = _run_python(script)
+
+    assert completed.returncode == 0, completed.stderr
+    assert "usage:" in completed.stdout
+
+
+def test_link_mode_choices_match_the_exporter() -> None:
+    from stromschlag import cli
+    from stromschlag.core.exporters import LINK_MODES
+
+    assert cli._LINK_MODES == LINK_MODES
+
+
+def _run_python(script: str) -> subprocess.CompletedProcess:
+    source_root = Path(__file__).resolve().parents[1] / "src"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(source_root), os.environ.get("PYTHONPATH")]))}
+    return subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True)
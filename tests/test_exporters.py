@@ -1,10 +1,17 @@
 """Tests for exporter behavior."""
+import os
+import shutil
 from pathlib import Path
 
+import pytest
 import yaml
 
-from stromschlag.core.exporters import export_icon_pack, install_icon_pack
+from stromschlag.core import exporters, rasterize, render_cache
+from stromschlag.core.exporters import EXPORT_EVENTS, ExportCancelled, export_icon_pack, install_icon_pack
 from stromschlag.core.models import IconDefinition, PackSettings
+from stromschlag.core.project_io import dump_project
+from stromschlag.core.render_cache import RenderCache
+from stromschlag.core.utils import icon_filename
 
 
 def _make_icon_file(path: Path, color: str) -> None:
@@ -29,6 +36,31 @@ def test_export_copies_source_assets(tmp_path: Path) -> None:
     assert kde_icon.read_bytes() == source.read_bytes()
 
 
+@pytest.fixture
+def umask_022():
+    previous = os.umask(0o022)
+    yield
+    os.umask(previous)
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+def test_exported_theme_files_are_world_readable(tmp_path: Path, umask_022) -> None:
+    settings = PackSettings(name="My Pack", author="Tester", base_sizes=[32], output_dir=tmp_path / "build")
+    source = tmp_path / "folder.png"
+    _make_icon_file(source, "#ff0000")
+
+    result = export_icon_pack(settings, [IconDefinition(name="folder", source_path=source)])
+
+    theme_file = result.pack_root / "kde" / settings.name / "index.theme"
+    assert theme_file.stat().st_mode & 0o777 == 0o644
+    descriptors = [result.pack_root / "stromschlag.yaml", result.pack_root / "kde" / settings.name / "stromschlag.yaml"]
+    assert [path.stat().st_mode & 0o777 for path in descriptors] == [0o644, 0o644]
+    theme_file.chmod(0o640)
+    theme_file.write_text("stale")
+    export_icon_pack(settings, [IconDefinition(name="folder", source_path=source)])
+    assert theme_file.stat().st_mode & 0o777 == 0o640
+
+
 def test_export_skips_icons_without_source(tmp_path: Path) -> None:
     build_dir = tmp_path / "build"
     settings = PackSettings(name="My Pack", author="Tester", base_sizes=[32], output_dir=build_dir)
@@ -91,6 +123,58 @@ def test_export_writes_project_descriptors(tmp_path: Path) -> None:
     assert "category" not in kde_data["icons"][0]
 
 
+def test_theme_descriptors_match_a_direct_dump(tmp_path: Path) -> None:
+    icons = [IconDefinition(name="app", category="apps"), IconDefinition(name="my doc", category="mimetypes")]
+    for icon in icons:
+        icon.source_path = tmp_path / f"{icon.name}.png"
+        _make_icon_file(icon.source_path, icon.name)
+    icons.append(IconDefinition(name="missing"))
+
+    for output_dir in (tmp_path / "build", tmp_path / "Bau ördner"):
+        settings = PackSettings(name="Pack", author="Tester", base_sizes=[32], output_dir=output_dir)
+        result = export_icon_pack(settings, icons)
+        for target in ("kde", "gnome"):
+            theme_root = result.pack_root / target / settings.name
+            scalable = theme_root / "scalable" / "apps"
+            expected = [
+                IconDefinition(name=icon.name, source_path=scalable / icon_filename(icon.name))
+                if icon.source_path
+                else IconDefinition(name=icon.name)
+                for icon in icons
+            ]
+            descriptor = theme_root / "stromschlag.yaml"
+            assert descriptor.read_text() == dump_project(settings, expected, include_categories=False)
+
+        mtime = descriptor.stat().st_mtime_ns
+        export_icon_pack(settings, icons)
+        assert descriptor.stat().st_mtime_ns == mtime
+
+
+def test_theme_descriptors_are_serialized_once_for_names_with_spaces(tmp_path: Path, monkeypatch) -> None:
+    source = tmp_path / "app.png"
+    _make_icon_file(source, "app")
+    icons = [IconDefinition(name="app", source_path=source), IconDefinition(name="missing")]
+    settings = PackSettings(name="Untitled Icon Pack", author="Tester", base_sizes=[32], output_dir=tmp_path / "build")
+    dumps: list = []
+
+    def counting_dump(*args, **kwargs):
+        dumps.append(args)
+        return dump_project(*args, **kwargs)
+
+    monkeypatch.setattr(exporters, "dump_project", counting_dump)
+    monkeypatch.setattr(exporters, "write_project_document", lambda *args, **kwargs: dumps.append(args))
+
+    result = export_icon_pack(settings, icons)
+
+    assert len(dumps) == 2  # the pack root descriptor and the shared theme template
+    for target in ("kde", "gnome"):
+        theme_root = result.pack_root / target / settings.name
+        data = yaml.safe_load((theme_root / "stromschlag.yaml").read_text())
+        assert data["name"] == "Untitled Icon Pack"
+        exported = theme_root / "scalable" / "apps" / "app.png"
+        assert [icon.get("source_path") for icon in data["icons"]] == [str(exported), None]
+
+
 def test_install_icon_pack_copies_targets(tmp_path: Path) -> None:
     build_dir = tmp_path / "build"
     settings = PackSettings(name="Pack", author="Tester", base_sizes=[32], output_dir=build_dir)
@@ -110,3 +194,355 @@ def test_install_icon_pack_copies_targets(tmp_path: Path) -> None:
         assert path.exists()
         icon_file = path / "32x32" / "apps" / "icon.png"
         assert icon_file.exists()
+
+
+def test_export_with_worker_pool_matches_serial(tmp_path: Path) -> None:
+    sources = []
+    for index in range(8):
+        source = tmp_path / f"icon{index}.png"
+        _make_icon_file(source, f"#00000{index}")
+        sources.append(IconDefinition(name=f"icon{index}", source_path=source))
+
+    serial = export_icon_pack(
+        PackSettings(name="Pack", author="Tester", base_sizes=[16, 32], output_dir=tmp_path / "serial"),
+        sources,
+    )
+    parallel = export_icon_pack(
+        PackSettings(name="Pack", author="Tester", base_sizes=[16, 32], output_dir=tmp_path / "parallel"),
+        sources,
+        jobs=4,
+    )
+
+    serial_files = sorted(p.relative_to(serial.pack_root) for p in serial.pack_root.rglob("*.png"))
+    parallel_files = sorted(p.relative_to(parallel.pack_root) for p in parallel.pack_root.rglob("*.png"))
+    assert serial_files == parallel_files
+    assert len(parallel_files) == 8 * 3 * 2
+    for relative in parallel_files:
+        assert (parallel.pack_root / relative).read_bytes() == (serial.pack_root / relative).read_bytes()
+
+
+def test_export_colliding_icon_names_keep_the_last_icon(tmp_path: Path) -> None:
+    icons = []
+    for index, name in enumerate(("Folder Open", "folder-open", "folder_open")):
+        source = tmp_path / f"art{index}.png"
+        _make_icon_file(source, f"art{index}")
+        icons.append(IconDefinition(name=name, source_path=source))
+    assert len({icon_filename(icon.name) for icon in icons}) == 1
+
+    settings = PackSettings(name="Pack", author="Tester", base_sizes=[16, 32], output_dir=tmp_path / "build")
+    events: list = []
+    result = export_icon_pack(settings, icons, jobs=4, progress=events.append)
+
+    outputs = sorted(result.pack_root.rglob("folder-open.png"))
+    assert len(outputs) == 3 * 2
+    assert {path.read_bytes() for path in outputs} == {b"art2"}
+    assert events[0].kind == "planned" and events[0].count == 6
+    assert {event.source for event in events[1:]} == {icons[2].source_path}
+
+
+def test_export_reports_progress_and_timings(tmp_path: Path) -> None:
+    settings = PackSettings(name="Pack", author="Tester", base_sizes=[32], output_dir=tmp_path / "build")
+    icons = []
+    for name in ("alpha", "beta", "gamma"):
+        source = tmp_path / f"{name}.png"
+        _make_icon_file(source, name)
+        icons.append(IconDefinition(name=name, source_path=source))
+
+    events: list = []
+    result = export_icon_pack(settings, icons, jobs=2, progress=events.append)
+    assert [(event.kind, event.count) for event in events] == [("planned", 12)] + [("copied", 4)] * 3
+    assert {event.source for event in events[1:]} == {icon.source_path for icon in icons}
+    timings = result.timings
+    assert min(timings.prepare, timings.copy, timings.descriptors) > 0
+    assert timings.total == pytest.approx(timings.prepare + timings.copy + timings.render + timings.descriptors)
+
+    events.clear()
+    export_icon_pack(settings, icons, incremental=True)
+    export_icon_pack(settings, icons, incremental=True, progress=events.append)
+    assert [(event.kind, event.count) for event in events] == [("planned", 12), ("skipped", 12)]
+
+
+def test_export_can_be_cancelled_between_files(tmp_path: Path) -> None:
+    settings = PackSettings(name="Pack", author="Tester", base_sizes=[32], output_dir=tmp_path / "build")
+    icons = []
+    for name in ("alpha", "beta", "gamma"):
+        source = tmp_path / f"{name}.png"
+        _make_icon_file(source, name)
+        icons.append(IconDefinition(name=name, source_path=source))
+
+    events: list = []
+    with pytest.raises(ExportCancelled):
+        export_icon_pack(
+            settings,
+            icons,
+            progress=events.append,
+            cancelled=lambda: any(event.kind == "copied" for event in events),
+        )
+    assert [event.kind for event in events] == ["planned", "copied"]
+    assert not (settings.output_dir / settings.theme_slug() / "stromschlag.yaml").exists()
+
+
+def test_export_reports_failed_copies(tmp_path: Path, monkeypatch) -> None:
+    settings = PackSettings(name="Pack", author="Tester", base_sizes=[32], output_dir=tmp_path / "build")
+    source = tmp_path / "app.png"
+    _make_icon_file(source, "app")
+
+    def refuse(source, destination):
+        raise PermissionError(f"denied: {destination}")
+
+    monkeypatch.setattr(exporters, "copy2", refuse)
+    events: list = []
+    with pytest.raises(PermissionError):
+        export_icon_pack(settings, [IconDefinition(name="app", source_path=source)], progress=events.append)
+    assert events[-1].kind == "failed"
+    assert events[-1].source == source
+    assert "denied" in events[-1].message
+
+
+def test_export_hardlink_layout_shares_one_copy(tmp_path: Path) -> None:
+    settings = PackSettings(name="Pack", author="Tester", base_sizes=[16, 32], output_dir=tmp_path / "build")
+    source = tmp_path / "app.png"
+    _make_icon_file(source, "#abcdef")
+
+    result = export_icon_pack(settings, [IconDefinition(name="app", source_path=source)], link_mode="hardlink")
+
+    outputs = sorted(result.pack_root.rglob("app.png"))
+    assert len(outputs) == 6
+    assert len({path.stat().st_ino for path in outputs}) == 1
+    assert source.stat().st_ino != outputs[0].stat().st_ino
+
+
+def test_export_symlink_layout_uses_relative_links(tmp_path: Path) -> None:
+    settings = PackSettings(name="Pack", author="Tester", base_sizes=[32], output_dir=tmp_path / "build")
+    source = tmp_path / "app.png"
+    _make_icon_file(source, "#abcdef")
+
+    result = export_icon_pack(settings, [IconDefinition(name="app", source_path=source)], link_mode="symlink")
+
+    links = [path for path in result.pack_root.rglob("app.png") if path.is_symlink()]
+    assert len(links) == 3
+    for link in links:
+        assert not Path(os.readlink(link)).is_absolute()
+        assert link.read_bytes() == source.read_bytes()
+
+
+def test_copy_export_replaces_links_from_earlier_exports(tmp_path: Path) -> None:
+    settings = PackSettings(name="Pack", author="Tester", base_sizes=[16, 32], output_dir=tmp_path / "build")
+    source = tmp_path / "app.png"
+    _make_icon_file(source, "original")
+    icons = [IconDefinition(name="app", source_path=source)]
+
+    for link_mode in ("symlink", "hardlink"):
+        export_icon_pack(settings, icons, link_mode=link_mode)
+        result = export_icon_pack(settings, icons)
+
+        outputs = list(result.pack_root.rglob("app.png"))
+        assert len(outputs) == 6
+        for output in outputs:
+            assert not output.is_symlink()
+            assert output.stat().st_nlink == 1
+            output.write_bytes(b"edited")
+        assert source.read_bytes() == b"original"
+
+
+def test_export_link_layout_falls_back_to_copies(tmp_path: Path, monkeypatch) -> None:
+    settings = PackSettings(name="Pack", author="Tester", base_sizes=[32], output_dir=tmp_path / "build")
+    source = tmp_path / "app.png"
+    _make_icon_file(source, "#abcdef")
+
+    def refuse(*args: object) -> None:
+        raise OSError("cross-device link")
+
+    monkeypatch.setattr(os, "link", refuse)
+    result = export_icon_pack(settings, [IconDefinition(name="app", source_path=source)], link_mode="hardlink")
+
+    outputs = list(result.pack_root.rglob("app.png"))
+    assert len(outputs) == 4
+    assert all(path.read_bytes() == source.read_bytes() for path in outputs)
+
+
+def test_incremental_export_only_touches_changed_icons(tmp_path: Path) -> None:
+    settings = PackSettings(name="Pack", author="Tester", base_sizes=[32], output_dir=tmp_path / "build")
+    icons = []
+    for name in ("alpha", "beta", "gamma"):
+        source = tmp_path / f"{name}.png"
+        _make_icon_file(source, name)
+        icons.append(IconDefinition(name=name, source_path=source))
+
+    first = export_icon_pack(settings, icons, incremental=True)
+    assert (first.copied, first.skipped, first.removed) == (12, 0, 0)
+    descriptor = first.pack_root / "stromschlag.yaml"
+    descriptor_mtime = descriptor.stat().st_mtime_ns
+
+    unchanged = export_icon_pack(settings, icons, incremental=True)
+    assert (unchanged.copied, unchanged.skipped, unchanged.removed) == (0, 12, 0)
+    assert descriptor.stat().st_mtime_ns == descriptor_mtime
+
+    _make_icon_file(icons[0].source_path, "alpha-v2")
+    edited = export_icon_pack(settings, icons[:2], incremental=True)
+    assert (edited.copied, edited.skipped, edited.removed) == (4, 4, 4)
+    kde_dir = edited.pack_root / "kde" / settings.name / "32x32" / "apps"
+    assert (kde_dir / "alpha.png").read_bytes() == b"alpha-v2"
+    assert not (kde_dir / "gamma.png").exists()
+
+
+def test_incremental_export_restores_missing_outputs(tmp_path: Path) -> None:
+    settings = PackSettings(name="Pack", author="Tester", base_sizes=[32], output_dir=tmp_path / "build")
+    icons = []
+    for name in ("alpha", "beta", "gamma"):
+        source = tmp_path / f"{name}.png"
+        _make_icon_file(source, name)
+        icons.append(IconDefinition(name=name, source_path=source))
+
+    full = export_icon_pack(settings, icons)
+    after_full = export_icon_pack(settings, icons, incremental=True)
+    assert (after_full.copied, after_full.skipped) == (0, 12)
+
+    shutil.rmtree(full.pack_root / "kde")
+    restored = export_icon_pack(settings, icons, incremental=True)
+    assert (restored.copied, restored.skipped) == (12, 0)
+    assert (full.pack_root / "kde" / settings.name / "32x32" / "apps" / "beta.png").read_bytes() == b"beta"
+
+    _make_icon_file(icons[1].source_path, "beta-v2")
+    export_icon_pack(settings, icons)
+    after_edit = export_icon_pack(settings, icons, incremental=True)
+    assert (after_edit.copied, after_edit.skipped) == (0, 12)
+
+
+def test_incremental_export_removes_outputs_left_by_a_full_export(tmp_path: Path) -> None:
+    settings = PackSettings(name="Pack", author="Tester", base_sizes=[32], output_dir=tmp_path / "build")
+    icons = []
+    for name in ("alpha", "beta", "gamma"):
+        source = tmp_path / f"{name}.png"
+        _make_icon_file(source, name)
+        icons.append(IconDefinition(name=name, source_path=source))
+    export_icon_pack(settings, icons)
+
+    # A full export without gamma and with beta renamed leaves their old files behind.
+    icons[1].name = "beta-renamed"
+    full = export_icon_pack(settings, icons[:2])
+    apps_dir = full.pack_root / "kde" / settings.name / "32x32" / "apps"
+    assert (apps_dir / "gamma.png").exists() and (apps_dir / "beta.png").exists()
+
+    incremental = export_icon_pack(settings, icons[:2], incremental=True)
+    assert incremental.removed == 8
+    assert sorted(path.name for path in apps_dir.iterdir()) == ["alpha.png", "beta-renamed.png"]
+    assert export_icon_pack(settings, icons[:2], incremental=True).removed == 0
+
+
+def test_export_render_stage_fills_fixed_size_directories(tmp_path: Path, monkeypatch) -> None:
+    rendered: list = []
+
+    def fake_render_many(tasks, workers=1, *, done=None, cancelled=None):
+        for index, (source, size, destination) in enumerate(tasks):
+            rendered.append((Path(source).name, size))
+            Path(destination).write_bytes(f"{size}px".encode("ascii"))
+            done(index)
+
+    monkeypatch.setattr(rasterize, "render_many", fake_render_many)
+    settings = PackSettings(name="Pack", author="Tester", base_sizes=[16, 32], output_dir=tmp_path / "build")
+    bitmap = tmp_path / "app.png"
+    _make_icon_file(bitmap, "bitmap")
+    vector = tmp_path / "logo.svg"
+    vector.write_text("<svg></svg>")
+
+    events: list = []
+    result = export_icon_pack(
+        settings,
+        [IconDefinition(name="app", source_path=bitmap), IconDefinition(name="logo", source_path=vector)],
+        render=True,
+        progress=events.append,
+    )
+
+    assert sorted(rendered) == [("app.png", 16), ("app.png", 32), ("logo.svg", 16), ("logo.svg", 32)]
+    assert events[0].kind == "planned"
+    totals = {kind: sum(event.count for event in events if event.kind == kind) for kind in EXPORT_EVENTS}
+    assert totals == {"planned": 12, "copied": 4, "rendered": 8, "skipped": 0, "failed": 0}
+    assert (result.copied, result.rendered, result.skipped) == (totals["copied"], totals["rendered"], 0)
+    for desktop in ("gnome", "kde"):
+        theme_root = result.pack_root / desktop / settings.name
+        assert (theme_root / "16x16" / "apps" / "logo.png").read_bytes() == b"16px"
+        assert (theme_root / "32x32" / "apps" / "app.png").read_bytes() == b"32px"
+        assert (theme_root / "scalable" / "apps" / "app.png").read_bytes() == b"bitmap"
+
+
+def test_render_cache_reuses_renders_across_packs(tmp_path: Path, monkeypatch) -> None:
+    calls: list = []
+
+    def fake_render_many(tasks, workers=1, *, done=None, cancelled=None):
+        calls.extend(tasks)
+        for _source, size, destination in tasks:
+            Path(destination).write_bytes(f"{size}px".encode("ascii"))
+
+    monkeypatch.setattr(rasterize, "render_many", fake_render_many)
+    source = tmp_path / "app.png"
+    _make_icon_file(source, "bitmap")
+    icons = [IconDefinition(name="app", source_path=source), IconDefinition(name="app-alias", source_path=source)]
+
+    first = export_icon_pack(
+        PackSettings(name="One", author="Tester", base_sizes=[16, 32], output_dir=tmp_path / "one"),
+        icons,
+        render=True,
+    )
+    assert (first.render_cache_hits, first.render_cache_misses) == (0, 2)
+    assert len(calls) == 2
+
+    second = export_icon_pack(
+        PackSettings(name="Two", author="Tester", base_sizes=[16, 32], output_dir=tmp_path / "two"),
+        icons,
+        render=True,
+    )
+    assert (second.render_cache_hits, second.render_cache_misses) == (2, 0)
+    assert len(calls) == 2
+    rendered = second.pack_root / "kde" / "Two" / "16x16" / "apps" / "app-alias.png"
+    assert rendered.read_bytes() == b"16px"
+
+
+def test_render_cache_prunes_least_recently_used(tmp_path: Path) -> None:
+    cache = RenderCache(tmp_path / "cache", max_bytes=10)
+    for index, digest in enumerate(("aaaa", "bbbb", "cccc")):
+        temporary, path = cache.reserve(digest, 16)
+        temporary.write_bytes(b"12345")
+        cache.commit(temporary, path)
+        os.utime(path, ns=(index * 10**9, index * 10**9))
+    assert cache.lookup("aaaa", 16) is not None
+
+    assert cache.prune() == 1
+    assert cache.lookup("bbbb", 16) is None
+    assert cache.lookup("aaaa", 16) is not None
+    assert cache.lookup("cccc", 16) is not None
+
+
+def test_render_cache_prune_walks_only_when_over_budget(tmp_path: Path, monkeypatch) -> None:
+    cache = RenderCache(tmp_path / "cache", max_bytes=10)
+    temporary, path = cache.reserve("aaaa", 16)
+    temporary.write_bytes(b"12345")
+    cache.commit(temporary, path)
+
+    def no_walk(*args, **kwargs):
+        raise AssertionError("the cache was walked while under budget")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(render_cache.os, "walk", no_walk)
+        assert cache.prune() == 0
+
+    writing, _ = cache.reserve("bbbb", 16)
+    writing.write_bytes(b"in progress")
+    abandoned, _ = cache.reserve("cccc", 16)
+    abandoned.write_bytes(b"1234567")
+    os.utime(abandoned, ns=(0, 0))
+    cache.record_usage()
+    (tmp_path / "cache" / "renders" / "usage").write_text("100\n", encoding="ascii")
+
+    assert cache.prune() == 1
+    assert not abandoned.exists()
+    assert writing.exists()
+    assert path.exists()
+    assert cache.lookup("aaaa", 16) is not None
+
+
+def test_render_cache_keys_include_render_parameters(tmp_path: Path, monkeypatch) -> None:
+    before = RenderCache(tmp_path / "cache").path_for("aaaa", 16)
+    monkeypatch.setattr(render_cache, "render_fingerprint", lambda: "other")
+
+    assert RenderCache(tmp_path / "cache").path_for("aaaa", 16) != before
@@ -0,0 +1,45 @@
+"""Tests for the shared artwork status snapshot."""
+import os
+from pathlib import Path
+
+from stromschlag.core import file_status as file_status_module
+from stromschlag.core.exporters import export_icon_pack
+from stromschlag.core.file_status import MISSING, StatSnapshot
+from stromschlag.core.models import IconDefinition, PackSettings
+
+
+def test_snapshot_stats_each_path_once(tmp_path: Path, monkeypatch) -> None:
+    present = tmp_path / "app.png"
+    present.write_bytes(b"icon")
+    calls = []
+    real_stat = file_status_module._stat
+    monkeypatch.setattr(file_status_module, "_stat", lambda path: calls.append(path) or real_stat(path))
+
+    snapshot = StatSnapshot()
+    snapshot.prefetch([present, tmp_path / "gone.png", None, present], workers=4)
+    assert snapshot.exists(present)
+    assert not snapshot.exists(tmp_path / "gone.png")
+    assert not snapshot.exists(None)
+    status = snapshot.stat(str(present))
+    assert (status.size, status.mtime_ns, status.inode) == (4, os.stat(present).st_mtime_ns, os.stat(present).st_ino)
+    assert snapshot.stat(tmp_path / "gone.png") is MISSING
+    assert sorted(calls) == sorted([str(present), str(tmp_path / "gone.png")])
+
+    present.unlink()
+    assert snapshot.exists(present)
+    snapshot.invalidate(present)
+    assert not snapshot.exists(present)
+    assert len(calls) == 3
+
+
+def test_export_shares_its_snapshot(tmp_path: Path) -> None:
+    source = tmp_path / "app.png"
+    source.write_bytes(b"icon")
+    icons = [IconDefinition(name="app", source_path=source), IconDefinition(name="gone", source_path=tmp_path / "x")]
+    assert icons[0].has_source_asset()
+
+    snapshot = StatSnapshot()
+    settings = PackSettings(name="Pack", author="Tester", base_sizes=[32], output_dir=tmp_path / "build")
+    export_icon_pack(settings, icons, incremental=True, file_status=snapshot)
+    assert len(snapshot) == 2
+    assert icons[0].has_source_asset(snapshot) and not icons[1].has_source_asset(snapshot)
@@ -0,0 +1,101 @@
+"""Tests for the GTK icon-theme.cache reader."""
+import os
+import struct
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pytest
+
+from stromschlag.core.gtk_icon_cache import HAS_SUFFIX_PNG, HAS_SUFFIX_SVG, GtkIconCache
+from stromschlag.core.theme_loader import load_icons_from_directory
+
+
+def _write_gtk_cache(path: Path, directories: List[str], icons: Dict[str, List[Tuple[int, int]]]) -> None:
+    buffer = bytearray(12)
+
+    def append(data: bytes) -> int:
+        offset = len(buffer)
+        buffer.extend(data)
+        return offset
+
+    def append_string(value: str) -> int:
+        return append(value.encode("utf-8") + b"\0")
+
+    directory_offsets = [append_string(directory) for directory in directories]
+    directory_list = append(
+        struct.pack(">I", len(directories)) + b"".join(struct.pack(">I", offset) for offset in directory_offsets)
+    )
+    chain = 0xFFFFFFFF
+    for name, images in icons.items():
+        name_offset = append_string(name)
+        image_list = append(
+            struct.pack(">I", len(images))
+            + b"".join(struct.pack(">HHI", index, flags, 0) for index, flags in images)
+        )
+        chain = append(struct.pack(">III", chain, name_offset, image_list))
+    hash_offset = append(struct.pack(">III", 2, chain, 0xFFFFFFFF))
+    struct.pack_into(">HHII", buffer, 0, 1, 0, hash_offset, directory_list)
+    path.write_bytes(bytes(buffer))
+
+
+def _make_cached_theme(theme_root: Path) -> Path:
+    (theme_root / "48x48" / "apps").mkdir(parents=True)
+    (theme_root / "scalable" / "status").mkdir(parents=True)
+    (theme_root / "48x48" / "apps" / "walked.png").write_text("data")
+    cache_path = theme_root / "icon-theme.cache"
+    _write_gtk_cache(
+        cache_path,
+        ["48x48/apps", "scalable/status", "48x48/emblems"],
+        {
+            "firefox": [(0, HAS_SUFFIX_PNG)],
+            "network": [(1, HAS_SUFFIX_SVG), (0, HAS_SUFFIX_PNG)],
+            "emblem": [(2, HAS_SUFFIX_PNG)],
+        },
+    )
+    (theme_root / "48x48" / "emblems").mkdir()
+    future = cache_path.stat().st_mtime_ns + 10_000_000_000
+    os.utime(cache_path, ns=(future, future))
+    return cache_path
+
+
+def test_reader_lists_directories_and_images(tmp_path: Path) -> None:
+    cache_path = _make_cached_theme(tmp_path / "theme")
+
+    with GtkIconCache(cache_path) as cache:
+        assert cache.directories == ["48x48/apps", "scalable/status", "48x48/emblems"]
+        images = sorted(cache.iter_images())
+
+    assert images == [
+        ("emblem", 2, HAS_SUFFIX_PNG),
+        ("firefox", 0, HAS_SUFFIX_PNG),
+        ("network", 0, HAS_SUFFIX_PNG),
+        ("network", 1, HAS_SUFFIX_SVG),
+    ]
+
+
+def test_reader_rejects_unknown_versions(tmp_path: Path) -> None:
+    cache_path = tmp_path / "icon-theme.cache"
+    cache_path.write_bytes(struct.pack(">HHII", 2, 0, 12, 12) + b"\0" * 8)
+
+    with pytest.raises(ValueError):
+        GtkIconCache(cache_path)
+
+
+def test_loader_uses_fresh_cache(tmp_path: Path) -> None:
+    theme_root = tmp_path / "theme"
+    _make_cached_theme(theme_root)
+
+    icons = load_icons_from_directory(theme_root)
+
+    assert [(icon.name, icon.category) for icon in icons] == [("firefox", "apps"), ("network", "apps")]
+    assert icons[1].source_path == theme_root / "48x48" / "apps" / "network.png"
+
+
+def test_loader_falls_back_when_cache_is_stale(tmp_path: Path) -> None:
+    theme_root = tmp_path / "theme"
+    cache_path = _make_cached_theme(theme_root)
+    os.utime(cache_path, ns=(0, 0))
+
+    icons = load_icons_from_directory(theme_root)
+
+    assert [icon.name for icon in icons] == ["walked"]
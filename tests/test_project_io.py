@@ -1,6 +1,9 @@
 """Tests for project I/O helpers."""
+import os
 from pathlib import Path
 
+import pytest
+
 from stromschlag.core.models import IconDefinition, PackSettings
 from stromschlag.core.project_io import load_project, save_project
 
@@ -42,3 +45,171 @@ def test_save_and_load_round_trip(tmp_path: Path) -> None:
     assert loaded_icons[0].source_path == source_file
     assert loaded_icons[0].category == "apps"
     assert loaded_icons[1].category == "actions"
+
+
+def test_pure_python_yaml_fallback_round_trips(tmp_path: Path, monkeypatch) -> None:
+    import yaml
+
+    from stromschlag.core import project_io
+
+    settings = PackSettings(name="Pack: \"quoted\"", author="Zoë", description="multi\nline")
+    icons = [
+        IconDefinition(name=f"icon-{index}", source_path=tmp_path / f"ä {index}.svg", category="apps")
+        for index in range(50)
+    ]
+    native = project_io.dump_project(settings, icons)
+
+    monkeypatch.setattr(project_io, "_SafeLoader", yaml.SafeLoader)
+    monkeypatch.setattr(project_io, "_SafeDumper", yaml.SafeDumper)
+    fallback = project_io.dump_project(settings, icons)
+    # The emitters may fold long quoted scalars differently; the documents must agree.
+    assert yaml.safe_load(fallback) == yaml.safe_load(native)
+
+    path = tmp_path / "project.yaml"
+    path.write_text(fallback)
+    loaded_settings, loaded_icons = load_project(path)
+    assert loaded_settings.name == settings.name
+    assert loaded_settings.author == "Zoë"
+    assert loaded_settings.description == "multi\nline"
+    assert [icon.source_path for icon in loaded_icons] == [icon.source_path for icon in icons]
+
+
+def test_large_projects_load_from_binary_sidecar(tmp_path: Path, monkeypatch) -> None:
+    from stromschlag.core import project_binary, project_io
+
+    monkeypatch.setattr(project_io, "BINARY_THRESHOLD", 2)
+    path = tmp_path / "stromschlag.yaml"
+    settings = PackSettings(name="Big Pack", author="Tester", inherits=None, base_sizes=[16, 32], targets=["kde"])
+    icons = [
+        IconDefinition(name="folder", source_path=tmp_path / "ä folder.svg", category="places"),
+        IconDefinition(name="gear", category="apps"),
+        IconDefinition(name="trash", source_path=tmp_path / "trash.png"),
+    ]
+    save_project(path, settings, icons)
+    sidecar = project_binary.sidecar_path(path)
+    assert sidecar.exists()
+
+    from_sidecar = load_project(path)
+    sidecar.unlink()
+    from_yaml = load_project(path)
+    assert from_sidecar == from_yaml
+    assert from_yaml[1] == icons
+    assert not sidecar.exists()
+    load_project(path, refresh_sidecar=True)
+    assert sidecar.exists()
+
+    # Editing the YAML file makes the sidecar stale; a corrupt sidecar is ignored.
+    path.write_text(path.read_text().replace("Big Pack", "Edited Pack"))
+    assert load_project(path)[0].name == "Edited Pack"
+    sidecar.write_bytes(b"STRMPRJ\0garbage")
+    assert load_project(path)[0].name == "Edited Pack"
+
+    save_project(path, settings, icons[:1])
+    assert not sidecar.exists()
+
+
+def test_opening_a_project_leaves_its_directory_untouched(tmp_path: Path, monkeypatch) -> None:
+    from stromschlag.core import project_binary, project_io
+    from stromschlag.core.project_io import open_project_stream
+
+    path = tmp_path / "stromschlag.yaml"
+    icons = [IconDefinition(name=f"icon-{index}") for index in range(3)]
+    save_project(path, PackSettings(name="Pack", author="Tester"), icons)
+    monkeypatch.setattr(project_io, "BINARY_THRESHOLD", 2)
+
+    load_project(path)
+    with open_project_stream(path) as stream:
+        assert [icon for batch in stream for icon in batch] == icons
+    assert sorted(tmp_path.iterdir()) == [path]
+
+    with open_project_stream(path, refresh_sidecar=True) as stream:
+        list(stream)
+    assert project_binary.sidecar_path(path).exists()
+
+
+def test_save_project_replaces_the_file_atomically(tmp_path: Path, monkeypatch) -> None:
+    from stromschlag.core import utils
+
+    path = tmp_path / "stromschlag.yaml"
+    previous_umask = os.umask(0o022)
+    try:
+        save_project(path, PackSettings(name="Before", author="Tester"), [])
+    finally:
+        os.umask(previous_umask)
+    if os.name == "posix":
+        assert path.stat().st_mode & 0o777 == 0o644
+
+    def interrupted(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(utils.os, "replace", interrupted)
+    with pytest.raises(OSError):
+        save_project(path, PackSettings(name="After", author="Tester"), [])
+    assert load_project(path)[0].name == "Before"
+    assert sorted(tmp_path.iterdir()) == [path]
+
+
+def test_project_stream_yields_batches_and_trailing_settings(tmp_path: Path) -> None:
+    from stromschlag.core.project_io import open_project_stream
+
+    path = tmp_path / "stromschlag.yaml"
+    icons = [IconDefinition(name=f"icon-{index}", category="apps") for index in range(5)]
+    save_project(path, PackSettings(name="Streamed", author="Tester"), icons)
+    with open_project_stream(path, batch_size=2) as stream:
+        assert stream.settings.name == "Streamed"
+        batches = list(stream)
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [icon for batch in batches for icon in batch] == load_project(path)[1]
+
+    path.write_text(
+        "name: Early\n"
+        "icons:\n"
+        "  - &base {name: a, category: apps}\n"
+        "  - {<<: *base, name: b}\n"
+        "  - {}\n"
+        "author: Late\n"
+    )
+    stream = open_project_stream(path)
+    assert stream.settings.author == "Unknown"
+    streamed = [icon for batch in stream for icon in batch]
+    assert stream.settings.author == "Late"
+    assert (stream.settings, streamed) == load_project(path)
+    assert [icon.name for icon in streamed] == ["a", "b", "Icon 3"]
+
+
+def test_project_stream_reads_projects_without_icons(tmp_path: Path) -> None:
+    from stromschlag.core.project_io import open_project_stream
+
+    path = tmp_path / "stromschlag.yaml"
+    path.write_text("name: X\nauthor: Y\n")
+    with open_project_stream(path) as stream:
+        streamed = [icon for batch in stream for icon in batch]
+        assert (stream.settings, streamed) == load_project(path)
+    assert stream.settings.author == "Y"
+    assert streamed == []
+
+
+def test_exported_packs_reopen_from_their_sidecar(tmp_path: Path, monkeypatch) -> None:
+    from stromschlag.core import project_binary, project_io
+    from stromschlag.core.exporters import export_icon_pack
+
+    monkeypatch.setattr(project_io, "BINARY_THRESHOLD", 2)
+    source = tmp_path / "folder.png"
+    source.write_bytes(b"png")
+    settings = PackSettings(name="Big Pack", author="Tester", base_sizes=[32], output_dir=tmp_path / "out")
+    icons = [
+        IconDefinition(name="folder", source_path=source, category="places"),
+        IconDefinition(name="gear", category="apps"),
+        IconDefinition(name="trash", source_path=tmp_path / "missing.png"),
+    ]
+    descriptor = export_icon_pack(settings, icons).pack_root / "stromschlag.yaml"
+    assert project_binary.sidecar_path(descriptor).exists()
+
+    with monkeypatch.context() as patch:
+        patch.setattr(project_io, "_SafeLoader", None)  # parsing the YAML would fail
+        from_sidecar = load_project(descriptor)
+        with project_io.open_project_stream(descriptor) as stream:
+            assert [icon for batch in stream for icon in batch] == from_sidecar[1]
+    project_binary.remove_sidecar(descriptor)
+    assert load_project(descriptor) == from_sidecar
+
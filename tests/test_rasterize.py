@@ -0,0 +1,42 @@
+"""Tests for offscreen icon rasterization."""
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("PySide6.QtSvg")
+
+from stromschlag.core.rasterize import render_icon, render_many  # noqa: E402
+
+
+def test_render_svg_at_requested_size(tmp_path: Path) -> None:
+    source = tmp_path / "logo.svg"
+    source.write_text(
+        '<svg xmlns="http://www.w3.org/2000/svg" width="100" height="50">'
+        '<rect width="100" height="50" fill="#ff0000"/></svg>'
+    )
+    destination = tmp_path / "logo-24.png"
+
+    render_icon(str(source), 24, str(destination))
+
+    from PySide6.QtGui import QImage
+
+    image = QImage(str(destination))
+    assert (image.width(), image.height()) == (24, 24)
+    assert image.pixelColor(12, 12).red() == 255
+    assert image.pixelColor(12, 0).alpha() == 0
+
+
+def test_render_many_downscales_bitmaps(tmp_path: Path) -> None:
+    from PySide6.QtGui import QColor, QImage
+
+    source = tmp_path / "app.png"
+    original = QImage(256, 256, QImage.Format.Format_ARGB32)
+    original.fill(QColor("#00ff00"))
+    assert original.save(str(source))
+
+    tasks = [(str(source), size, str(tmp_path / f"app-{size}.png")) for size in (16, 32)]
+    render_many(tasks, workers=2)
+
+    for size in (16, 32):
+        image = QImage(str(tmp_path / f"app-{size}.png"))
+        assert (image.width(), image.height()) == (size, size)
@@ -0,0 +1,90 @@
+"""Tests for the icon search."""
+from pathlib import Path
+
+from stromschlag.core.models import IconDefinition
+from stromschlag.core.search import FuzzyMatcher
+
+
+def test_empty_query_matches_everything() -> None:
+    matcher = FuzzyMatcher([("a", "", ""), ("b", "", "")])
+
+    assert matcher.search("") is None
+    assert matcher.search("   ") is None
+
+
+def test_fuzzy_matcher_matches_subsequences_only() -> None:
+    matcher = FuzzyMatcher([("firefox", "apps", ""), ("folder", "places", ""), ("network", "status", "")])
+
+    assert {row for row, _ in matcher.search("ffx")} == {0}
+    assert {row for row, _ in matcher.search("fr")} == {0, 1}
+    assert matcher.search("xf") == []
+    assert matcher.search(" ") is None
+
+
+def test_fuzzy_matcher_prefers_prefix_and_word_boundaries() -> None:
+    matcher = FuzzyMatcher(
+        [
+            ("preferences-system-network", "apps", ""),
+            ("network-wireless", "status", ""),
+            ("NetworkManager", "apps", ""),
+        ]
+    )
+
+    ranked = [row for row, _ in matcher.search("nw")]
+    assert ranked[0] == 1  # prefix "n" plus "w" right after a separator
+    assert [row for row, _ in matcher.search("nm")][0] == 2  # camelCase hump
+
+
+def test_fuzzy_matcher_ranks_exact_and_shorter_names_first() -> None:
+    matcher = FuzzyMatcher([("firefox-developer-edition", "", ""), ("firefox", "", ""), ("firefox-esr", "", "")])
+
+    assert [row for row, _ in matcher.search("firefox")] == [1, 2, 0]
+
+
+def test_fuzzy_matcher_searches_category_and_source_stem() -> None:
+    icons = [
+        IconDefinition(name="browser", category="apps", source_path=Path("/art/firefox-128.svg")),
+        IconDefinition(name="trash", category="places"),
+    ]
+    matcher = FuzzyMatcher.for_icons(icons)
+
+    assert [row for row, _ in matcher.search("firefox")] == [0]
+    assert [row for row, _ in matcher.search("places")] == [1]
+
+
+def test_fuzzy_matcher_narrowing_matches_fresh_search() -> None:
+    entries = [(f"icon-{value}", "apps" if value % 2 else "status", f"src{value}") for value in range(300)]
+    narrowed = FuzzyMatcher(entries)
+    for query in ("i", "i1"):
+        narrowed.search(query)
+
+    assert narrowed.search("i12") == FuzzyMatcher(entries).search("i12")
+    assert narrowed.search("s2") == FuzzyMatcher(entries).search("s2")
+
+
+def test_fuzzy_matcher_incremental_edits_match_a_rebuild() -> None:
+    entries = [(f"icon-{value}", "apps", f"src{value}") for value in range(50)]
+    matcher = FuzzyMatcher(entries)
+    matcher.search("i")
+
+    matcher.update(3, ("NetworkManager", "apps", "nm"))
+    entries[3] = ("NetworkManager", "apps", "nm")
+    matcher.remove(10)
+    del entries[10]
+    matcher.extend([("network-wired", "devices", ""), ("icon-new", "apps", "")])
+    entries += [("network-wired", "devices", ""), ("icon-new", "apps", "")]
+
+    fresh = FuzzyMatcher(entries)
+    assert len(matcher) == len(entries)
+    for query in ("i", "ic", "icon-1", "n", "nw", "nm", "new"):
+        assert matcher.search(query) == fresh.search(query)
+
+
+def test_fuzzy_matcher_narrowing_sees_edited_rows() -> None:
+    matcher = FuzzyMatcher([("folder", "places", ""), ("trash", "places", "")])
+    assert [row for row, _ in matcher.search("f")] == [0]
+
+    matcher.update(1, ("files", "places", ""))
+    matcher.extend([("firefox", "apps", "")])
+
+    assert {row for row, _ in matcher.search("fi")} == {1, 2}
@@ -0,0 +1,73 @@
+"""Tests for importing icon artwork from arbitrary folders."""
+import os
+from pathlib import Path
+
+from stromschlag.core.source_scanner import find_project_descriptor, scan_icon_sources, top_level_descriptor
+
+
+def _touch(path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"icon")
+    return path
+
+
+def test_scan_prefers_vectors_scalable_and_app_folders(tmp_path: Path) -> None:
+    _touch(tmp_path / "48x48" / "apps" / "firefox.png")
+    svg = _touch(tmp_path / "48x48" / "apps" / "firefox.svg")
+    _touch(tmp_path / "48x48" / "places" / "folder.png")
+    scalable = _touch(tmp_path / "scalable" / "places" / "folder.png")
+    _touch(tmp_path / "b" / "apps" / "tie.svg")
+    first = _touch(tmp_path / "a" / "apps" / "tie.svg")
+    top_level = _touch(tmp_path / "Loose.PNG")
+    _touch(tmp_path / "notes" / "readme.txt")
+
+    expected = [
+        ("Loose", top_level, None),
+        ("firefox", svg, "apps"),
+        ("folder", scalable, "places"),
+        ("tie", first, "apps"),
+    ]
+    assert scan_icon_sources(tmp_path) == expected
+    assert scan_icon_sources(tmp_path, workers=1) == expected
+
+
+def test_scan_weighs_the_folder_itself_and_skips_linked_folders(tmp_path: Path) -> None:
+    root = tmp_path / "scalable"
+    inside = _touch(root / "16x16" / "mail.png")
+    _touch(tmp_path / "elsewhere" / "scalable" / "apps" / "mail.svg")
+    os.symlink(tmp_path / "elsewhere", root / "linked")
+
+    assert scan_icon_sources(root) == [("mail", inside, "16x16")]
+
+
+def test_scan_can_be_cancelled(tmp_path: Path) -> None:
+    _touch(tmp_path / "apps" / "one.svg")
+    _touch(tmp_path / "places" / "two.svg")
+
+    assert scan_icon_sources(tmp_path, cancelled=lambda: True) == []
+
+
+def test_find_descriptor_is_breadth_first_and_skips_asset_folders(tmp_path: Path) -> None:
+    _touch(tmp_path / "scalable" / "stromschlag.yaml")
+    _touch(tmp_path / "48x48" / "stromschlag.yaml")
+    _touch(tmp_path / ".cache" / "stromschlag.yaml")
+    _touch(tmp_path / "a" / "deep" / "stromschlag.yaml")
+    shallow = _touch(tmp_path / "b" / "stromschlag.yaml")
+
+    assert find_project_descriptor(tmp_path) == shallow
+    shallow.unlink()
+    assert find_project_descriptor(tmp_path) == tmp_path / "a" / "deep" / "stromschlag.yaml"
+    assert find_project_descriptor(tmp_path, max_depth=1) is None
+    assert find_project_descriptor(tmp_path, cancelled=lambda: True) is None
+
+    top = _touch(tmp_path / "Stromschlag.yaml")
+    assert find_project_descriptor(tmp_path) == top
+
+
+def test_top_level_descriptor_wins_over_nested_ones(tmp_path: Path) -> None:
+    _touch(tmp_path / "project" / "stromschlag.yaml")
+    assert top_level_descriptor(tmp_path) is None
+
+    top = _touch(tmp_path / "stromschlag.yaml")
+    assert top_level_descriptor(tmp_path) == top
+    assert find_project_descriptor(tmp_path) == top
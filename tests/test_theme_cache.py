@@ -0,0 +1,54 @@
+"""Tests for the persistent theme index."""
+import os
+from pathlib import Path
+
+from stromschlag.core.theme_cache import ThemeIndexCache
+from stromschlag.core.theme_loader import load_icons_from_directory
+
+
+def _make_theme(root: Path) -> None:
+    (root / "48x48" / "apps").mkdir(parents=True)
+    (root / "48x48" / "apps" / "folder.png").write_text("data")
+    (root / "scalable" / "status").mkdir(parents=True)
+    (root / "scalable" / "status" / "network.svg").write_text("<svg></svg>")
+
+
+def test_index_is_written_and_reused(tmp_path: Path) -> None:
+    theme_root = tmp_path / "theme"
+    _make_theme(theme_root)
+
+    first = load_icons_from_directory(theme_root)
+    cached = ThemeIndexCache().load(theme_root)
+
+    assert cached is not None
+    assert [(name, category) for name, _, category in cached] == [
+        (icon.name, icon.category) for icon in first
+    ]
+    assert cached[0][1] == theme_root / "48x48" / "apps" / "folder.png"
+
+
+def test_index_invalidated_when_directory_changes(tmp_path: Path) -> None:
+    theme_root = tmp_path / "theme"
+    _make_theme(theme_root)
+    load_icons_from_directory(theme_root)
+
+    apps_dir = theme_root / "48x48" / "apps"
+    (apps_dir / "editor.png").write_text("data")
+    stat = apps_dir.stat()
+    os.utime(apps_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert ThemeIndexCache().load(theme_root) is None
+    names = {icon.name for icon in load_icons_from_directory(theme_root)}
+    assert "editor" in names
+
+
+def test_index_respects_limit_on_warm_start(tmp_path: Path) -> None:
+    theme_root = tmp_path / "theme"
+    (theme_root / "apps").mkdir(parents=True)
+    for index in range(6):
+        (theme_root / "apps" / f"app{index}.png").write_text("data")
+
+    load_icons_from_directory(theme_root)
+    icons = load_icons_from_directory(theme_root, limit=3)
+
+    assert [icon.name for icon in icons] == ["app0", "app1", "app2"]
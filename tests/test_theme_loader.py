@@ -4,9 +4,11 @@ from pathlib import Path
 from stromschlag.core.theme_loader import (
     BlueprintLoadResult,
     ThemeCandidate,
+    iter_icon_batches,
     load_icon_blueprint,
     load_icons_from_directory,
     list_installed_themes,
+    suggest_base_theme,
 )
 
 
@@ -70,4 +72,71 @@ def test_list_installed_themes(tmp_path: Path) -> None:
 
     assert themes
     assert isinstance(themes[0], ThemeCandidate)
-    assert themes[0].name == "sample"
\ No newline at end of file
+    assert themes[0].name == "sample"
+
+
+def test_load_icons_prefers_earlier_categories(tmp_path: Path) -> None:
+    theme_root = tmp_path / "custom"
+    (theme_root / "48x48" / "status").mkdir(parents=True)
+    (theme_root / "48x48" / "status" / "folder.png").write_text("data")
+    (theme_root / "48x48" / "apps").mkdir(parents=True)
+    (theme_root / "48x48" / "apps" / "folder.png").write_text("data")
+    (theme_root / "48x48" / "apps" / "notes.txt").write_text("data")
+    (theme_root / "48x48" / "misc").mkdir(parents=True)
+    (theme_root / "48x48" / "misc" / "stray.png").write_text("data")
+
+    icons = load_icons_from_directory(theme_root)
+
+    assert [(icon.name, icon.category) for icon in icons] == [("folder", "apps")]
+    assert icons[0].source_path == theme_root / "48x48" / "apps" / "folder.png"
+
+
+def test_iter_icon_batches_streams_and_cancels(tmp_path: Path) -> None:
+    theme_root = tmp_path / "custom"
+    (theme_root / "apps").mkdir(parents=True)
+    for index in range(5):
+        (theme_root / "apps" / f"app{index}.png").write_text("data")
+
+    batches = list(iter_icon_batches(theme_root, batch_size=2))
+    assert [len(batch.icons) for batch in batches if not batch.replace] == [2, 2, 1]
+    # Files come out in directory order during the walk; the ranked order follows.
+    assert all(batch.replace for batch in batches[3:])
+    cached = list(iter_icon_batches(theme_root, batch_size=2))
+    assert [icon.name for batch in cached for icon in batch.icons] == [f"app{index}" for index in range(5)]
+
+    other_root = tmp_path / "other"
+    (other_root / "apps").mkdir(parents=True)
+    (other_root / "apps" / "app.png").write_text("data")
+    assert list(iter_icon_batches(other_root, cancelled=lambda: True)) == []
+    assert [icon.name for batch in iter_icon_batches(other_root) for icon in batch.icons] == ["app"]
+
+
+def test_iter_icon_batches_yields_during_the_walk_and_settles_ranking(tmp_path: Path) -> None:
+    theme_root = tmp_path / "custom"
+    for folder in ("places", "devices", "status", "apps"):
+        for size in ("16x16", "32x32", "48x48"):
+            directory = theme_root / size / folder
+            directory.mkdir(parents=True)
+            for name in ("shared", f"{folder}-only"):
+                (directory / f"{name}.png").write_text("data")
+    expected = load_icons_from_directory(theme_root, limit=None)
+    (tmp_path / "xdg-cache").rename(tmp_path / "old-cache")  # force a fresh walk
+
+    polls: list = []
+    batches = iter_icon_batches(theme_root, batch_size=1, cancelled=lambda: polls.append(1) and False)
+    first = next(batches)
+    assert len(first.icons) == 1 and not first.replace
+    walked = len(polls)
+    icons = list(first.icons)
+    for batch in batches:
+        icons = list(batch.icons) if batch.replace else icons + batch.icons
+    assert walked < len(polls)
+    assert icons == expected
+    assert [(icon.name, icon.category) for icon in icons][:2] == [("apps-only", "apps"), ("shared", "apps")]
+
+
+def test_suggest_base_theme(tmp_path: Path) -> None:
+    (tmp_path / "adwaita").mkdir()
+
+    assert suggest_base_theme(extra_search_paths=[tmp_path]) == "adwaita"
+    assert suggest_base_theme(["missing"], extra_search_paths=[tmp_path]) is None